@@ -11,35 +11,254 @@ import sys
 import time
 import logging
 import threading
+import signal
 import schedule
 import json
 import re
+from collections import Counter, deque
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from functools import lru_cache, wraps
+from typing import Optional, Dict, List, Any, Tuple
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 # Add plugins directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'plugins'))
 
 import telebot
-from telebot import types
+from telebot import types, apihelper
+from telebot.apihelper import ApiTelegramException
 from pymongo import MongoClient
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import configuration
 from config import *
 from protected_branding import protected_branding
 
 # Import plugins
-from plugins.database import DatabaseConnection, DatabaseOperations
-from plugins.utils import LinkHandler, MessageFormatter, Validators, Helpers, setup_logger, ChannelDetector
-from plugins.broadcast import BroadcastManager
+from plugins.database import DatabaseConnection, DatabaseOperations, BroadcastModel, generate_broadcast_id
+from plugins.utils import (
+    LinkHandler, MessageFormatter, Validators, Helpers, setup_logger, stop_log_listeners,
+    ChannelDetector, TaskManager, TTLCache, bounded_as_completed, telegram_rate_limiter,
+    html_escape
+)
+from plugins.broadcast import BroadcastManager, BroadcastScheduler
 
 # Configure logging
 logger = setup_logger("MainBot", LOG_LEVEL, LOG_FILE)
 
+# Custom time input patterns, e.g. "1d 2h 30m"
+_DAYS_RE = re.compile(r'(\d+)\s*(?:d|day|days)')
+_HOURS_RE = re.compile(r'(\d+)\s*(?:h|hour|hours)')
+_MINUTES_RE = re.compile(r'(\d+)\s*(?:m|min|minute|minutes)')
+
+# Bare channel id such as -1001234567890
+_CHANNEL_ID_RE = re.compile(r'-\d+')
+
+# Broadcast status messages, formatted with str.format on each update.
+# Progress is plain text: it is redrawn many times and carries raw channel names.
+_PROGRESS_TEMPLATE = """
+🚀 Broadcasting in Progress...
+━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📊 Progress: {completed}/{total_channels} channels
+⏱️ Status: Sent to {channel_name}...
+
+📱 Target Channels: {total_channels}
+✅ Successful: {successful_sends}
+❌ Failed: {failed_sends}
+📺 Last: {channel_name}
+
+💡 Please wait... Broadcasting in progress!
+""".strip()
+
+_BROADCAST_RESULT_TEMPLATE = """
+✅ <b>Broadcast Completed!</b>
+<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
+
+<blockquote>
+🎯 <b>Final Results</b>
+</blockquote>
+
+<b>📊 Statistics:</b>
+┣ 📱 <b>Total Channels:</b> {total_channels}
+┣ ✅ <b>Successful:</b> {successful_sends}
+┣ ❌ <b>Failed:</b> {failed_sends}
+┗ 📈 <b>Success Rate:</b> {success_rate}%
+
+🎉 <b>Broadcast completed successfully!</b>
+
+💡 <b>Tip:</b> Check analytics for detailed insights!
+""".strip()
+
+_BROADCAST_ERROR_TEMPLATE = """
+❌ <b>Broadcast Error!</b>
+<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
+
+<blockquote>
+⚠️ <b>Broadcast Failed</b>
+An error occurred during broadcasting.
+</blockquote>
+
+<b>📊 Partial Results:</b>
+┣ ✅ <b>Successful:</b> {successful_sends}
+┣ ❌ <b>Failed:</b> {failed_sends}
+┗ 📱 <b>Total:</b> {total_channels}
+
+🔧 <b>Please try again or contact support.</b>
+""".strip()
+
+_REPOST_DONE_TEMPLATE = (
+    "🔄 <b>Auto Repost Completed</b>\n\n"
+    "<blockquote>Reposted to {reposted_count} channels successfully!</blockquote>\n"
+    "<b>Next repost:</b> {interval_minutes} minutes"
+)
+
+# Admin panels; only the numbers change between views
+_ADMIN_USERS_TEMPLATE = """
+👥 <b>User Management</b>
+<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
+
+<blockquote>
+📊 <b>User Statistics</b>
+</blockquote>
+
+<b>📈 User Metrics:</b>
+┣ 👥 <b>Total Users:</b> {total_users}
+┣ ✅ <b>Active Users:</b> {active_users}
+┣ ❌ <b>Inactive Users:</b> {inactive_users}
+┗ 📊 <b>Activity Rate:</b> {activity_rate}%
+
+<b>🕐 Recent Users (Last 5):</b>
+""".strip()
+
+_ADMIN_RECENT_USER_LINE = "\n{index}. <b>{first_name}</b> (@{username}) - ID: <code>{user_id}</code>"
+
+_DETAILED_STATS_TEMPLATE = """
+📊 <b>Detailed System Statistics</b>
+<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
+
+<blockquote>
+📈 <b>Comprehensive Analytics</b>
+</blockquote>
+
+<b>👥 User Statistics:</b>
+┣ 📊 <b>Total Users:</b> {total_users}
+┣ 🆕 <b>New Today:</b> {new_users_today}
+┣ 🔄 <b>Active Users:</b> {active_users}
+┗ 📈 <b>Growth Rate:</b> {growth_rate}%
+
+<b>📺 Channel Statistics:</b>
+┣ 📊 <b>Total Channels:</b> {total_channels}
+┣ ✅ <b>Active Channels:</b> {active_channels}
+┣ 🔗 <b>Connected Channels:</b> {connected_channels}
+┗ 📈 <b>Channel Growth:</b> {channel_growth}%
+
+<b>📡 Broadcast Statistics:</b>
+┣ 📊 <b>Total Broadcasts:</b> {total_broadcasts}
+┣ ✅ <b>Successful:</b> {successful_broadcasts}
+┣ ❌ <b>Failed:</b> {failed_broadcasts}
+┗ 📈 <b>Success Rate:</b> {success_rate}%
+
+<b>📊 Database Statistics:</b>
+┣ 📄 <b>Analytics Entries:</b> {analytics_entries}
+┣ 💾 <b>DB Size:</b> {db_size}
+┗ 🕐 <b>Last Updated:</b> {last_updated}
+""".strip()
+
+# Keyboards that never change, as rows of (label, callback_data) pairs
+_BROADCAST_CONFIG_ROWS = (
+    (("🔄 Set Auto Repost", "set_repost_time"), ("🗑️ Set Auto Delete", "set_delete_time")),
+    (("📤 Send Now", "send_now"), ("⚙️ Advanced", "advanced_settings")),
+    (("❌ Cancel", "cancel_broadcast"),),
+)
+
+_REPOST_TIME_ROWS = (
+    (("⚡ 5 Min", "repost_5min"), ("🕐 30 Min", "repost_30min")),
+    (("🕐 1 Hour", "repost_1hour"), ("🕐 3 Hours", "repost_3hour")),
+    (("🕐 6 Hours", "repost_6hour"), ("🕐 12 Hours", "repost_12hour")),
+    (("🕐 24 Hours", "repost_24hour"), ("❌ Disable", "repost_disable")),
+    (("⏰ Custom Time", "repost_custom"), ("🔙 Back", "broadcast_config_back")),
+)
+
+_DELETE_TIME_ROWS = (
+    (("⚡ Instant", "delete_instant"), ("🕐 2 Min", "delete_2min")),
+    (("🕐 3 Min", "delete_3min"), ("🕐 10 Min", "delete_10min")),
+    (("🕐 20 Min", "delete_20min"), ("🕐 1 Hour", "delete_1hour")),
+    (("♾️ Never", "delete_never"), ("⏰ Custom Time", "delete_custom")),
+    (("🔙 Back", "broadcast_config_back"),),
+)
+
+# Preset buttons: callback suffix -> (label shown to the user, minutes)
+_REPOST_PRESETS = {
+    "5min": ("5 Minutes", 5),
+    "30min": ("30 Minutes", 30),
+    "1hour": ("1 Hour", 60),
+    "3hour": ("3 Hours", 180),
+    "6hour": ("6 Hours", 360),
+    "12hour": ("12 Hours", 720),
+    "24hour": ("24 Hours", 1440),
+    "disable": ("Disabled", 0),
+}
+
+_DELETE_PRESETS = {
+    "instant": ("Instant", 0),
+    "2min": ("2 Minutes", 2),
+    "3min": ("3 Minutes", 3),
+    "10min": ("10 Minutes", 10),
+    "20min": ("20 Minutes", 20),
+    "1hour": ("1 Hour", 60),
+    "never": ("Never", -1),  # Special value for never delete
+}
+
+@lru_cache(maxsize=None)
+def _static_keyboard(rows: tuple) -> types.InlineKeyboardMarkup:
+    """Build a keyboard once and share it; markups are only read when a message is sent"""
+    markup = types.InlineKeyboardMarkup(row_width=2)
+    for row in rows:
+        markup.add(*(types.InlineKeyboardButton(label, callback_data=data) for label, data in row))
+    return markup
+
+# Welcome message: only the greeting varies per user, the rest is built once at import
+_WELCOME_HEADER_TEMPLATE = """
+🔥 <b>Welcome to Advanced Broadcast Bot!</b>
+<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
+
+👋 <b>Hello {user_name}!</b>
+📊 <b>Your Channels:</b> {channel_count} connected
+""".lstrip()
+
+_WELCOME_STATIC_TAIL = f"""
+<blockquote>
+🎉 <b>ALL FEATURES ARE FREE!</b>
+No premium required - everything unlocked!
+</blockquote>
+
+{protected_branding.get_welcome_branding()}
+
+🚀 <b>What You Can Do:</b>
+┣ 📢 <b>Multi-Channel Broadcasting</b> - Send to unlimited channels
+┣ ⚡ <b>Auto Repost & Delete</b> - Smart automation
+┣ 📊 <b>Advanced Analytics</b> - Detailed insights  
+┣ 🔗 <b>Auto Link Detection</b> - Smart channel adding
+┣ ⏰ <b>Scheduled Posts</b> - Future broadcasting
+┣ 🎨 <b>Rich Media Support</b> - Photos, videos, docs
+┗ 📈 <b>Real-time Tracking</b> - Live progress
+
+<b>🎯 Quick Start Guide:</b>
+<code>1. Click "➕ Add Channels" below</code>
+<code>2. Send your channel links</code>
+<code>3. Create your message</code>
+<code>4. Hit "📢 Broadcast" and go!</code>
+
+💡 <b>Pro Tip:</b> Just send me a message with channel links - I'll auto-detect and add them!
+
+{protected_branding.get_footer_branding()}
+""".rstrip()
+
 class AdvancedBroadcastBot:
     """Enhanced Telegram Broadcast Bot with Plugin Architecture"""
     
@@ -48,19 +267,39 @@ class AdvancedBroadcastBot:
         self.db_connection = None
         self.db_ops = None
         self.broadcast_manager = None
+        self.broadcast_scheduler = None
         self.link_handler = None
         self.message_formatter = None
         self.validators = Validators()
         self.helpers = Helpers()
+        self.task_manager = TaskManager()
+        self.polling_stop_event = threading.Event()
+        self.restart_requested = False  # main() re-executes the process after a clean stop
+        
+        # One long-lived pool for channel sends instead of a new pool per broadcast
+        self.send_executor = ThreadPoolExecutor(max_workers=BROADCAST_WORKERS, thread_name_prefix="bcast")
         
-        # Bot state management
-        self.broadcast_states = {}
+        # Bot state management; per-user conversation state is bounded and expires
+        self.broadcast_states = TTLCache(maxsize=USER_STATE_MAX_ENTRIES, ttl=USER_STATE_TTL)
         self.active_broadcasts = {}
         self.scheduled_tasks = {}
-        self.user_messages = {}  # Store user messages temporarily for broadcasting
-        self.user_preferences = {}  # Store user preferences temporarily
+        self.user_messages = TTLCache(maxsize=USER_STATE_MAX_ENTRIES, ttl=USER_STATE_TTL)  # Store user messages temporarily for broadcasting
+        self.user_preferences = TTLCache(maxsize=USER_STATE_MAX_ENTRIES, ttl=USER_STATE_TTL)  # Store user preferences temporarily
         self.broadcast_message_ids = {}  # Store broadcast message IDs for cleanup
         
+        # Callback routing: exact callback_data first, then the first matching prefix
+        self._callback_routes = self._build_callback_routes()
+        self._callback_prefix_routes = (
+            ("add_channel_", self._handle_add_channel_callback),
+            ("remove_channel_", self._handle_remove_channel_callback),
+            ("broadcast_", self._handle_broadcast_callback),
+            ("repost_", self._handle_broadcast_config_callback),
+            ("delete_", self._handle_broadcast_config_callback),
+            ("premium_", self._handle_premium_callback),
+            ("admin_", self._handle_admin_callback),
+            ("channels_page_", self._handle_navigation_callback),
+        )
+        
         # Initialize components
         self._initialize_database()
         self._initialize_bot()
@@ -84,17 +323,48 @@ class AdvancedBroadcastBot:
     def _initialize_bot(self):
         """Initialize Telegram bot"""
         try:
+            self._configure_http_session()
             self.bot = telebot.TeleBot(BOT_TOKEN)
             logger.info("✅ Bot initialized successfully")
         except Exception as e:
             logger.error(f"❌ Bot initialization error: {e}")
             raise
     
+    def _configure_http_session(self):
+        """Share one keep-alive HTTP session across all Telegram API calls"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=TELEGRAM_POOL_CONNECTIONS,
+            # Every worker in the shared send pool can hold a socket at once
+            pool_maxsize=max(TELEGRAM_POOL_MAXSIZE, BROADCAST_WORKERS),
+            # Only failed connects are retried: nothing was sent, so a retry cannot
+            # post twice. Read timeouts and 429s go back to the caller, which knows
+            # whether the call is safe to repeat and honours the bot-wide pause.
+            max_retries=Retry(
+                total=TELEGRAM_CONNECT_RETRIES,
+                connect=TELEGRAM_CONNECT_RETRIES,
+                read=0,
+                status=0,
+                backoff_factor=0.2,
+                raise_on_status=False
+            )
+        )
+        session.mount("https://", adapter)
+        
+        apihelper.session = session
+        apihelper.CONNECT_TIMEOUT = TELEGRAM_CONNECT_TIMEOUT
+        apihelper.READ_TIMEOUT = TELEGRAM_READ_TIMEOUT
+        apihelper.RETRY_ON_ERROR = False
+    
     def _initialize_plugins(self):
         """Initialize all plugins"""
         try:
             # Initialize broadcast manager
-            self.broadcast_manager = BroadcastManager(self.bot, self.db_ops)
+            self.broadcast_manager = BroadcastManager(self.bot, self.db_ops, self.send_executor)
+            
+            # Database-backed jobs: scheduled broadcasts, tracked auto-deletes and the
+            # daily cleanup. In-memory auto actions stay on task_manager.call_later.
+            self.broadcast_scheduler = BroadcastScheduler(self.db_ops, self.broadcast_manager, self.task_manager)
             
             # Initialize utilities
             self.link_handler = LinkHandler(self.bot)
@@ -177,15 +447,15 @@ class AdvancedBroadcastBot:
             user_id = message.from_user.id
             
             # Add user to database
-            self.db_ops.add_user(
+            user = self.db_ops.add_user(
                 user_id=user_id,
                 username=message.from_user.username,
                 first_name=message.from_user.first_name,
                 last_name=message.from_user.last_name
             )
             
-            # Create welcome message
-            welcome_text = self._create_welcome_message(user_id)
+            # Create welcome message from the upserted user, no second lookup
+            welcome_text = self._create_welcome_message(user_id, user)
             markup = self._create_main_menu_keyboard(user_id)
             
             self.bot.send_message(
@@ -262,7 +532,7 @@ class AdvancedBroadcastBot:
             channels = self.db_ops.get_user_channels(user_id)
             
             channels_text = self._create_channels_list_message(channels)
-            markup = self._create_channels_keyboard()
+            markup = self._create_channels_keyboard(total_pages=self._channel_page_count(channels))
             
             self.bot.send_message(
                 user_id,
@@ -369,8 +639,8 @@ class AdvancedBroadcastBot:
                 # Channel or group - show comprehensive info
                 chat_info = self.bot.get_chat(chat_id)
                 
-                # Get channel/group details
-                chat_title = getattr(chat_info, 'title', 'Unknown')
+                # Get channel/group details; titles are user-controlled text
+                chat_title = html_escape(getattr(chat_info, 'title', 'Unknown'))
                 chat_username = getattr(chat_info, 'username', None)
                 chat_type = getattr(chat_info, 'type', 'unknown')
                 member_count = getattr(chat_info, 'member_count', 'Unknown')
@@ -436,66 +706,85 @@ class AdvancedBroadcastBot:
             logger.error(f"Error in admin command: {e}")
             self.bot.send_message(message.chat.id, "❌ Error loading admin panel.")
     
+    def _build_callback_routes(self) -> Dict[str, Any]:
+        """Map exact callback_data values to their handlers"""
+        routes = {}
+        
+        for data in ("add_channels", "add_by_link", "bulk_add", "auto_detect_channels", "add_by_id"):
+            routes[data] = self._handle_add_channel_callback
+        for data in ("broadcast_start", "broadcast_status", "broadcast_history", "stop_broadcast"):
+            routes[data] = self._handle_broadcast_callback
+        for data in ("set_repost_time", "set_delete_time", "send_now", "advanced_settings",
+                     "cancel_broadcast", "broadcast_config_back"):
+            routes[data] = self._handle_broadcast_config_callback
+        for data in ("my_channels", "show_stats", "settings"):
+            routes[data] = self._handle_navigation_callback
+        
+        # Admin actions get their own routes, each wrapped in the access check
+        for data in ("admin_panel", "admin_analytics", "admin_emergency_stop", "admin_users", "admin_controls",
+                     "admin_logs", "admin_restart", "admin_detailed_stats", "admin_export_data"):
+            routes[data] = self._admin_only(getattr(self, f"_{data}_callback"))
+        
+        routes["bulk_add_channels"] = self._handle_bulk_add_channels_callback
+        routes["features_info"] = self._handle_premium_callback
+        routes["main_menu"] = self._handle_main_menu_callback
+        
+        return routes
+    
+    def _handle_bulk_add_channels_callback(self, call):
+        """Send the bulk channel addition guide"""
+        self._handle_bulk_channel_addition(call.from_user.id)
+        self.bot.answer_callback_query(call.id, "⚡ Bulk addition guide sent!")
+    
     def _handle_callback_query(self, call):
         """Handle callback queries"""
+        data = call.data or ""
+        
+        # Exact matches are a dict lookup; only unmatched data scans the prefixes
+        handler = self._callback_routes.get(data)
+        if handler is None:
+            handler = next((route for prefix, route in self._callback_prefix_routes if data.startswith(prefix)), None)
+        
+        if handler is None:
+            answer = "❌ Unknown action"
+        else:
+            try:
+                handler(call)
+                return
+            except Exception as e:
+                # Name the action so a failure points at the handler that raised it
+                logger.error(f"Error in callback query {data!r} ({getattr(handler, '__name__', handler)}): {e}")
+                answer = "❌ An error occurred"
+        
+        # The handler may already have answered, and a second answer must not escape to the poller
         try:
-            user_id = call.from_user.id
-            data = call.data
-            
-            # Handle different callback types
-            if data.startswith("add_channel_") or data in ["add_channels", "add_by_link", "bulk_add", "auto_detect_channels", "add_by_id"]:
-                self._handle_add_channel_callback(call)
-            elif data == "bulk_add_channels":
-                self._handle_bulk_channel_addition(user_id)
-                self.bot.answer_callback_query(call.id, "⚡ Bulk addition guide sent!")
-            elif data == "auto_detect_channels":
-                self._handle_auto_detect_channels(user_id)
-                self.bot.answer_callback_query(call.id, "🔍 Auto detection guide sent!")
-            elif data.startswith("remove_channel_"):
-                self._handle_remove_channel_callback(call)
-            elif data.startswith("broadcast_") or data in ["broadcast_start", "broadcast_status", "stop_broadcast"]:
-                self._handle_broadcast_callback(call)
-            elif data in ["set_repost_time", "set_delete_time", "send_now", "advanced_settings", "cancel_broadcast", "broadcast_config_back"] or data.startswith("repost_") or data.startswith("delete_"):
-                self._handle_broadcast_config_callback(call)
-            elif data.startswith("premium_") or data in ["features_info"]:
-                self._handle_premium_callback(call)
-            elif data.startswith("admin_") or data in ["admin_analytics", "admin_emergency_stop", "admin_panel", "admin_users", "admin_controls", "admin_logs", "admin_restart", "admin_detailed_stats", "admin_export_data"]:
-                self._handle_admin_callback(call)
-            elif data in ["main_menu"]:
-                self._handle_main_menu_callback(call)
-            elif data in ["my_channels", "show_stats", "settings"]:
-                self._handle_navigation_callback(call)
-            else:
-                self.bot.answer_callback_query(call.id, "❌ Unknown action")
+            self.bot.answer_callback_query(call.id, answer)
         except Exception as e:
-            logger.error(f"Error in callback query: {e}")
-            self.bot.answer_callback_query(call.id, "❌ An error occurred")
+            logger.debug(f"Could not answer callback query {data!r}: {e}")
     
     def _handle_message(self, message):
         """Handle regular messages"""
         try:
             user_id = message.chat.id
             message_text = message.text or message.caption or ""
+            stripped_text = message_text.strip()
             
-            # Check if user is in a custom time input state
-            if user_id in self.broadcast_states:
-                state = self.broadcast_states[user_id]
+            state = self.broadcast_states.get(user_id)
+            if state is not None:
+                # Check if user is in a custom time input state
                 if state.get("waiting_for") in ["custom_repost_time", "custom_delete_time"]:
                     logger.info(f"DEBUG: Processing custom time input from user {user_id}: '{message_text}'")
                     self._handle_custom_time_input(user_id, message_text, state)
                     return
-            
-            # Check if user is in broadcast mode - if yes, treat as broadcast content
-            if user_id in self.broadcast_states:
-                state = self.broadcast_states[user_id]
+                
+                # Check if user is in broadcast mode - if yes, treat as broadcast content
                 if state.get("status") == "collecting_content":
-                    # User is in broadcast mode, treat this as broadcast content
                     self._start_broadcast_flow(user_id, message)
                     return
             
             # Check for channel ID in message (format: -1001234567890)
-            if message_text and message_text.strip().startswith('-') and message_text.strip().replace('-', '').isdigit():
-                self._handle_channel_id_message(user_id, message_text.strip())
+            if _CHANNEL_ID_RE.fullmatch(stripped_text):
+                self._handle_channel_id_message(user_id, stripped_text)
                 return
             
             # Check for channel links (t.me/ or telegram.me/) - but only if not in broadcast mode
@@ -525,7 +814,7 @@ class AdvancedBroadcastBot:
             
             # Auto-detect links and start broadcast flow
             if message.chat.type == 'private':
-                self._start_broadcast_flow(user_id, message)
+                self._start_broadcast_flow(user_id, message, channels)
         except Exception as e:
             logger.error(f"Error in message handler: {e}")
             self.bot.send_message(message.chat.id, "❌ An error occurred processing your message.")
@@ -572,19 +861,19 @@ Bot will automatically add if you're admin!
         except Exception as e:
             logger.error(f"Error handling forward message: {e}")
     
-    def _start_broadcast_flow(self, user_id: int, message):
+    def _start_broadcast_flow(self, user_id: int, message, all_channels: List[Dict] = None):
         """Start broadcast flow for a message"""
         try:
             # Store the message for broadcasting
             self.user_messages[user_id] = message
             
             # Set broadcast state to collecting content
-            if user_id not in self.broadcast_states:
-                self.broadcast_states[user_id] = {}
-            self.broadcast_states[user_id]["status"] = "collecting_content"
+            self.broadcast_states.setdefault(user_id, {})["status"] = "collecting_content"
             
-            # Get all user channels (don't auto-add from links)
-            all_channels = self.db_ops.get_user_channels(user_id)
+            # Get all user channels (don't auto-add from links), unless the caller
+            # already loaded them for this message
+            if all_channels is None:
+                all_channels = self.db_ops.get_user_channels(user_id)
             
             # Create broadcast configuration UI
             broadcast_text = self._create_broadcast_config_message(message, [], all_channels, user_id)
@@ -692,16 +981,16 @@ Use /add command for step-by-step guide.
             
             # Process each link
             added_channels = []
-            failed_channels = []
+            # Only the most recent failures are shown, so keep a bounded window plus a tally per reason
+            failed_channels = deque(maxlen=5)
+            failure_reasons = Counter()
             
-            for link in links:
+            # Resolve all links and check admin access concurrently
+            for link, channel_info, has_access in self.link_handler.resolve_links(links):
                 try:
-                    # Resolve channel info
-                    channel_info = self.link_handler.resolve_channel_info(link)
-                    
                     if channel_info:
                         # Check bot access
-                        if self.link_handler.check_bot_access(channel_info["channel_id"]):
+                        if has_access:
                             # Add to database
                             success = self.db_ops.add_channel(
                                 channel_id=channel_info["channel_id"],
@@ -711,48 +1000,54 @@ Use /add command for step-by-step guide.
                             )
                             
                             if success:
-                                added_channels.append(channel_info)
+                                added_channels.append((link, channel_info))
                             else:
                                 failed_channels.append(f"{channel_info['channel_name']} (Database error)")
+                                failure_reasons["Database error"] += 1
                         else:
                             failed_channels.append(f"{channel_info['channel_name']} (Bot not admin)")
+                            failure_reasons["Bot not admin"] += 1
                     else:
                         failed_channels.append(f"{link} (Not found)")
+                        failure_reasons["Not found"] += 1
                         
                 except Exception as e:
                     logger.error(f"Error processing link {link}: {e}")
                     failed_channels.append(f"{link} (Error: {str(e)})")
+                    failure_reasons["Error"] += 1
             
-            # Send results
-            result_text = f"📋 <b>Channel Addition Results</b>\n<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>\n\n"
+            # Send results, collecting the lines and joining once at the end
+            parts = ["📋 <b>Channel Addition Results</b>\n<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>\n\n"]
             
             if added_channels:
-                result_text += f"✅ <b>Successfully Added ({len(added_channels)}):</b>\n"
-                for channel in added_channels:
-                    result_text += f"┣ 📋 {channel['channel_name']}\n"
+                parts.append(f"✅ <b>Successfully Added ({len(added_channels)}):</b>\n")
+                for link, channel in added_channels:
+                    parts.append(f"┣ 📋 {html_escape(channel['channel_name'])}\n")
                     if channel.get('username'):
-                        result_text += f"┣ 👤 @{channel['username']}\n"
+                        parts.append(f"┣ 👤 @{channel['username']}\n")
                     if channel.get('is_private'):
-                        result_text += f"┣ 🔒 Private Channel\n"
-                        if channel.get('invite_link'):
-                            result_text += f"┗ 🔗 {channel['invite_link']}\n\n"
-                        else:
-                            result_text += f"┗ 🔗 t.me/{link}\n\n"
+                        parts.append("┣ 🔒 Private Channel\n")
+                        parts.append(f"┗ 🔗 {channel.get('invite_link') or f't.me/{link}'}\n\n")
                     else:
-                        result_text += f"┗ 🌐 Public Channel\n\n"
-            
-            if failed_channels:
-                result_text += f"❌ <b>Failed ({len(failed_channels)}):</b>\n"
-                for channel in failed_channels:
-                    result_text += f"┣ ❌ {channel}\n"
-                result_text += "\n"
+                        parts.append("┗ 🌐 Public Channel\n\n")
+            
+            failed_count = sum(failure_reasons.values())
+            if failed_count:
+                parts.append(f"❌ <b>Failed ({failed_count}):</b>\n")
+                # A per-reason tally says what to fix even when most failures are not listed
+                if len(failure_reasons) > 1 or failed_count > len(failed_channels):
+                    parts.extend(f"┣ <b>{reason}:</b> {count}\n" for reason, count in failure_reasons.most_common())
+                parts.extend(f"┣ ❌ {html_escape(channel)}\n" for channel in failed_channels)
+                if failed_count > len(failed_channels):
+                    parts.append(f"┗ ... and {failed_count - len(failed_channels)} more\n")
+                parts.append("\n")
             
             if added_channels:
-                result_text += f"<i>Total channels: {len(added_channels)} added successfully!</i>"
+                parts.append(f"<i>Total channels: {len(added_channels)} added successfully!</i>")
             else:
-                result_text += "<i>No channels were added. Please check bot admin access.</i>"
+                parts.append("<i>No channels were added. Please check bot admin access.</i>")
             
-            self.bot.send_message(user_id, result_text, parse_mode="HTML")
+            self.bot.send_message(user_id, "".join(parts), parse_mode="HTML")
             
         except Exception as e:
             logger.error(f"Error handling channel link message: {e}")
@@ -854,50 +1149,19 @@ https://t.me/channel3</code>
             self.bot.send_message(user_id, "❌ An error occurred during auto detection.")
     
     # UI Creation Methods
-    def _create_welcome_message(self, user_id: int) -> str:
+    def _create_welcome_message(self, user_id: int, user=None) -> str:
         """Create welcome message"""
-        user = self.db_ops.get_user(user_id)
+        if user is None:
+            user = self.db_ops.get_user(user_id)
         channels = self.db_ops.get_user_channels(user_id)
         
         user_name = "Unknown"
         if user and user.first_name:
-            user_name = user.first_name
+            user_name = html_escape(user.first_name)
         elif user and user.username:
             user_name = f"@{user.username}"
         
-        return f"""
-🔥 <b>Welcome to Advanced Broadcast Bot!</b>
-<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
-
-👋 <b>Hello {user_name}!</b>
-📊 <b>Your Channels:</b> {len(channels)} connected
-
-<blockquote>
-🎉 <b>ALL FEATURES ARE FREE!</b>
-No premium required - everything unlocked!
-</blockquote>
-
-{protected_branding.get_welcome_branding()}
-
-🚀 <b>What You Can Do:</b>
-┣ 📢 <b>Multi-Channel Broadcasting</b> - Send to unlimited channels
-┣ ⚡ <b>Auto Repost & Delete</b> - Smart automation
-┣ 📊 <b>Advanced Analytics</b> - Detailed insights  
-┣ 🔗 <b>Auto Link Detection</b> - Smart channel adding
-┣ ⏰ <b>Scheduled Posts</b> - Future broadcasting
-┣ 🎨 <b>Rich Media Support</b> - Photos, videos, docs
-┗ 📈 <b>Real-time Tracking</b> - Live progress
-
-<b>🎯 Quick Start Guide:</b>
-<code>1. Click "➕ Add Channels" below</code>
-<code>2. Send your channel links</code>
-<code>3. Create your message</code>
-<code>4. Hit "📢 Broadcast" and go!</code>
-
-💡 <b>Pro Tip:</b> Just send me a message with channel links - I'll auto-detect and add them!
-
-{protected_branding.get_footer_branding()}
-        """.strip()
+        return _WELCOME_HEADER_TEMPLATE.format(user_name=user_name, channel_count=len(channels)) + _WELCOME_STATIC_TAIL
     
     def _create_main_menu_keyboard(self, user_id: int) -> types.InlineKeyboardMarkup:
         """Create main menu keyboard with attractive design"""
@@ -944,15 +1208,7 @@ No premium required - everything unlocked!
         message_text = message.text or message.caption or ""
         
         # Get current user preferences
-        repost_setting = "Not Set"
-        delete_setting = "Not Set"
-        
-        if user_id and user_id in self.user_preferences:
-            prefs = self.user_preferences[user_id]
-            if "auto_repost_time" in prefs:
-                repost_setting = prefs["auto_repost_time"]["display"]
-            if "auto_delete_time" in prefs:
-                delete_setting = prefs["auto_delete_time"]["display"]
+        repost_setting, delete_setting = self._time_settings_display(user_id, "Not Set")
         
         config_text = f"""
 <b>📢 Broadcast Configuration</b>
@@ -981,38 +1237,24 @@ No premium required - everything unlocked!
     
     def _create_broadcast_config_keyboard(self) -> types.InlineKeyboardMarkup:
         """Create broadcast configuration keyboard"""
-        markup = types.InlineKeyboardMarkup(row_width=2)
-        
-        markup.add(
-            types.InlineKeyboardButton("🔄 Set Auto Repost", callback_data="set_repost_time"),
-            types.InlineKeyboardButton("🗑️ Set Auto Delete", callback_data="set_delete_time")
-        )
-        markup.add(
-            types.InlineKeyboardButton("📤 Send Now", callback_data="send_now"),
-            types.InlineKeyboardButton("⚙️ Advanced", callback_data="advanced_settings")
-        )
-        markup.add(
-            types.InlineKeyboardButton("❌ Cancel", callback_data="cancel_broadcast")
-        )
-        
-        return markup
+        return _static_keyboard(_BROADCAST_CONFIG_ROWS)
     
     def _create_free_features_message(self) -> str:
         """Create free features message"""
         return """
-🎉 **All Features Are Now FREE!**
+🎉 <b>All Features Are Now FREE!</b>
 
 <b>🚀 What You Get:</b>
-• 📢 **Unlimited Broadcasting** - Send to unlimited channels
-• ⚡ **Auto Repost & Delete** - Automated message management
-• 📊 **Advanced Analytics** - Detailed performance tracking
-• 🔗 **Auto Link Detection** - Automatically add channels from links
-• ⏰ **Scheduled Broadcasts** - Schedule future messages
-• 🎨 **Message Templates** - Pre-built message formats
-• 📈 **Real-time Monitoring** - Live broadcast progress
-• 🛠 **Bulk Operations** - Mass channel management
-• 📱 **Multi-media Support** - Photos, videos, documents
-• ⚙️ **Custom Settings** - Flexible configuration options
+• 📢 <b>Unlimited Broadcasting</b> - Send to unlimited channels
+• ⚡ <b>Auto Repost &amp; Delete</b> - Automated message management
+• 📊 <b>Advanced Analytics</b> - Detailed performance tracking
+• 🔗 <b>Auto Link Detection</b> - Automatically add channels from links
+• ⏰ <b>Scheduled Broadcasts</b> - Schedule future messages
+• 🎨 <b>Message Templates</b> - Pre-built message formats
+• 📈 <b>Real-time Monitoring</b> - Live broadcast progress
+• 🛠 <b>Bulk Operations</b> - Mass channel management
+• 📱 <b>Multi-media Support</b> - Photos, videos, documents
+• ⚙️ <b>Custom Settings</b> - Flexible configuration options
 
 <b>💡 No Premium Required!</b>
 All features are completely free for everyone. No hidden costs, no limitations!
@@ -1097,7 +1339,11 @@ Use the main menu to begin broadcasting!
         
         return markup
     
-    def _create_channels_list_message(self, channels: List[Dict[str, Any]]) -> str:
+    def _channel_page_count(self, channels: List[Dict[str, Any]]) -> int:
+        """Number of channel list pages, at least one"""
+        return max(1, -(-len(channels) // CHANNELS_PER_PAGE))
+    
+    def _create_channels_list_message(self, channels: List[Dict[str, Any]], page: int = 0) -> str:
         """Create channels list message"""
         if not channels:
             return """
@@ -1113,10 +1359,13 @@ No channels found. Use /add to add channels first.
 3. Start broadcasting!
             """.strip()
         
+        total_pages = self._channel_page_count(channels)
+        start = page * CHANNELS_PER_PAGE
+        
         message = f"📋 <b>Your Channels ({len(channels)})</b>\n\n"
         
-        for i, channel in enumerate(channels[:10], 1):
-            name = channel.get("channel_name", "Unknown")
+        for i, channel in enumerate(channels[start:start + CHANNELS_PER_PAGE], start + 1):
+            name = html_escape(channel.get("channel_name", "Unknown"))
             username = channel.get("username", "")
             broadcasts = channel.get("total_broadcasts", 0)
             success_rate = channel.get("success_rate", 100)
@@ -1128,15 +1377,24 @@ No channels found. Use /add to add channels first.
             channel_info += f"\n   📊 {broadcasts} broadcasts • {success_rate:.1f}% success\n"
             message += channel_info
         
-        if len(channels) > 10:
-            message += f"\n<i>... and {len(channels) - 10} more channels</i>"
+        if total_pages > 1:
+            message += f"\n<i>Page {page + 1}/{total_pages}</i>"
         
         return message
     
-    def _create_channels_keyboard(self) -> types.InlineKeyboardMarkup:
+    def _create_channels_keyboard(self, page: int = 0, total_pages: int = 1) -> types.InlineKeyboardMarkup:
         """Create channels keyboard"""
         markup = types.InlineKeyboardMarkup(row_width=2)
         
+        # Page through long lists by editing the same message
+        if total_pages > 1:
+            nav_buttons = []
+            if page > 0:
+                nav_buttons.append(types.InlineKeyboardButton("⬅️ Prev", callback_data=f"channels_page_{page - 1}"))
+            if page < total_pages - 1:
+                nav_buttons.append(types.InlineKeyboardButton("Next ➡️", callback_data=f"channels_page_{page + 1}"))
+            markup.add(*nav_buttons)
+        
         markup.add(
             types.InlineKeyboardButton("➕ Add More", callback_data="add_channels"),
             types.InlineKeyboardButton("🗑️ Remove Channel", callback_data="remove_channel")
@@ -1439,17 +1697,12 @@ Add channels directly using their unique ID.
                 # Show broadcast interface
                 channels = self.db_ops.get_user_channels(user_id)
                 if not channels:
-                    self.bot.edit_message_text(
-                        "❌ No channels found! Please add channels first.",
-                        call.message.chat.id,
-                        call.message.message_id
-                    )
+                    # Keep the menu in place so the user can go straight to adding channels
+                    self.bot.answer_callback_query(call.id, "❌ No channels found! Please add channels first.", show_alert=True)
                     return
                 
                 # Set broadcast state to collecting content
-                if user_id not in self.broadcast_states:
-                    self.broadcast_states[user_id] = {}
-                self.broadcast_states[user_id]["status"] = "collecting_content"
+                self.broadcast_states.setdefault(user_id, {})["status"] = "collecting_content"
                 
                 broadcast_text = self._create_broadcast_message()
                 markup = self._create_broadcast_keyboard()
@@ -1461,6 +1714,7 @@ Add channels directly using their unique ID.
                     reply_markup=markup,
                     parse_mode="HTML"
                 )
+                self.bot.answer_callback_query(call.id, "📢 Send your broadcast message!")
             
             elif call.data == "broadcast_status":
                 # Show broadcast status
@@ -1479,11 +1733,55 @@ Add channels directly using their unique ID.
                 # Step 1: Stop ongoing broadcast
                 result = self.broadcast_manager.stop_broadcast(user_id)
                 
-                # Step 2: Stop all auto actions
+                # Step 2: Stop all auto actions and any pending broadcast setup
                 stopped_tasks = self._stop_user_auto_actions(user_id)
+                self._clear_user_state(user_id)
+                
+                # Step 3: Cleanup messages from channels, showing throttled progress;
+                # with nothing tracked there is nothing to report, so skip the status message
+                user_channel_ids = {channel.get('channel_id') for channel in self.db_ops.get_user_channels(user_id)}
+                status_message = None
+                if not user_channel_ids.isdisjoint(self.broadcast_message_ids):
+                    status_message = self.bot.send_message(user_id, "🧹 Cleaning up broadcast messages...")
+                
+                last_report = [None]
+                edit_in_flight = threading.Lock()
+                
+                def draw_cleanup(progress_text):
+                    try:
+                        # A dropped progress frame is harmless, so never retry one
+                        telegram_rate_limiter.call(
+                            self.bot.edit_message_text, progress_text, user_id, status_message.message_id,
+                            attempts=1
+                        )
+                    except Exception:
+                        pass  # Ignore edit failures
+                    finally:
+                        edit_in_flight.release()
+                
+                def report_cleanup(done, total, deleted):
+                    progress_text = f"🧹 Cleaning up... {done}/{total} channels, {deleted} deletes requested"
+                    # Telegram rejects an edit that changes nothing, so don't spend a request on one
+                    if progress_text == last_report[0]:
+                        return
+                    # Draw off the thread collecting deletes; drop the frame while one is still going out
+                    if not edit_in_flight.acquire(blocking=False):
+                        return
+                    last_report[0] = progress_text
+                    try:
+                        self.task_manager.spawn(draw_cleanup, progress_text, name=f"cleanup-progress-{user_id}")
+                    except Exception:
+                        # draw_cleanup never ran, so release here or the final wait would hang
+                        edit_in_flight.release()
+                
+                deleted_count = self._stop_broadcast_and_cleanup(
+                    user_id, on_progress=report_cleanup if status_message else None
+                )
                 
-                # Step 3: Cleanup messages from channels
-                deleted_count = self._stop_broadcast_and_cleanup(user_id)
+                # Let a progress frame still going out land before the result replaces it,
+                # but never hold the callback thread on a stuck edit
+                if edit_in_flight.acquire(timeout=TELEGRAM_READ_TIMEOUT):
+                    edit_in_flight.release()
                 
                 # Send confirmation message
                 cleanup_text = f"""
@@ -1493,7 +1791,7 @@ Add channels directly using their unique ID.
 <blockquote>
 ✅ <b>Broadcast Status:</b> {result.get('message', 'Stopped')}
 🔄 <b>Auto Tasks Stopped:</b> {stopped_tasks}
-🧹 <b>Messages Deleted:</b> {deleted_count}
+🧹 <b>Deletes Requested:</b> {deleted_count}
 </blockquote>
 
 <b>📋 What was cleaned:</b>
@@ -1504,7 +1802,14 @@ Add channels directly using their unique ID.
 <i>All channels are now clean and ready for new broadcasts!</i>
                 """.strip()
                 
-                self.bot.send_message(user_id, cleanup_text, parse_mode="HTML")
+                # The final result replaces the progress message when there is one
+                if status_message is None:
+                    self.bot.send_message(user_id, cleanup_text, parse_mode="HTML")
+                else:
+                    try:
+                        self.bot.edit_message_text(cleanup_text, user_id, status_message.message_id, parse_mode="HTML")
+                    except Exception:
+                        self.bot.send_message(user_id, cleanup_text, parse_mode="HTML")
             
             elif call.data == "schedule_broadcast":
                 # Schedule broadcast feature
@@ -1540,7 +1845,8 @@ Schedule your broadcasts for future delivery!
             
             elif call.data == "broadcast_history":
                 # Broadcast history
-                broadcasts = self.db_ops.get_user_broadcasts(user_id)
+                history = self.db_ops.get_user_broadcast_history(user_id, limit=5)
+                broadcasts = history["recent_broadcasts"]
                 
                 if not broadcasts:
                     history_text = """
@@ -1564,16 +1870,17 @@ You haven't sent any broadcasts yet.
 <i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
 
 <blockquote>
-📊 <b>Total Broadcasts:</b> {len(broadcasts)}
+📊 <b>Total Broadcasts:</b> {history['total_broadcasts']}
 </blockquote>
 
 <b>🕐 Recent Broadcasts:</b>
                     """.strip()
                     
-                    for i, broadcast in enumerate(broadcasts[:5]):  # Show last 5
-                        status_emoji = "✅" if broadcast.get('status') == 'completed' else "⏳"
-                        date = broadcast.get('created_date', 'Unknown')
-                        history_text += f"\n{status_emoji} <b>#{i+1}</b> - {date}"
+                    history_text += "".join(
+                        f"\n{'✅' if broadcast.get('status') == 'completed' else '⏳'} "
+                        f"<b>#{i}</b> - {self.helpers.format_timestamp(broadcast['created_date']) if broadcast.get('created_date') else 'Unknown'}"
+                        for i, broadcast in enumerate(broadcasts, 1)
+                    )
                 
                 self.bot.edit_message_text(
                     history_text,
@@ -1593,6 +1900,49 @@ You haven't sent any broadcasts yet.
             logger.error(f"Error handling broadcast callback: {e}")
             self.bot.answer_callback_query(call.id, "An error occurred")
     
+    def _edit_config_panel(self, call, text: str, markup: types.InlineKeyboardMarkup, answer: str):
+        """Redraw the configuration message behind a callback and acknowledge it"""
+        self.bot.edit_message_text(
+            text,
+            call.message.chat.id,
+            call.message.message_id,
+            reply_markup=markup,
+            parse_mode="HTML"
+        )
+        self.bot.answer_callback_query(call.id, answer)
+    
+    def _prompt_custom_time(self, call, prompt_text: str, back_callback: str, waiting_for: str, answer: str):
+        """Ask for a custom repost/delete time and wait for the user's reply"""
+        markup = types.InlineKeyboardMarkup()
+        markup.add(
+            types.InlineKeyboardButton("🔙 Back to Options", callback_data=back_callback)
+        )
+        
+        self._edit_config_panel(call, prompt_text, markup, answer)
+        
+        # Set user state for custom input
+        self.broadcast_states[call.from_user.id] = {
+            "waiting_for": waiting_for,
+            "message_id": call.message.message_id,
+            "chat_id": call.message.chat.id
+        }
+    
+    def _clear_user_state(self, user_id: int):
+        """Drop a user's pending broadcast conversation; time preferences are kept"""
+        self.broadcast_states.pop(user_id, None)
+        self.user_messages.pop(user_id, None)
+    
+    def _store_time_preference(self, user_id: int, preference_key: str, display: str, minutes: int):
+        """Remember an auto repost/delete time for the user's next broadcast"""
+        self.user_preferences.setdefault(user_id, {})[preference_key] = {'display': display, 'minutes': minutes}
+    
+    def _time_settings_display(self, user_id: int, default: str) -> Tuple[str, str]:
+        """Display labels for the user's auto repost and auto delete times"""
+        prefs = self.user_preferences.get(user_id) or {}
+        repost = prefs.get("auto_repost_time")
+        delete = prefs.get("auto_delete_time")
+        return (repost["display"] if repost else default, delete["display"] if delete else default)
+    
     def _handle_broadcast_config_callback(self, call):
         """Handle broadcast configuration callbacks"""
         try:
@@ -1622,36 +1972,9 @@ Automatically repost your message after a set time interval!
 💡 <b>Pro Tip:</b> Choose interval based on your audience activity!
                 """.strip()
                 
-                markup = types.InlineKeyboardMarkup(row_width=2)
-                markup.add(
-                    types.InlineKeyboardButton("⚡ 5 Min", callback_data="repost_5min"),
-                    types.InlineKeyboardButton("🕐 30 Min", callback_data="repost_30min")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("🕐 1 Hour", callback_data="repost_1hour"),
-                    types.InlineKeyboardButton("🕐 3 Hours", callback_data="repost_3hour")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("🕐 6 Hours", callback_data="repost_6hour"),
-                    types.InlineKeyboardButton("🕐 12 Hours", callback_data="repost_12hour")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("🕐 24 Hours", callback_data="repost_24hour"),
-                    types.InlineKeyboardButton("❌ Disable", callback_data="repost_disable")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("⏰ Custom Time", callback_data="repost_custom"),
-                    types.InlineKeyboardButton("🔙 Back", callback_data="broadcast_config_back")
-                )
+                markup = _static_keyboard(_REPOST_TIME_ROWS)
                 
-                self.bot.edit_message_text(
-                    repost_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "⏰ Set auto repost time!")
+                self._edit_config_panel(call, repost_text, markup, "⏰ Set auto repost time!")
             
             elif data == "set_delete_time":
                 # Set auto delete time
@@ -1677,78 +2000,42 @@ Automatically delete your message after broadcast completion!
 ⚠️ <b>Warning:</b> Deleted messages cannot be recovered!
                 """.strip()
                 
-                markup = types.InlineKeyboardMarkup(row_width=2)
-                markup.add(
-                    types.InlineKeyboardButton("⚡ Instant", callback_data="delete_instant"),
-                    types.InlineKeyboardButton("🕐 2 Min", callback_data="delete_2min")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("🕐 3 Min", callback_data="delete_3min"),
-                    types.InlineKeyboardButton("🕐 10 Min", callback_data="delete_10min")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("🕐 20 Min", callback_data="delete_20min"),
-                    types.InlineKeyboardButton("🕐 1 Hour", callback_data="delete_1hour")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("♾️ Never", callback_data="delete_never"),
-                    types.InlineKeyboardButton("⏰ Custom Time", callback_data="delete_custom")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("🔙 Back", callback_data="broadcast_config_back")
-                )
+                markup = _static_keyboard(_DELETE_TIME_ROWS)
                 
-                self.bot.edit_message_text(
-                    delete_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "🗑️ Set auto delete time!")
+                self._edit_config_panel(call, delete_text, markup, "🗑️ Set auto delete time!")
             
             elif data == "send_now":
                 # Send broadcast now
-                self.bot.answer_callback_query(call.id, "🚀 Starting broadcast...")
-                
-                # Get user's stored message
-                if user_id not in self.user_messages:
-                    self.bot.edit_message_text(
-                        "❌ No message found! Please send a message first to broadcast.",
-                        call.message.chat.id,
-                        call.message.message_id
+                # Claim the stored message in one locked step, so a double tap on
+                # Send Now finds nothing left and cannot start a second broadcast
+                message_to_broadcast = self.user_messages.pop(user_id, None)
+                if message_to_broadcast is None:
+                    # An alert leaves the panel (or a running broadcast's progress) untouched
+                    self.bot.answer_callback_query(
+                        call.id, "❌ No message found! Please send a message first to broadcast.", show_alert=True
                     )
                     return
                 
-                message_to_broadcast = self.user_messages[user_id]
                 channels = self.db_ops.get_user_channels(user_id)
                 
                 if not channels:
-                    self.bot.edit_message_text(
-                        "❌ No channels found! Please add channels first.",
-                        call.message.chat.id,
-                        call.message.message_id
-                    )
+                    # Hand the message back so it can be sent once channels are added
+                    self.user_messages.setdefault(user_id, message_to_broadcast)
+                    self.bot.answer_callback_query(call.id, "❌ No channels found! Please add channels first.", show_alert=True)
                     return
                 
+                self.bot.answer_callback_query(call.id, "🚀 Starting broadcast...")
+                
                 # Start the actual broadcast process
-                threading.Thread(
-                    target=self._execute_broadcast,
-                    args=(user_id, message_to_broadcast, channels, call.message.chat.id, call.message.message_id),
-                    daemon=True
-                ).start()
+                self.task_manager.spawn(
+                    self._execute_broadcast,
+                    user_id, message_to_broadcast, channels, call.message.chat.id, call.message.message_id,
+                    name=f"broadcast-{user_id}"
+                )
                 
                 # Show broadcasting status
                 # Get user preferences for display
-                repost_setting = "Disabled"
-                delete_setting = "Disabled"
-                
-                if user_id in self.user_preferences:
-                    prefs = self.user_preferences[user_id]
-                    if "auto_repost_time" in prefs:
-                        repost_setting = prefs["auto_repost_time"]["display"]
-                    if "auto_delete_time" in prefs:
-                        delete_setting = prefs["auto_delete_time"]["display"]
+                repost_setting, delete_setting = self._time_settings_display(user_id, "Disabled")
                 
                 broadcast_status_text = f"""
 🚀 <b>Broadcasting Started!</b>
@@ -1819,28 +2106,15 @@ Fine-tune your broadcast behavior!
                 markup.add(
                     types.InlineKeyboardButton("🔙 Back", callback_data="broadcast_config_back")
                 )
-                self.bot.edit_message_text(
-                    advanced_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "⚙️ Advanced settings!")
+                self._edit_config_panel(call, advanced_text, markup, "⚙️ Advanced settings!")
             
             elif data == "cancel_broadcast":
-                # Cancel broadcast
+                # Cancel broadcast; otherwise the next message would still be taken as content
+                self._clear_user_state(user_id)
                 welcome_text = self._create_welcome_message(user_id)
                 markup = self._create_main_menu_keyboard(user_id)
                 
-                self.bot.edit_message_text(
-                    welcome_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "❌ Broadcast cancelled!")
+                self._edit_config_panel(call, welcome_text, markup, "❌ Broadcast cancelled!")
             
             elif data == "broadcast_config_back":
                 # Go back to broadcast config
@@ -1864,119 +2138,7 @@ Configure your broadcast settings below.
                 
                 markup = self._create_broadcast_config_keyboard()
                 
-                self.bot.edit_message_text(
-                    config_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "🔙 Back to configuration!")
-            
-            # Handle repost time selections
-            elif data.startswith("repost_"):
-                time_option = data.replace("repost_", "")
-                time_map = {
-                    "5min": "5 Minutes",
-                    "30min": "30 Minutes", 
-                    "1hour": "1 Hour",
-                    "3hour": "3 Hours",
-                    "6hour": "6 Hours",
-                    "12hour": "12 Hours",
-                    "24hour": "24 Hours",
-                    "disable": "Disabled"
-                }
-                
-                selected_time = time_map.get(time_option, "Unknown")
-                
-                # Store the preset time setting
-                if user_id not in self.user_preferences:
-                    self.user_preferences[user_id] = {}
-                
-                self.user_preferences[user_id]["auto_repost_time"] = {
-                    'display': selected_time,
-                    'minutes': self._preset_to_minutes(time_option)
-                }
-                
-                success_text = f"""
-✅ <b>Auto Repost Configured!</b>
-<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
-
-<blockquote>
-🔄 <b>Repost Interval:</b> {selected_time}
-</blockquote>
-
-<b>📋 What This Means:</b>
-┣ 📤 <b>First Send:</b> Immediate broadcast
-┣ 🔄 <b>Auto Repost:</b> Every {selected_time.lower()}
-┣ ♾️ <b>Duration:</b> Until manually stopped
-┗ 📊 <b>Tracking:</b> Full analytics included
-
-🚀 <b>Ready to proceed?</b> Configure more settings or send now!
-                """.strip()
-                
-                markup = self._create_broadcast_config_keyboard()
-                
-                self.bot.edit_message_text(
-                    success_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, f"🔄 Auto repost set to {selected_time}!")
-            
-            # Handle delete time selections  
-            elif data.startswith("delete_"):
-                time_option = data.replace("delete_", "")
-                time_map = {
-                    "instant": "Instant",
-                    "2min": "2 Minutes",
-                    "3min": "3 Minutes",
-                    "10min": "10 Minutes",
-                    "20min": "20 Minutes",
-                    "1hour": "1 Hour",
-                    "never": "Never"
-                }
-                
-                selected_time = time_map.get(time_option, "Unknown")
-                
-                # Store the preset delete time setting
-                if user_id not in self.user_preferences:
-                    self.user_preferences[user_id] = {}
-                
-                self.user_preferences[user_id]["auto_delete_time"] = {
-                    'display': selected_time,
-                    'minutes': self._preset_delete_to_minutes(time_option)
-                }
-                
-                success_text = f"""
-✅ <b>Auto Delete Configured!</b>
-<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
-
-<blockquote>
-🗑️ <b>Delete Timer:</b> {selected_time}
-</blockquote>
-
-<b>📋 What This Means:</b>
-┣ 📤 <b>Send Messages:</b> Normal broadcast
-┣ ⏱️ <b>Wait Period:</b> {selected_time.lower()}
-┣ 🗑️ <b>Auto Delete:</b> Remove from all channels
-┗ 🛡️ <b>Cleanup:</b> No traces left behind
-
-⚠️ <b>Warning:</b> Deleted messages cannot be recovered!
-                """.strip()
-                
-                markup = self._create_broadcast_config_keyboard()
-                
-                self.bot.edit_message_text(
-                    success_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, f"🗑️ Auto delete set to {selected_time}!")
+                self._edit_config_panel(call, config_text, markup, "🔙 Back to configuration!")
             
             # Handle custom repost time
             elif data == "repost_custom":
@@ -2004,26 +2166,7 @@ Enter the time in minutes, hours, or days.
 💡 <b>Just send me your custom time!</b>
                 """.strip()
                 
-                markup = types.InlineKeyboardMarkup()
-                markup.add(
-                    types.InlineKeyboardButton("🔙 Back to Options", callback_data="set_repost_time")
-                )
-                
-                self.bot.edit_message_text(
-                    custom_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "⏰ Send custom repost time!")
-                
-                # Set user state for custom input
-                self.broadcast_states[user_id] = {
-                    "waiting_for": "custom_repost_time",
-                    "message_id": call.message.message_id,
-                    "chat_id": call.message.chat.id
-                }
+                self._prompt_custom_time(call, custom_text, "set_repost_time", "custom_repost_time", "⏰ Send custom repost time!")
             
             # Handle custom delete time
             elif data == "delete_custom":
@@ -2053,26 +2196,73 @@ Enter when to delete messages after broadcast.
 💡 <b>Just send me your custom time!</b>
                 """.strip()
                 
-                markup = types.InlineKeyboardMarkup()
-                markup.add(
-                    types.InlineKeyboardButton("🔙 Back to Options", callback_data="set_delete_time")
-                )
+                self._prompt_custom_time(call, custom_text, "set_delete_time", "custom_delete_time", "⏰ Send custom delete time!")
+            
+            # Handle repost time selections
+            elif data.startswith("repost_"):
+                preset = _REPOST_PRESETS.get(data[len("repost_"):])
+                if preset is None:
+                    self.bot.answer_callback_query(call.id, "❌ Unknown repost option")
+                    return
                 
-                self.bot.edit_message_text(
-                    custom_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "⏰ Send custom delete time!")
+                selected_time, minutes = preset
+                
+                # Store the preset time setting
+                self._store_time_preference(user_id, "auto_repost_time", selected_time, minutes)
                 
-                # Set user state for custom input
-                self.broadcast_states[user_id] = {
-                    "waiting_for": "custom_delete_time",
-                    "message_id": call.message.message_id,
-                    "chat_id": call.message.chat.id
-                }
+                success_text = f"""
+✅ <b>Auto Repost Configured!</b>
+<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
+
+<blockquote>
+🔄 <b>Repost Interval:</b> {selected_time}
+</blockquote>
+
+<b>📋 What This Means:</b>
+┣ 📤 <b>First Send:</b> Immediate broadcast
+┣ 🔄 <b>Auto Repost:</b> Every {selected_time.lower()}
+┣ ♾️ <b>Duration:</b> Until manually stopped
+┗ 📊 <b>Tracking:</b> Full analytics included
+
+🚀 <b>Ready to proceed?</b> Configure more settings or send now!
+                """.strip()
+                
+                markup = self._create_broadcast_config_keyboard()
+                
+                self._edit_config_panel(call, success_text, markup, f"🔄 Auto repost set to {selected_time}!")
+            
+            # Handle delete time selections  
+            elif data.startswith("delete_"):
+                preset = _DELETE_PRESETS.get(data[len("delete_"):])
+                if preset is None:
+                    self.bot.answer_callback_query(call.id, "❌ Unknown delete option")
+                    return
+                
+                selected_time, minutes = preset
+                
+                # Store the preset delete time setting
+                self._store_time_preference(user_id, "auto_delete_time", selected_time, minutes)
+                
+                success_text = f"""
+✅ <b>Auto Delete Configured!</b>
+<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
+
+<blockquote>
+🗑️ <b>Delete Timer:</b> {selected_time}
+</blockquote>
+
+<b>📋 What This Means:</b>
+┣ 📤 <b>Send Messages:</b> Normal broadcast
+┣ ⏱️ <b>Wait Period:</b> {selected_time.lower()}
+┣ 🗑️ <b>Auto Delete:</b> Remove from all channels
+┗ 🛡️ <b>Cleanup:</b> No traces left behind
+
+⚠️ <b>Warning:</b> Deleted messages cannot be recovered!
+                """.strip()
+                
+                markup = self._create_broadcast_config_keyboard()
+                
+                self._edit_config_panel(call, success_text, markup, f"🗑️ Auto delete set to {selected_time}!")
             
             else:
                 self.bot.answer_callback_query(call.id, "Feature coming soon!")
@@ -2083,81 +2273,83 @@ Enter when to delete messages after broadcast.
     
     def _execute_broadcast(self, user_id: int, message, channels: List[Dict], status_chat_id: int, status_message_id: int):
         """Execute the actual broadcasting to channels"""
+        total_channels = len(channels)
+        successful_sends = 0
+        failed_sends = 0
+        # Message IDs this broadcast left in each channel, for its scheduled delete
+        sent_message_ids = {}
+        
         try:
-            total_channels = len(channels)
-            successful_sends = 0
-            failed_sends = 0
+            markup = types.InlineKeyboardMarkup()
+            markup.add(
+                types.InlineKeyboardButton("🛑 Stop", callback_data="stop_broadcast")
+            )
             
-            for i, channel in enumerate(channels):
-                try:
+            # Redraw progress from a separate thread on a fixed cadence so the
+            # send loop never waits on edit_message_text
+            progress = {"successful": 0, "failed": 0, "last": ""}
+            sends_done = threading.Event()
+            progress_thread = self.task_manager.spawn(
+                self._report_broadcast_progress,
+                progress, sends_done, total_channels, status_chat_id, status_message_id, markup,
+                name=f"progress-{user_id}"
+            )
+            
+            # Fan the sends out, keeping only a bounded window queued.
+            # Bound methods are looked up once here, not once per channel.
+            send = self._send_with_flood_retry
+            update_progress = progress.update
+            completions = bounded_as_completed(
+                self.send_executor,
+                lambda channel: send(message, channel.get('channel_id')),
+                channels,
+                BROADCAST_WORKERS * 2
+            )
+            
+            try:
+                for channel, future in completions:
                     channel_id = channel.get('channel_id')
-                    channel_name = channel.get('channel_name', 'Unknown')
-                    
-                    # Update progress
-                    progress_text = f"""
-🚀 <b>Broadcasting in Progress...</b>
-<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
-
-<blockquote>
-📊 <b>Progress:</b> {i+1}/{total_channels} channels
-⏱️ <b>Status:</b> Sending to {channel_name}...
-</blockquote>
-
-<b>📱 Target Channels:</b> {total_channels}
-<b>✅ Successful:</b> {successful_sends}
-<b>❌ Failed:</b> {failed_sends}
-<b>📺 Current:</b> {channel_name}
-
-💡 <b>Please wait...</b> Broadcasting in progress!
-                    """.strip()
-                    
-                    markup = types.InlineKeyboardMarkup()
-                    markup.add(
-                        types.InlineKeyboardButton("🛑 Stop", callback_data="stop_broadcast")
-                    )
                     
                     try:
-                        self.bot.edit_message_text(
-                            progress_text,
-                            status_chat_id,
-                            status_message_id,
-                            reply_markup=markup,
-                            parse_mode="HTML"
-                        )
-                    except:
-                        pass  # Ignore edit failures
-                    
-                    # Send the message to the channel
-                    self._send_message_to_channel(message, channel_id)
-                    successful_sends += 1
-                    
-                    # Small delay between sends
-                    time.sleep(1)
+                        sent_message = future.result()
+                        successful_sends += 1
+                        if sent_message:
+                            sent_message_ids.setdefault(channel_id, []).append(sent_message.message_id)
+                    except Exception as e:
+                        logger.error(f"Error sending to channel {channel_id}: {e}")
+                        failed_sends += 1
                     
-                except Exception as e:
-                    logger.error(f"Error sending to channel {channel_id}: {e}")
-                    failed_sends += 1
-                    continue
+                    update_progress(
+                        successful=successful_sends,
+                        failed=failed_sends,
+                        last=channel.get('channel_name', 'Unknown')
+                    )
+            finally:
+                # Let any in-flight redraw land before the final text replaces it
+                sends_done.set()
+                progress_thread.join()
+            
+            # Record the broadcast so it shows up in the history panel
+            self.db_ops.add_broadcast(BroadcastModel(
+                broadcast_id=generate_broadcast_id(user_id),
+                user_id=user_id,
+                message_type=message.content_type,
+                message_content=message.text or message.caption or "",
+                status="completed" if successful_sends > 0 else "failed",
+                completed_date=datetime.utcnow(),
+                # total_channels is derived from channels in __post_init__
+                channels=[channel['channel_id'] for channel in channels],
+                successful_sends=successful_sends,
+                failed_sends=failed_sends
+            ))
             
             # Show final results
-            final_text = f"""
-✅ <b>Broadcast Completed!</b>
-<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
-
-<blockquote>
-🎯 <b>Final Results</b>
-</blockquote>
-
-<b>📊 Statistics:</b>
-┣ 📱 <b>Total Channels:</b> {total_channels}
-┣ ✅ <b>Successful:</b> {successful_sends}
-┣ ❌ <b>Failed:</b> {failed_sends}
-┗ 📈 <b>Success Rate:</b> {int((successful_sends/total_channels)*100) if total_channels > 0 else 0}%
-
-🎉 <b>Broadcast completed successfully!</b>
-
-💡 <b>Tip:</b> Check analytics for detailed insights!
-            """.strip()
+            final_text = _BROADCAST_RESULT_TEMPLATE.format(
+                total_channels=total_channels,
+                successful_sends=successful_sends,
+                failed_sends=failed_sends,
+                success_rate=int((successful_sends / total_channels) * 100) if total_channels > 0 else 0
+            )
             
             markup = types.InlineKeyboardMarkup()
             markup.add(
@@ -2177,31 +2369,18 @@ Enter when to delete messages after broadcast.
                 pass
             
             # Schedule auto repost and auto delete if configured
-            self._schedule_auto_actions(user_id, message, channels, successful_sends)
-                
-            # Clean up stored message
-            if user_id in self.user_messages:
-                del self.user_messages[user_id]
+            self._schedule_auto_actions(user_id, message, channels, successful_sends, sent_message_ids)
                 
         except Exception as e:
             logger.error(f"Error in broadcast execution: {e}")
+            # Send Now claimed the message; restore it so the Retry button has something to send
+            self.user_messages.setdefault(user_id, message)
             # Show error message
-            error_text = f"""
-❌ <b>Broadcast Error!</b>
-<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
-
-<blockquote>
-⚠️ <b>Broadcast Failed</b>
-An error occurred during broadcasting.
-</blockquote>
-
-<b>📊 Partial Results:</b>
-┣ ✅ <b>Successful:</b> {successful_sends}
-┣ ❌ <b>Failed:</b> {failed_sends}
-┗ 📱 <b>Total:</b> {total_channels}
-
-🔧 <b>Please try again or contact support.</b>
-            """.strip()
+            error_text = _BROADCAST_ERROR_TEMPLATE.format(
+                successful_sends=successful_sends,
+                failed_sends=failed_sends,
+                total_channels=total_channels
+            )
             
             markup = types.InlineKeyboardMarkup()
             markup.add(
@@ -2220,75 +2399,69 @@ An error occurred during broadcasting.
             except:
                 pass
     
+    def _report_broadcast_progress(self, progress: Dict, sends_done: threading.Event, total_channels: int,
+                                   status_chat_id: int, status_message_id: int, markup):
+        """Redraw the broadcast status message until the sends are done"""
+        last_drawn = None
+        
+        while not sends_done.wait(PROGRESS_UPDATE_INTERVAL):
+            successful_sends = progress["successful"]
+            failed_sends = progress["failed"]
+            channel_name = progress["last"]
+            
+            # Nothing finished since the last redraw
+            if (successful_sends, failed_sends) == last_drawn:
+                continue
+            last_drawn = (successful_sends, failed_sends)
+            
+            progress_text = _PROGRESS_TEMPLATE.format(
+                completed=successful_sends + failed_sends,
+                total_channels=total_channels,
+                successful_sends=successful_sends,
+                failed_sends=failed_sends,
+                channel_name=channel_name
+            )
+            
+            # Redraws share the bot-wide budget with the channel sends, so they go through the limiter too
+            try:
+                telegram_rate_limiter.call(
+                    self.bot.edit_message_text,
+                    progress_text,
+                    status_chat_id,
+                    status_message_id,
+                    reply_markup=markup,
+                    parse_mode=None,
+                    attempts=1
+                )
+            except:
+                pass  # Ignore edit failures
+    
+    def _send_with_flood_retry(self, message, channel_id: int):
+        """Send to a channel, honouring Telegram's retry_after once on flood control"""
+        try:
+            return self._send_message_to_channel(message, channel_id)
+        except ApiTelegramException as e:
+            retry_after = telegram_rate_limiter.retry_after(e)
+            if retry_after is None:
+                raise
+            # Stop every sender, not just this one, until the flood wait is over
+            logger.warning(f"⏳ Flood control on channel {channel_id}, pausing sends for {retry_after}s")
+            telegram_rate_limiter.pause(retry_after)
+            return self._send_message_to_channel(message, channel_id)
+    
     def _send_message_to_channel(self, message, channel_id: int):
         """Send a specific message to a channel and track message ID"""
         try:
-            sent_message = None
+            telegram_rate_limiter.acquire(channel_id)
             
-            if message.content_type == 'text':
-                sent_message = self.bot.send_message(
-                    channel_id,
-                    message.text,
-                    parse_mode="HTML" if message.entities else None
-                )
-            elif message.content_type == 'photo':
-                sent_message = self.bot.send_photo(
-                    channel_id,
-                    message.photo[-1].file_id,
-                    caption=message.caption,
-                    parse_mode="HTML" if message.caption_entities else None
-                )
-            elif message.content_type == 'video':
-                sent_message = self.bot.send_video(
-                    channel_id,
-                    message.video.file_id,
-                    caption=message.caption,
-                    parse_mode="HTML" if message.caption_entities else None
-                )
-            elif message.content_type == 'document':
-                sent_message = self.bot.send_document(
-                    channel_id,
-                    message.document.file_id,
-                    caption=message.caption,
-                    parse_mode="HTML" if message.caption_entities else None
-                )
-            elif message.content_type == 'audio':
-                sent_message = self.bot.send_audio(
-                    channel_id,
-                    message.audio.file_id,
-                    caption=message.caption,
-                    parse_mode="HTML" if message.caption_entities else None
-                )
-            elif message.content_type == 'voice':
-                sent_message = self.bot.send_voice(
-                    channel_id,
-                    message.voice.file_id,
-                    caption=message.caption,
-                    parse_mode="HTML" if message.caption_entities else None
-                )
-            elif message.content_type == 'video_note':
-                sent_message = self.bot.send_video_note(
-                    channel_id,
-                    message.video_note.file_id
-                )
-            elif message.content_type == 'sticker':
-                sent_message = self.bot.send_sticker(
-                    channel_id,
-                    message.sticker.file_id
-                )
-            else:
-                # Fallback for other message types
-                sent_message = self.bot.send_message(
-                    channel_id,
-                    f"📎 Unsupported message type: {message.content_type}"
-                )
+            # copy_message re-sends any content type with its original entities
+            # and media in a single call, without a forward header
+            sent_message = self.bot.copy_message(channel_id, message.chat.id, message.message_id)
             
             # Track the sent message ID for cleanup
             if sent_message:
-                if channel_id not in self.broadcast_message_ids:
-                    self.broadcast_message_ids[channel_id] = []
-                self.broadcast_message_ids[channel_id].append(sent_message.message_id)
-                logger.info(f"📝 Tracked message ID {sent_message.message_id} for channel {channel_id}")
+                self.broadcast_message_ids.setdefault(channel_id, []).append(sent_message.message_id)
+                logger.debug(f"📝 Tracked message ID {sent_message.message_id} for channel {channel_id}")
             
             return sent_message
                 
@@ -2296,13 +2469,17 @@ An error occurred during broadcasting.
             logger.error(f"Error sending message to channel {channel_id}: {e}")
             raise e
     
-    def _schedule_auto_actions(self, user_id: int, message, channels: List[Dict], successful_count: int):
+    def _schedule_auto_actions(self, user_id: int, message, channels: List[Dict], successful_count: int,
+                               sent_message_ids: Dict[int, List[int]]):
         """Schedule auto repost and auto delete actions"""
         try:
-            if user_id not in self.user_preferences:
+            prefs = self.user_preferences.get(user_id)
+            if not prefs:
                 return
-                
-            prefs = self.user_preferences[user_id]
+            
+            # One clock reading for every id and due time set below
+            now = datetime.now()
+            timestamp = int(now.timestamp())
             
             # Schedule auto delete if configured
             if "auto_delete_time" in prefs:
@@ -2311,27 +2488,30 @@ An error occurred during broadcasting.
                 
                 if delete_minutes > 0:  # Don't schedule for instant or never (-1)
                     # Store broadcast info for deletion
-                    broadcast_id = f"{user_id}_{int(time.time())}"
-                    self.scheduled_tasks[f"delete_{broadcast_id}"] = {
+                    broadcast_id = f"{user_id}_{timestamp}"
+                    delete_task = self.scheduled_tasks[f"delete_{broadcast_id}"] = {
                         'type': 'delete',
                         'user_id': user_id,
                         'channels': channels,
-                        'message': message,
-                        'scheduled_time': datetime.now() + timedelta(minutes=delete_minutes),
+                        'message_ids': sent_message_ids,
+                        'scheduled_time': now + timedelta(minutes=delete_minutes),
                         'successful_count': successful_count
                     }
                     
-                    # Start delete timer in background
-                    threading.Timer(
+                    # Queue the delete on the shared timer thread
+                    delete_task['timer'] = self.task_manager.call_later(
                         delete_minutes * 60,
                         self._execute_auto_delete,
-                        args=[broadcast_id]
-                    ).start()
+                        broadcast_id,
+                        name=f"delete-{broadcast_id}"
+                    )
                     
                     logger.info(f"🗑️ Auto delete scheduled for {delete_minutes} minutes for user {user_id}")
                 
                 elif delete_minutes == 0:  # Instant delete
-                    threading.Timer(5, self._execute_instant_delete, args=[channels, message]).start()
+                    self.task_manager.call_later(
+                        5, self._execute_instant_delete, sent_message_ids, name=f"instant-delete-{user_id}"
+                    )
             
             # Schedule auto repost if configured
             if "auto_repost_time" in prefs:
@@ -2340,22 +2520,23 @@ An error occurred during broadcasting.
                 
                 if repost_minutes > 0:  # Don't schedule for disabled (0)
                     # Store broadcast info for reposting
-                    broadcast_id = f"{user_id}_{int(time.time())}_repost"
-                    self.scheduled_tasks[f"repost_{broadcast_id}"] = {
+                    broadcast_id = f"{user_id}_{timestamp}_repost"
+                    repost_task = self.scheduled_tasks[f"repost_{broadcast_id}"] = {
                         'type': 'repost',
                         'user_id': user_id,
                         'channels': channels,
                         'message': message,
                         'interval_minutes': repost_minutes,
-                        'next_repost': datetime.now() + timedelta(minutes=repost_minutes)
+                        'next_repost': now + timedelta(minutes=repost_minutes)
                     }
                     
-                    # Start repost timer in background
-                    threading.Timer(
+                    # Queue the first repost on the shared timer thread
+                    repost_task['timer'] = self.task_manager.call_later(
                         repost_minutes * 60,
                         self._execute_auto_repost,
-                        args=[broadcast_id]
-                    ).start()
+                        broadcast_id,
+                        name=f"repost-{broadcast_id}"
+                    )
                     
                     logger.info(f"🔄 Auto repost scheduled every {repost_minutes} minutes for user {user_id}")
                     
@@ -2365,33 +2546,15 @@ An error occurred during broadcasting.
     def _execute_auto_delete(self, broadcast_id: str):
         """Execute auto delete for a broadcast"""
         try:
-            task_key = f"delete_{broadcast_id}"
-            if task_key not in self.scheduled_tasks:
+            task = self.scheduled_tasks.pop(f"delete_{broadcast_id}", None)
+            if task is None:
                 return
                 
-            task = self.scheduled_tasks[task_key]
             channels = task['channels']
-            message = task['message']
             user_id = task['user_id']
             
-            deleted_count = 0
-            for channel in channels:
-                try:
-                    channel_id = channel.get('channel_id')
-                    if not channel_id:
-                        continue
-                    
-                    # Delete recent messages from this channel
-                    messages_deleted = self._delete_channel_messages(channel_id)
-                    deleted_count += messages_deleted
-                    
-                    logger.info(f"🗑️ Auto deleted {messages_deleted} messages from channel {channel_id}")
-                    
-                except Exception as e:
-                    logger.error(f"Error auto-deleting from channel {channel_id}: {e}")
-            
-            # Clean up scheduled task
-            del self.scheduled_tasks[task_key]
+            # Delete exactly what this broadcast sent, every channel concurrently
+            deleted_count = self._delete_sent_messages(task['message_ids'])
             
             # Notify user about deletion
             try:
@@ -2400,12 +2563,12 @@ An error occurred during broadcasting.
 <i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
 
 <blockquote>
-✅ <b>Messages Deleted:</b> {deleted_count}
+✅ <b>Deletes Requested:</b> {deleted_count}
 📋 <b>Channels Cleaned:</b> {len(channels)}
 </blockquote>
 
 <b>🧹 What was cleaned:</b>
-┣ 🗑️ Recent messages deleted
+┣ 🗑️ Broadcast messages deleted
 ┣ ⏰ Auto delete task completed
 ┗ ✨ Channels ready for new content
 
@@ -2416,31 +2579,18 @@ An error occurred during broadcasting.
             except Exception as e:
                 logger.error(f"Error sending delete notification: {e}")
                 
-            logger.info(f"✅ Auto delete completed for broadcast {broadcast_id} - {deleted_count} messages deleted")
+            logger.info(f"✅ Auto delete completed for broadcast {broadcast_id} - {deleted_count} deletes requested")
             
         except Exception as e:
             logger.error(f"Error in auto delete execution: {e}")
     
-    def _execute_instant_delete(self, channels: List[Dict], message):
+    def _execute_instant_delete(self, sent_message_ids: Dict[int, List[int]]):
         """Execute instant delete after broadcast"""
         try:
-            deleted_count = 0
-            for channel in channels:
-                try:
-                    channel_id = channel.get('channel_id')
-                    if not channel_id:
-                        continue
+            # Delete exactly what this broadcast sent, every channel concurrently
+            deleted_count = self._delete_sent_messages(sent_message_ids)
                     
-                    # Delete recent messages from this channel
-                    messages_deleted = self._delete_channel_messages(channel_id)
-                    deleted_count += messages_deleted
-                    
-                    logger.info(f"🗑️ Instant deleted {messages_deleted} messages from channel {channel_id}")
-                    
-                except Exception as e:
-                    logger.error(f"Error instant deleting from channel {channel_id}: {e}")
-                    
-            logger.info(f"✅ Instant delete completed for {deleted_count} messages across {len(channels)} channels")
+            logger.info(f"✅ Instant delete completed, {deleted_count} deletes requested across {len(sent_message_ids)} channels")
             
         except Exception as e:
             logger.error(f"Error in instant delete execution: {e}")
@@ -2448,42 +2598,46 @@ An error occurred during broadcasting.
     def _execute_auto_repost(self, broadcast_id: str):
         """Execute auto repost for a broadcast"""
         try:
-            task_key = f"repost_{broadcast_id}"
-            if task_key not in self.scheduled_tasks:
+            task = self.scheduled_tasks.get(f"repost_{broadcast_id}")
+            if task is None:
                 return
                 
-            task = self.scheduled_tasks[task_key]
             channels = task['channels']
             message = task['message']
             user_id = task['user_id']
             interval_minutes = task['interval_minutes']
             
-            # Execute repost
+            # Execute repost, overlapping the channel sends like the initial broadcast
             reposted_count = 0
-            for channel in channels:
+            send = self._send_with_flood_retry
+            completions = bounded_as_completed(
+                self.send_executor,
+                lambda channel: send(message, channel.get('channel_id')),
+                channels,
+                BROADCAST_WORKERS * 2
+            )
+            
+            for channel, future in completions:
                 try:
-                    channel_id = channel.get('channel_id')
-                    self._send_message_to_channel(message, channel_id)
+                    future.result()
                     reposted_count += 1
-                    time.sleep(1)  # Small delay between sends
                 except Exception as e:
-                    logger.error(f"Error auto-reposting to channel {channel_id}: {e}")
+                    logger.error(f"Error auto-reposting to channel {channel.get('channel_id')}: {e}")
             
             # Schedule next repost
             task['next_repost'] = datetime.now() + timedelta(minutes=interval_minutes)
-            threading.Timer(
+            task['timer'] = self.task_manager.call_later(
                 interval_minutes * 60,
                 self._execute_auto_repost,
-                args=[broadcast_id]
-            ).start()
+                broadcast_id,
+                name=f"repost-{broadcast_id}"
+            )
             
             # Notify user about repost
             try:
                 self.bot.send_message(
                     user_id,
-                    f"🔄 <b>Auto Repost Completed</b>\n\n"
-                    f"<blockquote>Reposted to {reposted_count} channels successfully!</blockquote>\n"
-                    f"<b>Next repost:</b> {interval_minutes} minutes",
+                    _REPOST_DONE_TEMPLATE.format(reposted_count=reposted_count, interval_minutes=interval_minutes),
                     parse_mode="HTML"
                 )
             except:
@@ -2498,12 +2652,15 @@ An error occurred during broadcasting.
         """Stop all auto actions for a user"""
         try:
             tasks_to_remove = []
-            for task_key, task in self.scheduled_tasks.items():
+            for task_key, task in list(self.scheduled_tasks.items()):
                 if task.get('user_id') == user_id:
                     tasks_to_remove.append(task_key)
             
             for task_key in tasks_to_remove:
-                del self.scheduled_tasks[task_key]
+                task = self.scheduled_tasks.pop(task_key, None)
+                # Cancel the pending timer so the message and channel list are released now
+                if task and task.get('timer'):
+                    task['timer'].cancel()
                 logger.info(f"🛑 Stopped auto task: {task_key}")
                 
             if tasks_to_remove:
@@ -2514,7 +2671,7 @@ An error occurred during broadcasting.
             logger.error(f"Error stopping auto actions: {e}")
             return 0
     
-    def _stop_broadcast_and_cleanup(self, user_id):
+    def _stop_broadcast_and_cleanup(self, user_id, on_progress=None):
         """Stop ongoing broadcast and cleanup all messages"""
         try:
             # Step 1: Stop ongoing broadcast
@@ -2526,55 +2683,58 @@ An error occurred during broadcasting.
             if not channels:
                 return 0
             
-            # Step 3: Delete tracked broadcast messages from all channels
+            # Step 3: Delete tracked broadcast messages concurrently, skipping channels
+            # with nothing tracked instead of queuing a no-op for each
+            tracked_channels = [channel for channel in channels if channel.get('channel_id') in self.broadcast_message_ids]
             deleted_count = 0
-            for channel in channels:
-                channel_id = channel.get('channel_id')
-                if not channel_id:
-                    continue
-                
-                try:
-                    # Delete tracked broadcast messages for this channel
-                    messages_deleted = self._delete_tracked_messages(channel_id)
-                    deleted_count += messages_deleted
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error deleting messages from channel {channel_id}: {e}")
+            if tracked_channels:
+                deleted_count = self._delete_from_channels(tracked_channels, self._delete_tracked_messages, on_progress)
             
             # Step 4: Clear tracked message IDs
             self.broadcast_message_ids = {}
             
-            logger.info(f"🧹 Cleaned up {deleted_count} broadcast messages for user {user_id}")
+            logger.info(f"🧹 Requested deletion of {deleted_count} broadcast messages for user {user_id}")
             return deleted_count
             
         except Exception as e:
             logger.error(f"❌ Error in stop broadcast and cleanup: {e}")
             return 0
     
+    def _delete_from_channels(self, channels: List[Dict], delete_fn, on_progress=None) -> int:
+        """Run delete_fn(channel_id) for each channel on the send pool and total the deletions"""
+        channel_ids = [channel.get('channel_id') for channel in channels if channel.get('channel_id')]
+        
+        # Requests overlap on the pool; the shared rate limiter still caps the overall rate
+        deleted_count = 0
+        last_report = time.monotonic()
+        completions = bounded_as_completed(self.send_executor, delete_fn, channel_ids, BROADCAST_WORKERS * 2)
+        for done, (channel_id, future) in enumerate(completions, 1):
+            try:
+                messages_deleted = future.result()
+                deleted_count += messages_deleted
+                logger.debug(f"🗑️ Requested deletion of {messages_deleted} messages from channel {channel_id}")
+            except Exception as e:
+                logger.error(f"❌ Error deleting messages from channel {channel_id}: {e}")
+            
+            # Progress reports are Bot API edits competing with the deletes, so throttle them
+            if on_progress and time.monotonic() - last_report >= PROGRESS_UPDATE_INTERVAL:
+                on_progress(done, len(channel_ids), deleted_count)
+                last_report = time.monotonic()
+        
+        return deleted_count
+    
     def _delete_tracked_messages(self, channel_id):
         """Delete tracked broadcast messages from a channel"""
         try:
-            deleted_count = 0
-            
-            # Get tracked message IDs for this channel
-            if channel_id in self.broadcast_message_ids:
-                message_ids = self.broadcast_message_ids[channel_id]
-                logger.info(f"🗑️ Deleting {len(message_ids)} tracked messages from channel {channel_id}")
-                
-                for message_id in message_ids:
-                    try:
-                        self.bot.delete_message(channel_id, message_id)
-                        deleted_count += 1
-                        time.sleep(0.1)  # Small delay to avoid rate limits
-                        logger.info(f"✅ Deleted message {message_id} from channel {channel_id}")
-                    except Exception as e:
-                        logger.warning(f"⚠️ Could not delete message {message_id} from channel {channel_id}: {e}")
-                        continue
-                
-                # Clear tracked messages for this channel
-                del self.broadcast_message_ids[channel_id]
+            deleted_count = 0
+            
+            # Take the tracked message IDs for this channel, clearing them in the same step
+            message_ids = self.broadcast_message_ids.pop(channel_id, None)
+            if message_ids:
+                logger.debug(f"🗑️ Deleting {len(message_ids)} tracked messages from channel {channel_id}")
+                deleted_count = self._delete_message_ids(channel_id, message_ids)
             else:
-                logger.info(f"ℹ️ No tracked messages found for channel {channel_id}")
+                logger.debug(f"ℹ️ No tracked messages found for channel {channel_id}")
             
             return deleted_count
             
@@ -2582,54 +2742,39 @@ An error occurred during broadcasting.
             logger.error(f"❌ Error deleting tracked messages from channel {channel_id}: {e}")
             return 0
     
-    def _delete_channel_messages(self, channel_id):
-        """Delete recent messages from a channel"""
+    def _delete_sent_messages(self, sent_message_ids: Dict[int, List[int]]) -> int:
+        """Delete the given message IDs from each channel, channels running concurrently"""
+        channels = [{'channel_id': channel_id} for channel_id in sent_message_ids]
+        return self._delete_from_channels(
+            channels, lambda channel_id: self._delete_message_ids(channel_id, sent_message_ids[channel_id])
+        )
+    
+    def _delete_message_ids(self, channel_id, message_ids: List[int]) -> int:
+        """Delete message IDs from one channel in DELETE_BATCH_SIZE chunks"""
+        deleted_count = 0
+        # One deleteMessages call per chunk instead of one request per message
+        for start in range(0, len(message_ids), DELETE_BATCH_SIZE):
+            deleted_count += self._delete_message_batch(channel_id, message_ids[start:start + DELETE_BATCH_SIZE])
+        return deleted_count
+    
+    def _delete_message_batch(self, channel_id, message_ids: List[int]) -> int:
+        """Delete up to DELETE_BATCH_SIZE messages in one call, falling back to one at a time"""
         try:
-            deleted_count = 0
-            
-            # Since we can't get chat history directly, we'll use a different approach
-            # We'll try to delete messages by sending a message and then deleting it
-            # This ensures we have a recent message ID to work with
-            
+            # Deletes only count against the bot-wide budget
+            telegram_rate_limiter.call(self.bot.delete_messages, channel_id, message_ids)
+            # deleteMessages silently skips IDs that are already gone, so this counts requests, not confirmed deletes
+            return len(message_ids)
+        except Exception as e:
+            logger.debug(f"Bulk delete failed in channel {channel_id}, deleting individually: {e}")
+        
+        deleted_count = 0
+        for message_id in message_ids:
             try:
-                # Send a temporary message to get a recent message ID
-                temp_message = self.bot.send_message(
-                    channel_id, 
-                    "🧹 Cleaning up messages...",
-                    disable_notification=True
-                )
-                
-                if temp_message:
-                    # Delete the temporary message
-                    try:
-                        self.bot.delete_message(channel_id, temp_message.message_id)
-                        deleted_count += 1
-                    except Exception:
-                        pass
-                
-                # Now try to delete some recent messages around this ID
-                # Most message IDs are sequential, so we'll try a range
-                base_id = temp_message.message_id if temp_message else 0
-                
-                for i in range(1, 51):  # Try to delete 50 recent messages
-                    try:
-                        message_id = base_id - i
-                        if message_id > 0:  # Ensure positive message ID
-                            self.bot.delete_message(channel_id, message_id)
-                            deleted_count += 1
-                            time.sleep(0.05)  # Small delay to avoid rate limits
-                    except Exception:
-                        # Message doesn't exist or already deleted, continue
-                        continue
-                        
+                telegram_rate_limiter.call(self.bot.delete_message, channel_id, message_id)
+                deleted_count += 1
             except Exception as e:
-                logger.error(f"❌ Error deleting messages from channel {channel_id}: {e}")
-            
-            return deleted_count
-            
-        except Exception as e:
-            logger.error(f"❌ Error deleting messages from channel {channel_id}: {e}")
-            return 0
+                logger.warning(f"⚠️ Could not delete message {message_id} from channel {channel_id}: {e}")
+        return deleted_count
     
     def _handle_custom_time_input(self, user_id: int, time_text: str, state: Dict):
         """Handle custom time input from user"""
@@ -2706,17 +2851,11 @@ Please use valid time format.
                 )
             
             # Clear the state
-            del self.broadcast_states[user_id]
+            self.broadcast_states.pop(user_id, None)
             
             # Store the custom time setting
-            if user_id not in self.user_preferences:
-                self.user_preferences[user_id] = {}
-            
             preference_key = "auto_repost_time" if is_repost else "auto_delete_time"
-            self.user_preferences[user_id][preference_key] = {
-                'display': parsed_time['display'],
-                'minutes': parsed_time['minutes']
-            }
+            self._store_time_preference(user_id, preference_key, parsed_time['display'], parsed_time['minutes'])
             
             logger.info(f"User {user_id} set custom {feature_name.lower()} time: {parsed_time['display']} ({parsed_time['minutes']} minutes)")
             
@@ -2725,41 +2864,31 @@ Please use valid time format.
             self.bot.send_message(user_id, "❌ An error occurred processing your custom time.")
             
             # Clear the state on error
-            if user_id in self.broadcast_states:
-                del self.broadcast_states[user_id]
+            self.broadcast_states.pop(user_id, None)
     
     def _parse_custom_time(self, time_text: str) -> Optional[Dict]:
         """Parse custom time string and return minutes and display format"""
         try:
-            import re
-            
             time_text = time_text.lower().strip()
             total_minutes = 0
             parts = []
             
-            # Patterns for different time units
-            patterns = {
-                'days': r'(\d+)\s*(?:d|day|days)',
-                'hours': r'(\d+)\s*(?:h|hour|hours)',
-                'minutes': r'(\d+)\s*(?:m|min|minute|minutes)'
-            }
-            
             # Extract days
-            days_match = re.search(patterns['days'], time_text)
+            days_match = _DAYS_RE.search(time_text)
             if days_match:
                 days = int(days_match.group(1))
                 total_minutes += days * 24 * 60
                 parts.append(f"{days} day{'s' if days != 1 else ''}")
             
             # Extract hours
-            hours_match = re.search(patterns['hours'], time_text)
+            hours_match = _HOURS_RE.search(time_text)
             if hours_match:
                 hours = int(hours_match.group(1))
                 total_minutes += hours * 60
                 parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
             
             # Extract minutes
-            minutes_match = re.search(patterns['minutes'], time_text)
+            minutes_match = _MINUTES_RE.search(time_text)
             if minutes_match:
                 minutes = int(minutes_match.group(1))
                 total_minutes += minutes
@@ -2781,33 +2910,6 @@ Please use valid time format.
             logger.error(f"Error parsing custom time: {e}")
             return None
     
-    def _preset_to_minutes(self, time_option: str) -> int:
-        """Convert preset time option to minutes"""
-        time_minutes_map = {
-            "5min": 5,
-            "30min": 30,
-            "1hour": 60,
-            "3hour": 180,
-            "6hour": 360,
-            "12hour": 720,
-            "24hour": 1440,
-            "disable": 0
-        }
-        return time_minutes_map.get(time_option, 0)
-    
-    def _preset_delete_to_minutes(self, time_option: str) -> int:
-        """Convert preset delete time option to minutes"""
-        delete_minutes_map = {
-            "instant": 0,
-            "2min": 2,
-            "3min": 3,
-            "10min": 10,
-            "20min": 20,
-            "1hour": 60,
-            "never": -1  # Special value for never delete
-        }
-        return delete_minutes_map.get(time_option, 0)
-    
     def _handle_premium_callback(self, call):
         """Handle premium callback"""
         try:
@@ -2822,6 +2924,7 @@ Please use valid time format.
                     reply_markup=markup,
                     parse_mode="HTML"
                 )
+                self.bot.answer_callback_query(call.id, "🎁 All features are free!")
             else:
                 self.bot.answer_callback_query(call.id, "All features are free!")
                 
@@ -2830,35 +2933,55 @@ Please use valid time format.
             self.bot.answer_callback_query(call.id, "An error occurred")
     
     def _handle_admin_callback(self, call):
-        """Handle admin callback"""
+        """Handle admin callbacks that have no dedicated route"""
         try:
-            user_id = call.from_user.id
-            
-            if user_id not in ADMIN_IDS:
+            if call.from_user.id not in ADMIN_IDS:
                 self.bot.answer_callback_query(call.id, "Access denied!")
                 return
             
-            if call.data == "admin_panel":
-                # Show admin panel
-                admin_text = self._create_admin_message()
-                markup = self._create_admin_keyboard()
-                
-                self.bot.edit_message_text(
-                    admin_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "👨‍💼 Admin Panel")
-            
-            elif call.data == "admin_analytics":
-                # Show system analytics
-                from plugins.broadcast.analytics import BroadcastAnalytics
-                analytics = BroadcastAnalytics(self.db_ops)
-                system_stats = analytics.get_system_analytics()
+            self.bot.answer_callback_query(call.id, "Feature coming soon!")
                 
-                stats_text = f"""
+        except Exception as e:
+            logger.error(f"Error handling admin callback: {e}")
+            self.bot.answer_callback_query(call.id, "An error occurred")
+    
+    def _admin_only(self, handler):
+        """Wrap an admin callback handler with the access check and its error reply"""
+        @wraps(handler)
+        def guarded(call):
+            try:
+                if call.from_user.id not in ADMIN_IDS:
+                    self.bot.answer_callback_query(call.id, "Access denied!")
+                    return
+                handler(call)
+            except Exception as e:
+                logger.error(f"Error handling admin callback: {e}")
+                self.bot.answer_callback_query(call.id, "An error occurred")
+        return guarded
+    
+    def _admin_panel_callback(self, call):
+        """Show admin panel"""
+        admin_text = self._create_admin_message()
+        markup = self._create_admin_keyboard()
+        
+        self.bot.edit_message_text(
+            admin_text,
+            call.message.chat.id,
+            call.message.message_id,
+            reply_markup=markup,
+            parse_mode="HTML"
+        )
+        self.bot.answer_callback_query(call.id, "👨‍💼 Admin Panel")
+    
+    def _admin_analytics_callback(self, call):
+        """Show system analytics"""
+        user_id = call.from_user.id
+        
+        from plugins.broadcast.analytics import BroadcastAnalytics
+        analytics = BroadcastAnalytics(self.db_ops)
+        system_stats = analytics.get_system_analytics()
+        
+        stats_text = f"""
 📊 <b>System Analytics</b>
 
 <blockquote>
@@ -2869,79 +2992,75 @@ Please use valid time format.
 </blockquote>
 
 <b>Last Updated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-                """.strip()
-                
-                self.bot.send_message(user_id, stats_text, parse_mode="HTML")
-                self.bot.answer_callback_query(call.id, "Analytics loaded!")
-            
-            elif call.data == "admin_emergency_stop":
-                # Emergency stop all broadcasts
-                stopped_count = 0
-                for uid in list(self.broadcast_manager.active_broadcasts.keys()):
-                    result = self.broadcast_manager.stop_broadcast(uid)
-                    if result["success"]:
-                        stopped_count += 1
-                
-                self.bot.answer_callback_query(call.id, f"Stopped {stopped_count} broadcasts")
-            
-            elif call.data == "admin_users":
-                # User management
-                users = self.db_ops.get_all_users()
-                total_users = len(users)
-                active_users = len([u for u in users if u.get('is_active', True)])
-                
-                users_text = f"""
-👥 <b>User Management</b>
-<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
-
-<blockquote>
-📊 <b>User Statistics</b>
-</blockquote>
-
-<b>📈 User Metrics:</b>
-┣ 👥 <b>Total Users:</b> {total_users}
-┣ ✅ <b>Active Users:</b> {active_users}
-┣ ❌ <b>Inactive Users:</b> {total_users - active_users}
-┗ 📊 <b>Activity Rate:</b> {int((active_users/total_users)*100) if total_users > 0 else 0}%
-
-<b>🕐 Recent Users (Last 5):</b>
-                """.strip()
-                
-                for i, user in enumerate(users[-5:], 1):
-                    username = user.get('username', 'N/A')
-                    first_name = user.get('first_name', 'Unknown')
-                    user_id_display = user.get('user_id', 'N/A')
-                    users_text += f"\n{i}. <b>{first_name}</b> (@{username}) - ID: <code>{user_id_display}</code>"
-                
-                markup = types.InlineKeyboardMarkup()
-                markup.add(
-                    types.InlineKeyboardButton("📊 Detailed Stats", callback_data="admin_detailed_stats"),
-                    types.InlineKeyboardButton("📥 Export Data", callback_data="admin_export_data")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("🔙 Back to Admin", callback_data="admin_panel")
-                )
-                
-                self.bot.edit_message_text(
-                    users_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "👥 User management loaded!")
-            
-            elif call.data == "admin_controls":
-                # System controls
-                import psutil
-                import platform
-                
-                # Get system info
-                cpu_percent = psutil.cpu_percent(interval=1)
-                memory = psutil.virtual_memory()
-                disk = psutil.disk_usage('/')
-                
-                controls_text = f"""
+        """.strip()
+        
+        self.bot.send_message(user_id, stats_text, parse_mode="HTML")
+        self.bot.answer_callback_query(call.id, "Analytics loaded!")
+    
+    def _admin_emergency_stop_callback(self, call):
+        """Emergency stop all broadcasts"""
+        stopped_users = []
+        for uid in list(self.broadcast_manager.active_broadcasts.keys()):
+            result = self.broadcast_manager.stop_broadcast(uid)
+            if result["success"]:
+                stopped_users.append(uid)
+        stopped_count = len(stopped_users)
+        
+        self.bot.answer_callback_query(call.id, f"Stopped {stopped_count} broadcasts")
+    
+    def _admin_users_callback(self, call):
+        """Show user management"""
+        overview = self.db_ops.get_user_overview(recent_limit=5)
+        total_users = overview["total_users"]
+        active_users = overview["active_users"]
+        
+        users_text = _ADMIN_USERS_TEMPLATE.format(
+            total_users=total_users,
+            active_users=active_users,
+            inactive_users=total_users - active_users,
+            activity_rate=int((active_users / total_users) * 100) if total_users > 0 else 0
+        )
+        
+        # Names are user-controlled text going into HTML
+        users_text += "".join(
+            _ADMIN_RECENT_USER_LINE.format(
+                index=i,
+                first_name=html_escape(user.get('first_name') or 'Unknown'),
+                username=html_escape(user.get('username') or 'N/A'),
+                user_id=user.get('user_id', 'N/A')
+            )
+            for i, user in enumerate(overview["recent_users"], 1)
+        )
+        
+        markup = types.InlineKeyboardMarkup()
+        markup.add(
+            types.InlineKeyboardButton("📊 Detailed Stats", callback_data="admin_detailed_stats"),
+            types.InlineKeyboardButton("📥 Export Data", callback_data="admin_export_data")
+        )
+        markup.add(
+            types.InlineKeyboardButton("🔙 Back to Admin", callback_data="admin_panel")
+        )
+        
+        self.bot.edit_message_text(
+            users_text,
+            call.message.chat.id,
+            call.message.message_id,
+            reply_markup=markup,
+            parse_mode="HTML"
+        )
+        self.bot.answer_callback_query(call.id, "👥 User management loaded!")
+    
+    def _admin_controls_callback(self, call):
+        """Show system controls"""
+        import psutil
+        import platform
+        
+        # Get system info
+        cpu_percent = psutil.cpu_percent(interval=1)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        
+        controls_text = f"""
 🔧 <b>System Controls</b>
 <i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
 
@@ -2962,35 +3081,35 @@ Please use valid time format.
 ┣ 🛑 <b>Emergency Stop</b> - Stop all broadcasts
 ┣ 📋 <b>View Logs</b> - Check system logs
 ┗ 🧹 <b>Cleanup</b> - Clean temporary data
-                """.strip()
-                
-                markup = types.InlineKeyboardMarkup(row_width=2)
-                markup.add(
-                    types.InlineKeyboardButton("🔄 Restart Bot", callback_data="admin_restart"),
-                    types.InlineKeyboardButton("📋 View Logs", callback_data="admin_logs")
-                )
-                markup.add(
-                    types.InlineKeyboardButton("🧹 Cleanup Data", callback_data="admin_cleanup"),
-                    types.InlineKeyboardButton("🔙 Back", callback_data="admin_panel")
-                )
+        """.strip()
+        
+        markup = types.InlineKeyboardMarkup(row_width=2)
+        markup.add(
+            types.InlineKeyboardButton("🔄 Restart Bot", callback_data="admin_restart"),
+            types.InlineKeyboardButton("📋 View Logs", callback_data="admin_logs")
+        )
+        markup.add(
+            types.InlineKeyboardButton("🧹 Cleanup Data", callback_data="admin_cleanup"),
+            types.InlineKeyboardButton("🔙 Back", callback_data="admin_panel")
+        )
+        
+        self.bot.edit_message_text(
+            controls_text,
+            call.message.chat.id,
+            call.message.message_id,
+            reply_markup=markup,
+            parse_mode="HTML"
+        )
+        self.bot.answer_callback_query(call.id, "🔧 System controls loaded!")
+    
+    def _admin_logs_callback(self, call):
+        """Show recent logs"""
+        try:
+            with open('bot.log', 'r', encoding='utf-8') as log_file:
+                logs = log_file.readlines()
+                recent_logs = logs[-20:]  # Last 20 lines
                 
-                self.bot.edit_message_text(
-                    controls_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "🔧 System controls loaded!")
-            
-            elif call.data == "admin_logs":
-                # View logs
-                try:
-                    with open('bot.log', 'r', encoding='utf-8') as log_file:
-                        logs = log_file.readlines()
-                        recent_logs = logs[-20:]  # Last 20 lines
-                        
-                    logs_text = f"""
+            logs_text = f"""
 📋 <b>System Logs</b>
 <i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
 
@@ -3008,10 +3127,10 @@ Please use valid time format.
 ┗ 📋 <b>Showing:</b> Last 10 entries
 
 💡 <b>Tip:</b> Check logs regularly for issues!
-                    """.strip()
-                    
-                except Exception as e:
-                    logs_text = f"""
+            """.strip()
+            
+        except Exception as e:
+            logs_text = f"""
 📋 <b>System Logs</b>
 <i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
 
@@ -3023,26 +3142,26 @@ Please use valid time format.
 {str(e)}
 
 💡 <b>Tip:</b> Log file might not exist or be accessible.
-                    """.strip()
-                
-                markup = types.InlineKeyboardMarkup()
-                markup.add(
-                    types.InlineKeyboardButton("🔄 Refresh", callback_data="admin_logs"),
-                    types.InlineKeyboardButton("🔙 Back", callback_data="admin_controls")
-                )
-                
-                self.bot.edit_message_text(
-                    logs_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "📋 Logs loaded!")
-            
-            elif call.data == "admin_restart":
-                # Restart bot
-                restart_text = """
+            """.strip()
+        
+        markup = types.InlineKeyboardMarkup()
+        markup.add(
+            types.InlineKeyboardButton("🔄 Refresh", callback_data="admin_logs"),
+            types.InlineKeyboardButton("🔙 Back", callback_data="admin_controls")
+        )
+        
+        self.bot.edit_message_text(
+            logs_text,
+            call.message.chat.id,
+            call.message.message_id,
+            reply_markup=markup,
+            parse_mode="HTML"
+        )
+        self.bot.answer_callback_query(call.id, "📋 Logs loaded!")
+    
+    def _admin_restart_callback(self, call):
+        """Restart the bot"""
+        restart_text = """
 🔄 <b>Bot Restart Initiated</b>
 <i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
 
@@ -3058,122 +3177,111 @@ Bot is restarting... Please wait.
 ┗ ✅ <b>Step 4:</b> Resuming operations
 
 💡 <b>The bot will be back online in a few seconds!</b>
-                """.strip()
-                
-                self.bot.edit_message_text(
-                    restart_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "🔄 Restarting bot...")
-                
-                # Restart the bot process
-                import sys
-                import os
-                logger.info("🔄 Admin initiated bot restart")
-                os.execv(sys.executable, ['python'] + sys.argv)
-            
-            elif call.data == "admin_detailed_stats":
-                # Detailed statistics
-                db_stats = self.db_ops.get_database_stats()
-                
-                detailed_text = f"""
-📊 <b>Detailed System Statistics</b>
-<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
-
-<blockquote>
-📈 <b>Comprehensive Analytics</b>
-</blockquote>
-
-<b>👥 User Statistics:</b>
-┣ 📊 <b>Total Users:</b> {db_stats.get('total_users', 0)}
-┣ 🆕 <b>New Today:</b> {db_stats.get('new_users_today', 0)}
-┣ 🔄 <b>Active Users:</b> {db_stats.get('active_users', 0)}
-┗ 📈 <b>Growth Rate:</b> {db_stats.get('growth_rate', 0)}%
-
-<b>📺 Channel Statistics:</b>
-┣ 📊 <b>Total Channels:</b> {db_stats.get('total_channels', 0)}
-┣ ✅ <b>Active Channels:</b> {db_stats.get('active_channels', 0)}
-┣ 🔗 <b>Connected Channels:</b> {db_stats.get('connected_channels', 0)}
-┗ 📈 <b>Channel Growth:</b> {db_stats.get('channel_growth', 0)}%
-
-<b>📡 Broadcast Statistics:</b>
-┣ 📊 <b>Total Broadcasts:</b> {db_stats.get('total_broadcasts', 0)}
-┣ ✅ <b>Successful:</b> {db_stats.get('successful_broadcasts', 0)}
-┣ ❌ <b>Failed:</b> {db_stats.get('failed_broadcasts', 0)}
-┗ 📈 <b>Success Rate:</b> {db_stats.get('success_rate', 0)}%
-
-<b>📊 Database Statistics:</b>
-┣ 📄 <b>Analytics Entries:</b> {db_stats.get('analytics_entries', 0)}
-┣ 💾 <b>DB Size:</b> {db_stats.get('db_size', 'Unknown')}
-┗ 🕐 <b>Last Updated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-                """.strip()
-                
-                markup = types.InlineKeyboardMarkup()
-                markup.add(
-                    types.InlineKeyboardButton("🔄 Refresh", callback_data="admin_detailed_stats"),
-                    types.InlineKeyboardButton("🔙 Back", callback_data="admin_users")
-                )
-                
-                self.bot.edit_message_text(
-                    detailed_text,
+        """.strip()
+        
+        self.bot.edit_message_text(
+            restart_text,
+            call.message.chat.id,
+            call.message.message_id,
+            parse_mode="HTML"
+        )
+        self.bot.answer_callback_query(call.id, "🔄 Restarting bot...")
+        
+        # End polling so main() can shut down cleanly and then re-exec in place
+        logger.info("🔄 Admin initiated bot restart")
+        self.restart_requested = True
+        self.request_stop()
+    
+    def _admin_detailed_stats_callback(self, call):
+        """Show detailed statistics"""
+        db_stats = self.db_ops.get_database_stats()
+        
+        # get_database_stats returns raw collection counts; figures it does not track show 0
+        detailed_text = _DETAILED_STATS_TEMPLATE.format(
+            total_users=db_stats.get(USERS_COLLECTION, 0),
+            new_users_today=0,
+            active_users=0,
+            growth_rate=0,
+            total_channels=db_stats.get(CHANNELS_COLLECTION, 0),
+            active_channels=0,
+            connected_channels=0,
+            channel_growth=0,
+            total_broadcasts=db_stats.get(BROADCASTS_COLLECTION, 0),
+            successful_broadcasts=0,
+            failed_broadcasts=0,
+            success_rate=0,
+            analytics_entries=db_stats.get(ANALYTICS_COLLECTION, 0),
+            db_size='Unknown',
+            last_updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
+        
+        markup = types.InlineKeyboardMarkup()
+        markup.add(
+            types.InlineKeyboardButton("🔄 Refresh", callback_data="admin_detailed_stats"),
+            types.InlineKeyboardButton("🔙 Back", callback_data="admin_users")
+        )
+        
+        self.bot.edit_message_text(
+            detailed_text,
+            call.message.chat.id,
+            call.message.message_id,
+            reply_markup=markup,
+            parse_mode="HTML"
+        )
+        self.bot.answer_callback_query(call.id, "📊 Detailed stats loaded!")
+    
+    @staticmethod
+    def _dump_json_array(f, items) -> int:
+        """Write items to f as a JSON array one element at a time and return how many were written"""
+        count = 0
+        f.write("[")
+        for item in items:
+            f.write(",\n    " if count else "\n    ")
+            f.write(json.dumps(item, ensure_ascii=False, default=str))
+            count += 1
+        f.write("\n  ]" if count else "]")
+        return count
+    
+    def _admin_export_data_callback(self, call):
+        """Export bot data as a JSON document"""
+        self.bot.answer_callback_query(call.id, "📥 Preparing export...")
+        
+        try:
+            # Create JSON file
+            export_filename = f"bbbot_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            
+            # Write straight from the cursors so the export never holds every document at once
+            with open(export_filename, 'w', encoding='utf-8') as f:
+                f.write('{\n  "users": ')
+                user_count = self._dump_json_array(f, self.db_ops.iter_all_users())
+                f.write(',\n  "channels": ')
+                channel_count = self._dump_json_array(f, self.db_ops.iter_all_channels())
+                f.write(',\n  "broadcasts": [],\n  "analytics": [],\n')
+                f.write(f'  "exported_at": {json.dumps(datetime.now().isoformat())}\n}}\n')
+            
+            # Send file
+            with open(export_filename, 'rb') as f:
+                self.bot.send_document(
                     call.message.chat.id,
-                    call.message.message_id,
-                    reply_markup=markup,
-                    parse_mode="HTML"
-                )
-                self.bot.answer_callback_query(call.id, "📊 Detailed stats loaded!")
-            
-            elif call.data == "admin_export_data":
-                # Export data
-                self.bot.answer_callback_query(call.id, "📥 Preparing export...")
-                
-                try:
-                    # Generate export data
-                    export_data = {
-                        "users": self.db_ops.get_all_users(),
-                        "channels": [],
-                        "broadcasts": [],
-                        "analytics": [],
-                        "exported_at": datetime.now().isoformat()
-                    }
-                    
-                    # Get channels for all users
-                    for user in export_data["users"]:
-                        user_channels = self.db_ops.get_user_channels(user.get('user_id'))
-                        export_data["channels"].extend(user_channels)
-                    
-                    # Create JSON file
-                    import json
-                    export_filename = f"bbbot_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                    
-                    with open(export_filename, 'w', encoding='utf-8') as f:
-                        json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
-                    
-                    # Send file
-                    with open(export_filename, 'rb') as f:
-                        self.bot.send_document(
-                            call.message.chat.id,
-                            f,
-                            caption=f"""
+                    f,
+                    caption=f"""
 📥 <b>Data Export Complete</b>
 
 <b>📊 Export Summary:</b>
-• 👥 Users: {len(export_data['users'])}
-• 📺 Channels: {len(export_data['channels'])}
+• 👥 Users: {user_count}
+• 📺 Channels: {channel_count}
 • 🕐 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 💾 <b>File contains all bot data in JSON format.</b>
-                            """.strip(),
-                            parse_mode="HTML"
-                        )
-                    
-                    # Clean up file
-                    os.remove(export_filename)
-                    
-                except Exception as e:
-                    error_text = f"""
+                    """.strip(),
+                    parse_mode="HTML"
+                )
+            
+            # Clean up file
+            os.remove(export_filename)
+            
+        except Exception as e:
+            error_text = f"""
 ❌ <b>Export Failed</b>
 <i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>
 
@@ -3185,16 +3293,9 @@ Bot is restarting... Please wait.
 {str(e)}
 
 💡 <b>Try again or contact support.</b>
-                    """.strip()
-                    
-                    self.bot.send_message(call.message.chat.id, error_text, parse_mode="HTML")
+            """.strip()
             
-            else:
-                self.bot.answer_callback_query(call.id, "Feature coming soon!")
-                
-        except Exception as e:
-            logger.error(f"Error handling admin callback: {e}")
-            self.bot.answer_callback_query(call.id, "An error occurred")
+            self.bot.send_message(call.message.chat.id, error_text, parse_mode="HTML")
     
     def _handle_main_menu_callback(self, call):
         """Handle main menu callback"""
@@ -3223,10 +3324,15 @@ Bot is restarting... Please wait.
             user_id = call.from_user.id
             data = call.data
             
-            if data == "my_channels":
+            if data == "my_channels" or data.startswith("channels_page_"):
+                # Served from the short-lived channel cache, so paging costs no query
                 channels = self.db_ops.get_user_channels(user_id)
-                channels_text = self._create_channels_list_message(channels)
-                markup = self._create_channels_keyboard()
+                total_pages = self._channel_page_count(channels)
+                page = int(data[len("channels_page_"):]) if data.startswith("channels_page_") else 0
+                page = min(max(page, 0), total_pages - 1)
+                
+                channels_text = self._create_channels_list_message(channels, page)
+                markup = self._create_channels_keyboard(page, total_pages)
                 
                 self.bot.edit_message_text(
                     channels_text,
@@ -3291,19 +3397,58 @@ All features are automatically available.
             self.bot.answer_callback_query(call.id, "An error occurred")
     
     def start_polling(self):
-        """Start bot polling"""
+        """Start bot polling and block until a stop is requested"""
+        logger.info(f"🚀 Starting Advanced Broadcast Bot by {protected_branding.get_developer_name()}...")
+        self.broadcast_scheduler.start()
+        self.task_manager.spawn(self._supervise_polling, name="polling")
+        
+        # Keep the main thread free to receive signals
+        while not self.polling_stop_event.wait(1):
+            pass
+    
+    def _supervise_polling(self):
+        """Run the polling loop, restarting it with exponential backoff on failure"""
+        delay = POLLING_RESTART_MIN_DELAY
         try:
-            logger.info(f"🚀 Starting Advanced Broadcast Bot by {protected_branding.get_developer_name()}...")
-            self.bot.infinity_polling(none_stop=True, timeout=60, long_polling_timeout=60)
-        except Exception as e:
-            logger.error(f"❌ Bot polling error: {e}")
-            raise
+            while not self.polling_stop_event.is_set():
+                started = time.monotonic()
+                try:
+                    # infinity_polling swallows errors and loops by itself; with non_stop=False
+                    # a failure ends this call, so the backoff below actually handles it
+                    self.bot.polling(non_stop=False, timeout=60, long_polling_timeout=60)
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except Exception as e:
+                    logger.error(f"❌ Bot polling error: {e}")
+                
+                if self.polling_stop_event.is_set():
+                    break
+                
+                # A long healthy run means the next failure starts from a short delay again
+                if time.monotonic() - started > POLLING_RESTART_MAX_DELAY:
+                    delay = POLLING_RESTART_MIN_DELAY
+                
+                logger.warning(f"⚠️ Polling stopped unexpectedly, restarting in {delay}s")
+                self.polling_stop_event.wait(delay)
+                delay = min(delay * 2, POLLING_RESTART_MAX_DELAY)
+        finally:
+            self.polling_stop_event.set()
+    
+    def request_stop(self):
+        """Ask the polling supervisor to stop"""
+        self.polling_stop_event.set()
+        self.bot.stop_polling()
     
     def stop(self):
         """Stop bot gracefully"""
         try:
             logger.info("🛑 Stopping bot...")
+            self.request_stop()
+            self.broadcast_scheduler.stop()
+            self.task_manager.stop()
             self.broadcast_manager.shutdown()
+            self.channel_detector.shutdown()
+            self.send_executor.shutdown(wait=False, cancel_futures=True)
             self.db_connection.disconnect()
             logger.info("✅ Bot stopped successfully")
         except Exception as e:
@@ -3311,19 +3456,34 @@ All features are automatically available.
 
 def main():
     """Main function"""
+    bot = None
     try:
         # Validate configuration
         validate_config()
         
         # Create and start bot
         bot = AdvancedBroadcastBot()
+        
+        # SIGTERM (dyno restarts) ends polling so the shutdown below runs
+        signal.signal(signal.SIGTERM, lambda signum, frame: bot.request_stop())
+        
         bot.start_polling()
         
     except KeyboardInterrupt:
         logger.info("🛑 Bot stopped by user")
     except Exception as e:
-        logger.error(f"❌ Fatal error: {e}")
+        logger.exception("❌ Bot crashed: %s", e)
         sys.exit(1)
+    finally:
+        if bot is not None:
+            bot.stop()
+        stop_log_listeners()
+        
+        # An admin restart replaces this process once buffers, pools and the Mongo client are closed
+        if bot is not None and bot.restart_requested:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, [sys.executable] + sys.argv)
 
 if __name__ == "__main__":
     main()
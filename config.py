@@ -23,7 +23,8 @@ if not BOT_TOKEN:
 ADMIN_IDS_STR = os.getenv("ADMIN_IDS", "")
 if not ADMIN_IDS_STR:
     raise ValueError("ADMIN_IDS not found in environment variables!")
-ADMIN_IDS = [int(admin_id.strip()) for admin_id in ADMIN_IDS_STR.split(",") if admin_id.strip().isdigit()]
+# A set, since it is only ever used for membership checks on incoming updates
+ADMIN_IDS = frozenset(int(admin_id.strip()) for admin_id in ADMIN_IDS_STR.split(",") if admin_id.strip().isdigit())
 
 # Owner Configuration (for premium activation)
 OWNER_ID = int(os.getenv("OWNER_ID", "0"))
@@ -38,6 +39,19 @@ if not MONGO_URL:
     raise ValueError("MONGO_URL not found in environment variables!")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "telegram_broadcast_bot")
 
+# Connection Settings
+MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "zstd,zlib")  # Wire compression, first supported wins
+MONGO_MAX_POOL_SIZE = 100  # Room for concurrent broadcast workers
+MONGO_CURSOR_BATCH_SIZE = 500  # Documents per getMore when streaming large result sets
+MONGO_IN_CHUNK_SIZE = 1000  # Ids per $in filter in bulk writes, well under the 16 MB command limit
+
+# Operation Timeouts (seconds)
+MONGO_OPERATION_TIMEOUT = 2  # Non-critical writes such as analytics counters
+MONGO_STARTUP_TIMEOUT = 3  # Index creation on startup
+
+# Read Caching (seconds)
+CHANNEL_CACHE_TTL = 60  # User channel lists, dropped early when a channel is added
+
 # Collection Names
 USERS_COLLECTION = "users"
 CHANNELS_COLLECTION = "channels"
@@ -55,6 +69,19 @@ BOT_MESSAGES_COLLECTION = "bot_messages"
 API_ID = os.getenv("API_ID")
 API_HASH = os.getenv("API_HASH")
 
+# HTTP connection pool for Bot API calls
+TELEGRAM_POOL_CONNECTIONS = 16
+TELEGRAM_POOL_MAXSIZE = 32  # Raised to BROADCAST_WORKERS if the shared send pool is larger
+TELEGRAM_CONNECT_TIMEOUT = 5  # seconds
+TELEGRAM_READ_TIMEOUT = 15  # seconds; long polling adds its own allowance
+TELEGRAM_CONNECT_RETRIES = 2  # Reconnect attempts; requests that reached Telegram are never resent
+
+# Cache lifetime for resolved chat lookups (seconds)
+CHAT_CACHE_TTL = 600
+
+# Parallel get_chat lookups when resolving several links at once
+LINK_RESOLVE_WORKERS = 8
+
 # =============================================================================
 # BROADCAST CONFIGURATION
 # =============================================================================
@@ -67,10 +94,24 @@ MAX_BROADCAST_SIZE = 1000
 BROADCAST_DELAY = 1  # Delay between broadcasts (seconds)
 MAX_CONCURRENT_BROADCASTS = 5
 BROADCAST_TIMEOUT = 30  # Timeout for individual broadcasts
+BROADCAST_WORKERS = int(os.getenv("BROADCAST_WORKERS", "32"))  # Threads in the shared channel-send pool
+PROGRESS_UPDATE_INTERVAL = 1.5  # Seconds between progress message redraws
+
+# Per-user conversation state (pending broadcasts, preferences)
+USER_STATE_MAX_ENTRIES = 10000  # Least recently used users are evicted beyond this
+USER_STATE_TTL = 3600  # Abandoned state expires after this many seconds
 
 # Auto Operations
 AUTO_DELETE_OPTIONS = [5, 10, 15, 30, 60, 120, 360, 720, 1440, 2880, 4320, 10080]  # minutes
 AUTO_REPOST_OPTIONS = [5, 10, 15, 30, 60, 120, 360, 720, 1440, 2880, 4320, 10080]  # minutes
+DELETE_BATCH_SIZE = 100  # Message ids per deleteMessages call (Bot API maximum)
+
+# Scheduler Polling
+SCHEDULER_MIN_INTERVAL = 1.0  # seconds between polls while jobs are due
+SCHEDULER_MAX_INTERVAL = 30.0  # upper bound for the idle back-off
+SCHEDULER_BACKOFF = 1.5  # growth factor applied after each idle poll
+SCHEDULER_DEADLINE_CAP = 60.0  # longest sleep before re-checking for new deadlines
+TIMER_WORKERS = BROADCAST_WORKERS  # Threads that run due auto repost/delete jobs; long jobs must not hold every slot
 
 # =============================================================================
 # FREE FEATURES CONFIGURATION
@@ -104,6 +145,8 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # Rate Limiting
 RATE_LIMIT_PER_USER = 10  # Max requests per minute per user
 RATE_LIMIT_PER_CHANNEL = 5  # Max broadcasts per minute per channel
+TELEGRAM_GLOBAL_RATE = 30  # Max Bot API sends per second across all chats
+TELEGRAM_PER_CHAT_RATE = 20  # Max Bot API sends per minute to a single chat
 
 # Security Settings
 ENABLE_RATE_LIMITING = True
@@ -117,6 +160,7 @@ ENABLE_AUTO_CLEANUP = True
 # Button Layout
 BUTTONS_PER_ROW = 2
 MAX_BUTTONS_PER_MESSAGE = 8
+CHANNELS_PER_PAGE = 10  # Channel list entries per page; Prev/Next edit in place
 
 # Message Limits
 MAX_MESSAGE_LENGTH = 4096
@@ -157,6 +201,10 @@ MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 TIMEOUT_DURATION = 30  # seconds
 
+# Polling Supervisor
+POLLING_RESTART_MIN_DELAY = 1  # seconds before the first restart
+POLLING_RESTART_MAX_DELAY = 60  # cap for the exponential restart backoff
+
 # Error Messages
 ERROR_MESSAGES = {
     "no_channels": "❌ **No channels found!**\n\nPlease add channels first using /add command.",
@@ -35,14 +35,12 @@ class BroadcastAnalytics:
                                    successful_sends: int, failed_sends: int) -> bool:
         """Record broadcast completion"""
         try:
-            # Record completion
-            self.db_ops.update_analytics(user_id, "broadcasts_completed", 1)
-            
-            # Record message stats
-            self.db_ops.update_analytics(user_id, "messages_sent", successful_sends)
-            self.db_ops.update_analytics(user_id, "messages_failed", failed_sends)
-            
-            return True
+            # Completion and message stats land on the same daily document
+            return self.db_ops.update_analytics_many(user_id, {
+                "broadcasts_completed": 1,
+                "messages_sent": successful_sends,
+                "messages_failed": failed_sends
+            })
         except Exception as e:
             logger.error(f"❌ Error recording broadcast completion: {e}")
             return False
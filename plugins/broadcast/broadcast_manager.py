@@ -8,22 +8,24 @@ import logging
 import threading
 import time
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Dict, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue, Empty
 import uuid
 
 from ..database.models import BroadcastModel, generate_broadcast_id
 from ..database.operations import DatabaseOperations
 from .message_sender import MessageSender
-from config import MAX_CONCURRENT_BROADCASTS, BROADCAST_DELAY
+from ..utils.task_manager import bounded_as_completed
+from config import MAX_CONCURRENT_BROADCASTS, BROADCAST_WORKERS
 
 logger = logging.getLogger(__name__)
 
 class BroadcastManager:
     """Enhanced broadcast manager with threading and queue management"""
     
-    def __init__(self, bot, db_ops: DatabaseOperations):
+    def __init__(self, bot, db_ops: DatabaseOperations, send_executor: ThreadPoolExecutor):
         self.bot = bot
         self.db_ops = db_ops
         self.message_sender = MessageSender(bot, db_ops)
@@ -36,6 +38,9 @@ class BroadcastManager:
         # Thread pool for concurrent broadcasts
         self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BROADCASTS)
         
+        # The bot's pool for per-channel sends; owned and shut down by the bot
+        self.send_executor = send_executor
+        
         # Shutdown flag
         self._shutdown = False
         
@@ -133,45 +138,56 @@ class BroadcastManager:
             
             successful_sends = 0
             failed_sends = 0
+            completed_channels = 0
+            
+            # Everything except the channel is fixed for this broadcast, so bind it once
+            send_to_channel = partial(
+                self.message_sender.send_message,
+                message_data=message_data,
+                user_id=user_id,
+                broadcast_id=broadcast_id,
+                settings=settings,
+                handler=self.message_sender.get_handler(message_data)
+            )
+            
+            # Send concurrently on the shared send pool with a bounded number queued,
+            # so large channel lists do not materialise a future per channel up front
+            completions = bounded_as_completed(
+                self.send_executor,
+                lambda channel: send_to_channel(channel_id=channel["channel_id"]),
+                channels,
+                BROADCAST_WORKERS * 2
+            )
             
-            # Send to each channel
-            for i, channel in enumerate(channels):
-                if self._shutdown or user_id not in self.active_broadcasts:
+            for channel, future in completions:
+                broadcast_info = self.active_broadcasts.get(user_id)
+                if self._shutdown or broadcast_info is None:
                     logger.info(f"🛑 Broadcast {broadcast_id} stopped by user or shutdown")
+                    completions.close()
                     break
                 
                 try:
-                    # Send message to channel
-                    result = self.message_sender.send_message(
-                        channel_id=channel["channel_id"],
-                        message_data=message_data,
-                        user_id=user_id,
-                        broadcast_id=broadcast_id,
-                        settings=settings
-                    )
+                    result = future.result()
                     
                     if result["success"]:
                         successful_sends += 1
-                        logger.info(f"✅ Message sent to {channel['channel_name']}")
+                        logger.debug(f"✅ Message sent to {channel['channel_name']}")
                     else:
                         failed_sends += 1
                         logger.warning(f"❌ Failed to send to {channel['channel_name']}: {result['error']}")
-                    
-                    # Update progress
-                    self.active_broadcasts[user_id]["completed_channels"] = i + 1
-                    self.active_broadcasts[user_id]["successful_sends"] = successful_sends
-                    self.active_broadcasts[user_id]["failed_sends"] = failed_sends
-                    
-                    # Delay between sends
-                    if i < len(channels) - 1:  # Don't delay after last message
-                        time.sleep(BROADCAST_DELAY)
                         
                 except Exception as e:
                     failed_sends += 1
                     logger.error(f"❌ Error sending to channel {channel.get('channel_name', 'Unknown')}: {e}")
+                
+                # Update progress
+                completed_channels += 1
+                broadcast_info["completed_channels"] = completed_channels
+                broadcast_info["successful_sends"] = successful_sends
+                broadcast_info["failed_sends"] = failed_sends
             
-            # Update final status
-            if user_id in self.active_broadcasts:
+            # Update final status; pop so a concurrent stop cannot also clean up
+            if self.active_broadcasts.pop(user_id, None) is not None:
                 final_status = "completed" if successful_sends > 0 else "failed"
                 
                 self.db_ops.update_broadcast_status(
@@ -184,27 +200,23 @@ class BroadcastManager:
                 # Send completion notification
                 self._send_completion_notification(user_id, broadcast_id, successful_sends, failed_sends)
                 
-                # Clean up
-                del self.active_broadcasts[user_id]
-                
                 logger.info(f"✅ Broadcast {broadcast_id} completed: {successful_sends} sent, {failed_sends} failed")
                 
         except Exception as e:
             logger.error(f"❌ Error executing broadcast {broadcast_id}: {e}")
-            if user_id in self.active_broadcasts:
+            if self.active_broadcasts.pop(user_id, None) is not None:
                 self.db_ops.update_broadcast_status(broadcast_id, "failed", error_details={"error": str(e)})
-                del self.active_broadcasts[user_id]
     
     def stop_broadcast(self, user_id: int) -> Dict[str, Any]:
         """Stop active broadcast for user"""
         try:
-            if user_id not in self.active_broadcasts:
+            broadcast_info = self.active_broadcasts.pop(user_id, None)
+            if broadcast_info is None:
                 return {
                     "success": False,
                     "message": "❌ No active broadcast found to stop."
                 }
             
-            broadcast_info = self.active_broadcasts[user_id]
             broadcast_id = broadcast_info["broadcast_id"]
             
             # Cancel the thread
@@ -214,9 +226,6 @@ class BroadcastManager:
             # Update database
             self.db_ops.update_broadcast_status(broadcast_id, "cancelled")
             
-            # Clean up
-            del self.active_broadcasts[user_id]
-            
             return {
                 "success": True,
                 "message": f"🛑 Broadcast stopped. Sent to {broadcast_info['successful_sends']} channels."
@@ -232,8 +241,8 @@ class BroadcastManager:
     def get_broadcast_status(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get current broadcast status for user"""
         try:
-            if user_id in self.active_broadcasts:
-                broadcast_info = self.active_broadcasts[user_id]
+            broadcast_info = self.active_broadcasts.get(user_id)
+            if broadcast_info is not None:
                 
                 # Calculate progress
                 progress = 0
@@ -307,7 +316,7 @@ class BroadcastManager:
                         users_to_remove.append(user_id)
             
             for user_id in users_to_remove:
-                del self.active_broadcasts[user_id]
+                self.active_broadcasts.pop(user_id, None)
                 logger.info(f"🧹 Cleaned up completed broadcast for user {user_id}")
                 
         except Exception as e:
@@ -330,7 +339,7 @@ class BroadcastManager:
         for user_id in list(self.active_broadcasts.keys()):
             self.stop_broadcast(user_id)
         
-        # Shutdown thread pool
+        # Shutdown the broadcast pool; the send pool belongs to the bot
         self.executor.shutdown(wait=True)
         
         logger.info("✅ Broadcast Manager shutdown complete")
\ No newline at end of file
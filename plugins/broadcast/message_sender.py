@@ -11,12 +11,16 @@ from typing import Dict, List, Optional, Any
 import telebot
 from telebot.apihelper import ApiTelegramException
 
-from ..database.models import generate_message_id
+from ..database.models import BroadcastMessageModel, generate_message_id
 from ..database.operations import DatabaseOperations
+from ..utils.rate_limiter import telegram_rate_limiter
 from config import MAX_RETRIES, RETRY_DELAY, TIMEOUT_DURATION
 
 logger = logging.getLogger(__name__)
 
+# Forbidden / Bad Request: retrying the same call cannot succeed
+_PERMANENT_ERROR_CODES = frozenset((400, 403))
+
 class MessageSender:
     """Enhanced message sender with retry logic and comprehensive error handling"""
     
@@ -39,36 +43,35 @@ class MessageSender:
         
         logger.info("✅ Message Sender initialized")
     
+    def get_handler(self, message_data: Dict[str, Any]):
+        """Get the send handler for a message's content type"""
+        return self.message_handlers.get(message_data.get("type", "text"), self._send_text_message)
+    
     def send_message(self, channel_id: int, message_data: Dict[str, Any], 
-                    user_id: int, broadcast_id: str, settings: Dict[str, Any] = None) -> Dict[str, Any]:
+                    user_id: int, broadcast_id: str, settings: Dict[str, Any] = None,
+                    handler=None) -> Dict[str, Any]:
         """Send message to channel with retry logic"""
-        message_type = message_data.get("type", "text")
         retry_count = 0
         last_error = None
         
+        # Callers sending one message to many channels resolve the handler up front
+        if handler is None:
+            handler = self.get_handler(message_data)
+        track_auto_operations = bool(
+            settings and (settings.get("auto_delete_time") or settings.get("auto_repost_time"))
+        )
+        
         while retry_count < MAX_RETRIES:
             try:
-                # Get the appropriate handler
-                handler = self.message_handlers.get(message_type, self._send_text_message)
-                
-                # Send the message
-                start_time = time.time()
+                # Send the message once the rate limiter allows it
+                telegram_rate_limiter.acquire(channel_id)
+                start_time = time.monotonic()
                 result = handler(channel_id, message_data, settings)
-                response_time = time.time() - start_time
+                response_time = time.monotonic() - start_time
                 
                 if result["success"]:
-                    # Log analytics
-                    self.db_ops.add_analytics_entry(
-                        user_id=user_id,
-                        broadcast_id=broadcast_id,
-                        channel_id=channel_id,
-                        status="sent",
-                        message_id=result.get("message_id"),
-                        response_time=response_time
-                    )
-                    
                     # Track message for auto operations
-                    if settings and (settings.get("auto_delete_time") or settings.get("auto_repost_time")):
+                    if track_auto_operations:
                         self._track_message_for_auto_operations(
                             broadcast_id, user_id, channel_id, 
                             result.get("message_id"), settings
@@ -85,8 +88,15 @@ class MessageSender:
                     
             except ApiTelegramException as e:
                 last_error = self._handle_telegram_error(e)
-                if e.error_code in [403, 400]:  # Forbidden or Bad Request - don't retry
+                if e.error_code in _PERMANENT_ERROR_CODES:
                     break
+                
+                # Flood control applies to the whole bot, so hold all senders
+                retry_after = telegram_rate_limiter.retry_after(e)
+                if retry_after is not None:
+                    telegram_rate_limiter.pause(retry_after)
+                    retry_count += 1
+                    continue
                     
             except Exception as e:
                 last_error = f"Unexpected error: {str(e)}"
@@ -97,16 +107,7 @@ class MessageSender:
                 logger.warning(f"🔄 Retrying send to {channel_id} (attempt {retry_count + 1}/{MAX_RETRIES})")
                 time.sleep(RETRY_DELAY)
         
-        # Log failed attempt
-        self.db_ops.add_analytics_entry(
-            user_id=user_id,
-            broadcast_id=broadcast_id,
-            channel_id=channel_id,
-            status="failed",
-            error_message=last_error,
-            retry_count=retry_count
-        )
-        
+        # Per-broadcast totals are recorded once on completion, not per channel
         return {
             "success": False,
             "error": last_error,
@@ -134,6 +135,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -161,6 +164,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -188,6 +193,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -215,6 +222,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -242,6 +251,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -267,6 +278,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -290,6 +303,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -313,6 +328,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -340,6 +357,8 @@ class MessageSender:
                 "message_id": message.message_id
             }
             
+        except ApiTelegramException:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -389,18 +408,24 @@ class MessageSender:
             
             auto_delete_time = settings.get("auto_delete_time")
             auto_repost_time = settings.get("auto_repost_time")
+            sent_date = datetime.utcnow()
             
-            # Add to database for tracking
-            self.db_ops.add_broadcast_message(
+            tracked_message = BroadcastMessageModel(
+                message_id=message_tracking_id,
                 broadcast_id=broadcast_id,
                 user_id=user_id,
                 channel_id=channel_id,
                 telegram_message_id=message_id,
+                status="sent",
+                sent_date=sent_date,
+                delete_date=sent_date + timedelta(minutes=auto_delete_time) if auto_delete_time else None,
                 auto_delete_time=auto_delete_time,
                 auto_repost_time=auto_repost_time
             )
             
-            logger.info(f"📝 Message tracked for auto operations: {message_tracking_id}")
+            self.db_ops.add_broadcast_messages([tracked_message])
+            
+            logger.debug(f"📝 Message tracked for auto operations: {message_tracking_id}")
             
         except Exception as e:
             logger.error(f"❌ Error tracking message for auto operations: {e}")
@@ -408,6 +433,7 @@ class MessageSender:
     def delete_message(self, channel_id: int, message_id: int) -> Dict[str, Any]:
         """Delete a message from channel"""
         try:
+            telegram_rate_limiter.acquire()
             self.bot.delete_message(
                 chat_id=channel_id,
                 message_id=message_id,
@@ -420,10 +446,37 @@ class MessageSender:
             }
             
         except ApiTelegramException as e:
-            error_msg = self._handle_telegram_error(e)
+            # Callers branch on error_code; the text is only for logs and storage
             return {
                 "success": False,
-                "error": error_msg
+                "error": self._handle_telegram_error(e),
+                "error_code": e.error_code,
+                "retry_after": telegram_rate_limiter.retry_after(e)
+            }
+        
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Unexpected error: {str(e)}"
+            }
+    
+    def delete_messages(self, channel_id: int, message_ids: List[int]) -> Dict[str, Any]:
+        """Delete up to 100 messages from a channel in one deleteMessages call"""
+        try:
+            telegram_rate_limiter.acquire()
+            self.bot.delete_messages(channel_id, message_ids)
+            
+            return {
+                "success": True,
+                "message": f"{len(message_ids)} messages deleted"
+            }
+            
+        except ApiTelegramException as e:
+            return {
+                "success": False,
+                "error": self._handle_telegram_error(e),
+                "error_code": e.error_code,
+                "retry_after": telegram_rate_limiter.retry_after(e)
             }
         
         except Exception as e:
@@ -7,22 +7,31 @@ Handles scheduled broadcasts and auto operations
 import logging
 import threading
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 import schedule
 
 from ..database.operations import DatabaseOperations
+from ..utils.rate_limiter import telegram_rate_limiter
+from ..utils.task_manager import TaskManager, bounded_as_completed
+from config import (
+    SCHEDULER_MIN_INTERVAL, SCHEDULER_MAX_INTERVAL, SCHEDULER_BACKOFF, SCHEDULER_DEADLINE_CAP,
+    DELETE_BATCH_SIZE, BROADCAST_WORKERS
+)
 
 logger = logging.getLogger(__name__)
 
 class BroadcastScheduler:
     """Handles scheduled broadcasts and automatic operations"""
     
-    def __init__(self, db_ops: DatabaseOperations, broadcast_manager):
+    def __init__(self, db_ops: DatabaseOperations, broadcast_manager, task_manager: TaskManager):
         self.db_ops = db_ops
         self.broadcast_manager = broadcast_manager
+        self.task_manager = task_manager
         self.is_running = False
         self.scheduler_thread = None
+        self._stop_event = threading.Event()
         
         # Setup scheduled tasks
         self._setup_schedule()
@@ -31,59 +40,160 @@ class BroadcastScheduler:
     
     def _setup_schedule(self):
         """Setup recurring scheduled tasks"""
-        # Check for auto operations every minute
-        schedule.every(1).minutes.do(self._process_auto_operations)
-        
         # Cleanup old data daily at 2 AM
         schedule.every().day.at("02:00").do(self._daily_cleanup)
         
-        # Check for scheduled broadcasts every minute
-        schedule.every(1).minutes.do(self._process_scheduled_broadcasts)
+        # Scheduled broadcasts and auto operations are driven by their own
+        # deadlines in _run_scheduler rather than a fixed one-minute poll
     
     def start(self):
         """Start the scheduler"""
         if not self.is_running:
             self.is_running = True
-            self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
-            self.scheduler_thread.start()
+            self._stop_event.clear()
+            # Tracked by the task manager so shutdown waits for the loop with the other workers
+            self.scheduler_thread = self.task_manager.spawn(self._run_scheduler, name="broadcast-scheduler")
             logger.info("🚀 Broadcast Scheduler started")
     
     def stop(self):
         """Stop the scheduler"""
         self.is_running = False
+        self._stop_event.set()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
         logger.info("🛑 Broadcast Scheduler stopped")
     
     def _run_scheduler(self):
-        """Main scheduler loop"""
+        """Main scheduler loop, backing off while no jobs are due"""
+        interval = SCHEDULER_MIN_INTERVAL
+        next_deadline_check = 0.0
+        
         while self.is_running:
             try:
+                has_due_jobs = any(job.should_run for job in schedule.jobs)
                 schedule.run_pending()
-                time.sleep(1)
+                
+                # Run database-backed work when its earliest deadline is reached
+                if time.monotonic() >= next_deadline_check:
+                    self._process_scheduled_broadcasts()
+                    self._process_auto_operations()
+                    next_deadline_check = time.monotonic() + self._seconds_until_next_deadline()
+                
+                if has_due_jobs:
+                    interval = SCHEDULER_MIN_INTERVAL
+                else:
+                    interval = min(interval * SCHEDULER_BACKOFF, SCHEDULER_MAX_INTERVAL)
+                
+                # Never sleep past the next job's due time or the next deadline
+                wait = min(interval, max(next_deadline_check - time.monotonic(), 0))
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is not None:
+                    wait = max(min(wait, idle_seconds), 0)
+                
+                self._stop_event.wait(wait)
             except Exception as e:
                 logger.error(f"❌ Scheduler error: {e}")
-                time.sleep(5)  # Wait before retrying
+                self._stop_event.wait(5)  # Wait before retrying
+    
+    def _seconds_until_next_deadline(self) -> float:
+        """Seconds until the earliest scheduled broadcast or auto delete, capped for new entries"""
+        next_due = self.db_ops.get_next_due_time()
+        if next_due is None:
+            return SCHEDULER_DEADLINE_CAP
+        
+        seconds = (next_due - datetime.utcnow()).total_seconds()
+        return max(SCHEDULER_MIN_INTERVAL, min(seconds, SCHEDULER_DEADLINE_CAP))
     
     def _process_auto_operations(self):
         """Process auto delete and repost operations"""
         try:
-            messages = self.db_ops.get_messages_for_auto_operations()
+            messages = self.db_ops.iter_messages_for_auto_operations()
+            status_updates = []
+            unusable = []
             
-            for message in messages:
+            # Channel batches are independent requests, so run them on the shared send pool;
+            # the rate limiter still caps the overall delete rate
+            completions = bounded_as_completed(
+                self.broadcast_manager.send_executor,
+                lambda item: self._auto_delete_batch(*item),
+                self._iter_delete_batches(messages, unusable),
+                BROADCAST_WORKERS
+            )
+            for (channel_id, _), future in completions:
                 try:
-                    if message.get("operation") == "delete":
-                        self._auto_delete_message(message)
-                    elif message.get("operation") == "repost":
-                        self._auto_repost_message(message)
+                    status_updates.extend(future.result())
                 except Exception as e:
-                    logger.error(f"❌ Error processing auto operation for message {message.get('message_id')}: {e}")
+                    logger.error(f"❌ Error auto-deleting messages in channel {channel_id}: {e}")
+            
+            # Records that can never be deleted would otherwise stay due and pin the
+            # next-deadline sleep at its minimum, so close them out as failed
+            status_updates.extend(unusable)
+            
+            # Write every status change from this cycle in one round trip
+            if status_updates:
+                self.db_ops.bulk_update_message_status(status_updates)
         
         except Exception as e:
             logger.error(f"❌ Error processing auto operations: {e}")
     
-    def _auto_delete_message(self, message: Dict[str, Any]):
-        """Auto delete a message"""
+    def _iter_delete_batches(self, messages: Iterable[Dict[str, Any]],
+                             unusable: List[Dict[str, Any]]) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Group due deletes per channel so each deleteMessages call clears a full chunk"""
+        pending_deletes = defaultdict(list)
+        
+        for message in messages:
+            try:
+                if message.get("operation") == "delete":
+                    channel_id = message.get("channel_id")
+                    if not channel_id or not message.get("telegram_message_id"):
+                        unusable.append({
+                            "message_id": message["message_id"],
+                            "status": "failed",
+                            "error_message": "Missing channel or Telegram message ID"
+                        })
+                        continue
+                    
+                    batch = pending_deletes[channel_id]
+                    batch.append(message)
+                    if len(batch) >= DELETE_BATCH_SIZE:
+                        yield channel_id, pending_deletes.pop(channel_id)
+                elif message.get("operation") == "repost":
+                    self._auto_repost_message(message)
+            except Exception as e:
+                logger.error(f"❌ Error processing auto operation for message {message.get('message_id')}: {e}")
+        
+        yield from pending_deletes.items()
+    
+    def _auto_delete_batch(self, channel_id: int, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Auto delete one channel's due messages and return the status updates to record"""
+        if len(messages) == 1:
+            status_update = self._auto_delete_message(messages[0])
+            return [status_update] if status_update else []
+        
+        try:
+            result = self.broadcast_manager.message_sender.delete_messages(
+                channel_id, [message["telegram_message_id"] for message in messages]
+            )
+            
+            if result["success"]:
+                logger.debug(f"🗑️ Auto-deleted {len(messages)} messages from channel {channel_id}")
+                return [{"message_id": message["message_id"], "status": "deleted"} for message in messages]
+            
+            # Flood control is temporary: leave the whole batch due for the next cycle
+            if result.get("retry_after") is not None:
+                telegram_rate_limiter.pause(result["retry_after"])
+                return []
+            
+            logger.debug(f"Bulk auto-delete failed in channel {channel_id}, deleting individually: {result['error']}")
+        
+        except Exception as e:
+            logger.error(f"❌ Error bulk auto-deleting messages: {e}")
+        
+        # Fall back to single deletes so each message records its own outcome
+        return [update for update in map(self._auto_delete_message, messages) if update]
+    
+    def _auto_delete_message(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Auto delete a message and return the status update to record"""
         try:
             channel_id = message.get("channel_id")
             telegram_message_id = message.get("telegram_message_id")
@@ -95,18 +205,21 @@ class BroadcastScheduler:
                 )
                 
                 if result["success"]:
-                    # Update message status in database
-                    self.db_ops.update_message_status(
-                        message["message_id"], 
-                        channel_id, 
-                        "deleted"
-                    )
-                    logger.info(f"🗑️ Auto-deleted message {telegram_message_id} from channel {channel_id}")
-                else:
-                    logger.warning(f"⚠️ Failed to auto-delete message: {result['error']}")
+                    logger.debug(f"🗑️ Auto-deleted message {telegram_message_id} from channel {channel_id}")
+                    return {"message_id": message["message_id"], "status": "deleted"}
+                
+                # Flood control is temporary: leave the message due for the next cycle
+                if result.get("retry_after") is not None:
+                    telegram_rate_limiter.pause(result["retry_after"])
+                    return None
+                
+                logger.warning(f"⚠️ Failed to auto-delete message: {result['error']}")
+                return {"message_id": message["message_id"], "status": "failed", "error_message": result["error"]}
         
         except Exception as e:
             logger.error(f"❌ Error auto-deleting message: {e}")
+        
+        return None
     
     def _auto_repost_message(self, message: Dict[str, Any]):
         """Auto repost a message"""
@@ -114,7 +227,7 @@ class BroadcastScheduler:
             # For simplicity, we'll just log this for now
             # In a full implementation, you'd need to store original message data
             # and recreate the broadcast
-            logger.info(f"🔄 Auto-repost triggered for message {message.get('message_id')}")
+            logger.debug(f"🔄 Auto-repost triggered for message {message.get('message_id')}")
             
             # TODO: Implement full repost functionality
             # This would involve:
@@ -128,15 +241,34 @@ class BroadcastScheduler:
     def _process_scheduled_broadcasts(self):
         """Process scheduled broadcasts that are due"""
         try:
-            # This would query for scheduled broadcasts that are due
-            # For now, we'll just log
             logger.debug("📅 Checking for scheduled broadcasts...")
+            status_updates = []
             
-            # TODO: Implement scheduled broadcast processing
-            # This would involve:
-            # 1. Query database for due scheduled broadcasts
-            # 2. Execute the broadcasts
-            # 3. Update their status
+            try:
+                for due in self.db_ops.get_due_scheduled_broadcasts():
+                    # Fetch the full document only for broadcasts actually being dispatched
+                    scheduled = self.db_ops.claim_scheduled_broadcast(due["_id"])
+                    if scheduled is None:
+                        continue
+                    
+                    channels = self.db_ops.get_user_channels(scheduled.user_id)
+                    result = self.broadcast_manager.start_broadcast(
+                        scheduled.user_id, scheduled.broadcast_data, channels
+                    )
+                    
+                    if result["success"]:
+                        status_updates.append({"schedule_id": scheduled.schedule_id, "status": "sent"})
+                        logger.info(f"📅 Dispatched scheduled broadcast {scheduled.schedule_id}")
+                    else:
+                        status_updates.append({
+                            "schedule_id": scheduled.schedule_id,
+                            "status": "failed",
+                            "error_message": result["message"]
+                        })
+            finally:
+                # Write every outcome from this cycle in one round trip, even after an error
+                if status_updates:
+                    self.db_ops.bulk_update_scheduled_broadcast_status(status_updates)
         
         except Exception as e:
             logger.error(f"❌ Error processing scheduled broadcasts: {e}")
@@ -4,7 +4,10 @@ Handles all database operations and MongoDB interactions
 """
 
 from .connection import DatabaseConnection
-from .models import UserModel, ChannelModel, BroadcastModel, AnalyticsModel
+from .models import (
+    UserModel, ChannelModel, BroadcastModel, AnalyticsModel, BroadcastMessageModel,
+    generate_broadcast_id, generate_message_id
+)
 from .operations import DatabaseOperations
 
 __all__ = [
@@ -13,5 +16,8 @@ __all__ = [
     'ChannelModel',
     'BroadcastModel',
     'AnalyticsModel',
+    'BroadcastMessageModel',
+    'generate_broadcast_id',
+    'generate_message_id',
     'DatabaseOperations'
 ]
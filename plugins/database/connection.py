@@ -7,7 +7,7 @@ Manages MongoDB connections and provides database access
 import logging
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
-from config import MONGO_URL, DATABASE_NAME, LOG_LEVEL
+from config import MONGO_URL, DATABASE_NAME, LOG_LEVEL, MONGO_COMPRESSORS, MONGO_MAX_POOL_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,8 @@ class DatabaseConnection:
                 MONGO_URL,
                 serverSelectionTimeoutMS=10000,
                 connectTimeoutMS=10000,
-                maxPoolSize=50,
+                maxPoolSize=MONGO_MAX_POOL_SIZE,
+                compressors=MONGO_COMPRESSORS,
                 retryWrites=True
             )
             
@@ -212,7 +212,7 @@ class ScheduledBroadcastModel:
     user_id: int
     broadcast_data: Dict[str, Any]
     scheduled_time: datetime
-    status: str = "scheduled"  # scheduled, sent, cancelled, failed
+    status: str = "scheduled"  # scheduled, sending, sent, cancelled, failed
     created_date: datetime = None
     executed_date: Optional[datetime] = None
     retry_count: int = 0
@@ -297,7 +297,7 @@ class BotMessageModel:
 # Helper functions for model operations
 def generate_broadcast_id(user_id: int) -> str:
     """Generate unique broadcast ID"""
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
     return f"broadcast_{user_id}_{timestamp}"
 
 def generate_analytics_id(user_id: int, broadcast_id: str, channel_id: int) -> str:
@@ -6,9 +6,11 @@ Handles all database CRUD operations and business logic
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
-from pymongo.errors import DuplicateKeyError, PyMongoError
-from pymongo import ASCENDING, DESCENDING
+from typing import Dict, Iterator, List, Optional, Any, Union
+from pymongo.errors import DuplicateKeyError, PyMongoError, BulkWriteError
+from pymongo import ASCENDING, DESCENDING, UpdateMany, ReturnDocument
+from pymongo.write_concern import WriteConcern
+import pymongo
 
 from .connection import db_connection
 from .models import (
@@ -20,55 +22,95 @@ from .models import (
 from config import (
     USERS_COLLECTION, CHANNELS_COLLECTION, BROADCASTS_COLLECTION,
     ANALYTICS_COLLECTION, SCHEDULED_BROADCASTS_COLLECTION, 
-    BROADCAST_MESSAGES_COLLECTION, BOT_MESSAGES_COLLECTION
+    BROADCAST_MESSAGES_COLLECTION,
+    MONGO_OPERATION_TIMEOUT, MONGO_STARTUP_TIMEOUT, CHANNEL_CACHE_TTL,
+    MONGO_CURSOR_BATCH_SIZE, MONGO_IN_CHUNK_SIZE
 )
 
 logger = logging.getLogger(__name__)
 
+# Fields read by get_user_channels; everything else stays on the server
+_CHANNEL_LIST_PROJECTION = {
+    "_id": 0,
+    "channel_id": 1,
+    "channel_name": 1,
+    "username": 1,
+    "channel_type": 1,
+    "added_date": 1,
+    "total_broadcasts": 1,
+    "success_rate": 1
+}
+
 class DatabaseOperations:
     """Enhanced database operations with comprehensive CRUD functionality"""
     
     def __init__(self):
+        # Imported here because plugins.utils imports this module
+        from ..utils.cache import TTLCache
+        
         self.db_connection = db_connection
+        
+        # Channel lists keyed by (user_id, active_only)
+        self._channels_cache = TTLCache(maxsize=1024, ttl=CHANNEL_CACHE_TTL)
+        
         self._ensure_indexes()
     
     def _ensure_indexes(self):
         """Create database indexes for performance"""
         try:
-            # Users collection indexes
-            users_collection = self.db_connection.get_collection(USERS_COLLECTION)
-            if users_collection is not None:
-                users_collection.create_index("user_id", unique=True)
-                users_collection.create_index("username")
-                users_collection.create_index("join_date")
-            
-            # Channels collection indexes
-            channels_collection = self.db_connection.get_collection(CHANNELS_COLLECTION)
-            if channels_collection is not None:
-                channels_collection.create_index([("user_id", ASCENDING), ("channel_id", ASCENDING)])
-                channels_collection.create_index("user_id")
-                channels_collection.create_index("channel_id")
-                channels_collection.create_index("added_date")
-            
-            # Broadcasts collection indexes
-            broadcasts_collection = self.db_connection.get_collection(BROADCASTS_COLLECTION)
-            if broadcasts_collection is not None:
-                broadcasts_collection.create_index("broadcast_id", unique=True)
-                broadcasts_collection.create_index("user_id")
-                broadcasts_collection.create_index("status")
-                broadcasts_collection.create_index("created_date")
-            
-            # Analytics collection indexes
-            analytics_collection = self.db_connection.get_collection(ANALYTICS_COLLECTION)
-            if analytics_collection is not None:
-                analytics_collection.create_index("user_id")
-                analytics_collection.create_index("broadcast_id")
-                analytics_collection.create_index("timestamp")
+            # Bound startup time when Mongo is degraded instead of hanging
+            with pymongo.timeout(MONGO_STARTUP_TIMEOUT):
+                self._create_indexes()
             
             logger.info("✅ Database indexes created successfully")
         except Exception as e:
             logger.warning(f"⚠️ Could not create indexes: {e}")
     
+    def _create_indexes(self):
+        """Create indexes on all collections"""
+        # Users collection indexes
+        users_collection = self.db_connection.get_collection(USERS_COLLECTION)
+        if users_collection is not None:
+            users_collection.create_index("user_id", unique=True)
+            users_collection.create_index("username")
+            users_collection.create_index("join_date")
+        
+        # Channels collection indexes
+        channels_collection = self.db_connection.get_collection(CHANNELS_COLLECTION)
+        if channels_collection is not None:
+            channels_collection.create_index([("user_id", ASCENDING), ("channel_id", ASCENDING)])
+            channels_collection.create_index("user_id")
+            channels_collection.create_index("channel_id")
+            channels_collection.create_index("added_date")
+        
+        # Broadcasts collection indexes
+        broadcasts_collection = self.db_connection.get_collection(BROADCASTS_COLLECTION)
+        if broadcasts_collection is not None:
+            broadcasts_collection.create_index("broadcast_id", unique=True)
+            # Newest-first history per user; also serves plain user_id lookups
+            broadcasts_collection.create_index([("user_id", ASCENDING), ("created_date", DESCENDING)])
+            broadcasts_collection.create_index("status")
+            broadcasts_collection.create_index("created_date")
+        
+        # Analytics collection indexes
+        analytics_collection = self.db_connection.get_collection(ANALYTICS_COLLECTION)
+        if analytics_collection is not None:
+            analytics_collection.create_index("user_id")
+            analytics_collection.create_index("broadcast_id")
+            analytics_collection.create_index("timestamp")
+            analytics_collection.create_index([("user_id", ASCENDING), ("date", ASCENDING)])
+        
+        # Scheduled broadcasts: dueness scan filters on status and scheduled_time
+        scheduled_collection = self.db_connection.get_collection(SCHEDULED_BROADCASTS_COLLECTION)
+        if scheduled_collection is not None:
+            scheduled_collection.create_index([("status", ASCENDING), ("scheduled_time", ASCENDING)])
+        
+        # Broadcast messages: per-user lookups and auto-delete scans
+        broadcast_messages_collection = self.db_connection.get_collection(BROADCAST_MESSAGES_COLLECTION)
+        if broadcast_messages_collection is not None:
+            broadcast_messages_collection.create_index([("user_id", ASCENDING), ("sent_date", DESCENDING)])
+            broadcast_messages_collection.create_index([("status", ASCENDING), ("delete_date", ASCENDING)])
+    
     # =============================================================================
     # USER OPERATIONS
     # =============================================================================
@@ -81,32 +123,39 @@ class DatabaseOperations:
             if collection is None:
                 return None
             
-            existing_user = collection.find_one({"_id": user_id})
-            
-            if existing_user:
-                # Update existing user
-                update_data = {
-                    "last_active": datetime.utcnow(),
+            update_data = {
+                "last_active": datetime.utcnow(),
                 "username": username,
                 "first_name": first_name,
-                    "last_name": last_name
-                }
-                collection.update_one({"_id": user_id}, {"$set": update_data})
-                user_data = {**existing_user, **update_data}
-                user_data['user_id'] = user_data.pop('_id')
-                return UserModel.from_dict(user_data)
-            else:
-                # Create new user
-                user = UserModel(
-                    user_id=user_id,
-                    username=username,
-                    first_name=first_name,
-                    last_name=last_name,
-                    is_admin=is_admin
-                )
-                collection.insert_one(user.to_dict())
+                "last_name": last_name
+            }
+            new_user = UserModel(
+                user_id=user_id,
+                username=username,
+                first_name=first_name,
+                last_name=last_name,
+                is_admin=is_admin
+            )
+            insert_data = {
+                key: value for key, value in new_user.to_dict().items()
+                if key not in update_data and key != "_id"
+            }
+            
+            # Update or create in one round trip instead of find_one + write
+            existing_user = collection.find_one_and_update(
+                {"_id": user_id},
+                {"$set": update_data, "$setOnInsert": insert_data},
+                upsert=True,
+                return_document=ReturnDocument.BEFORE
+            )
+            
+            if existing_user is None:
                 logger.info(f"✅ New user added: {user_id}")
-                return user
+                return new_user
+            
+            user_data = {**existing_user, **update_data}
+            user_data['user_id'] = user_data.pop('_id')
+            return UserModel.from_dict(user_data)
         except Exception as e:
             logger.error(f"❌ Error adding user: {e}")
             return None
@@ -127,27 +176,99 @@ class DatabaseOperations:
             logger.error(f"❌ Error getting user: {e}")
             return None
     
-    def get_all_users(self) -> List[Dict[str, Any]]:
-        """Get all users from database"""
+    def iter_all_users(self) -> Iterator[Dict[str, Any]]:
+        """Stream every user document, batch by batch, for exports"""
         try:
             collection = self.db_connection.get_collection(USERS_COLLECTION)
             if collection is None:
-                return []
-            
-            users = list(collection.find({}))
-            # Convert MongoDB _id to user_id for consistency
-            for user in users:
-                if '_id' in user:
-                    user['user_id'] = user['_id']
-                    del user['_id']
+                return
             
-            return users
+            # Yield off the cursor so an export never holds the whole collection in memory
+            for user in collection.find({}, batch_size=MONGO_CURSOR_BATCH_SIZE):
+                # Convert MongoDB _id to user_id for consistency
+                user['user_id'] = user.pop('_id')
+                yield user
         except Exception as e:
             logger.error(f"❌ Error getting all users: {e}")
-            return []
+    
+    def get_user_overview(self, recent_limit: int = 5) -> Dict[str, Any]:
+        """Count total and active users and fetch the newest ones"""
+        try:
+            collection = self.db_connection.get_collection(USERS_COLLECTION)
+            if collection is None:
+                return {"total_users": 0, "active_users": 0, "recent_users": []}
+            
+            # One $facet round trip for both counts instead of loading every user document
+            pipeline = [{"$facet": {
+                "total": [{"$count": "n"}],
+                "active": [{"$match": {"is_active": {"$ne": False}}}, {"$count": "n"}]
+            }}]
+            facets = next(collection.aggregate(pipeline), {})
+            
+            # Stages inside $facet cannot use indexes, so the newest users come from
+            # a plain query the join_date index serves without a blocking sort
+            recent = collection.find({}, {"username": 1, "first_name": 1}).sort("join_date", DESCENDING).limit(recent_limit)
+            
+            recent_users = []
+            for user in reversed(list(recent)):
+                user["user_id"] = user.pop("_id")
+                recent_users.append(user)
+            
+            return {
+                "total_users": facets["total"][0]["n"] if facets.get("total") else 0,
+                "active_users": facets["active"][0]["n"] if facets.get("active") else 0,
+                "recent_users": recent_users
+            }
+        except Exception as e:
+            logger.error(f"❌ Error getting user overview: {e}")
+            return {"total_users": 0, "active_users": 0, "recent_users": []}
+    
+    def add_broadcast(self, broadcast: BroadcastModel) -> bool:
+        """Record a finished broadcast for the user's history"""
+        try:
+            collection = self.db_connection.get_collection(BROADCASTS_COLLECTION)
+            if collection is None:
+                return False
+            
+            collection.insert_one(broadcast.to_dict())
+            return True
+        except DuplicateKeyError:
+            logger.warning(f"⚠️ Broadcast {broadcast.broadcast_id} already recorded")
+            return False
+        except Exception as e:
+            logger.error(f"❌ Error adding broadcast: {e}")
+            return False
+    
+    def get_user_broadcast_history(self, user_id: int, limit: int = 5) -> Dict[str, Any]:
+        """Count a user's broadcasts and fetch the newest ones for the history panel"""
+        try:
+            collection = self.db_connection.get_collection(BROADCASTS_COLLECTION)
+            if collection is None:
+                return {"total_broadcasts": 0, "recent_broadcasts": []}
+            
+            # $match, $sort and $limit lead the pipeline so the (user_id, created_date)
+            # index serves them; only the fields the panel shows leave the server
+            pipeline = [
+                {"$match": {"user_id": user_id}},
+                {"$sort": {"created_date": DESCENDING}},
+                {"$limit": limit},
+                {"$project": {"_id": 0, "status": 1, "created_date": 1}}
+            ]
+            
+            return {
+                "total_broadcasts": collection.count_documents({"user_id": user_id}),
+                "recent_broadcasts": list(collection.aggregate(pipeline))
+            }
+        except Exception as e:
+            logger.error(f"❌ Error getting broadcast history: {e}")
+            return {"total_broadcasts": 0, "recent_broadcasts": []}
     
     def get_user_channels(self, user_id: int, active_only: bool = True) -> List[Dict[str, Any]]:
         """Get all channels for a user"""
+        cached = self._channels_cache.get((user_id, active_only))
+        if cached is not None:
+            return list(cached)
+        
         try:
             collection = self.db_connection.get_collection(CHANNELS_COLLECTION)
             if collection is None:
@@ -158,7 +279,7 @@ class DatabaseOperations:
                 query["is_active"] = True
             
             channels = []
-            for channel_data in collection.find(query).sort("added_date", DESCENDING):
+            for channel_data in collection.find(query, _CHANNEL_LIST_PROJECTION).sort("added_date", DESCENDING):
                 channels.append({
                     "channel_id": channel_data["channel_id"],
                     "channel_name": channel_data["channel_name"],
@@ -168,11 +289,26 @@ class DatabaseOperations:
                     "total_broadcasts": channel_data.get("total_broadcasts", 0),
                     "success_rate": channel_data.get("success_rate", 100.0)
                 })
-            return channels
+            
+            self._channels_cache[(user_id, active_only)] = channels
+            return list(channels)
         except Exception as e:
             logger.error(f"❌ Error getting user channels: {e}")
             return []
     
+    def iter_all_channels(self, active_only: bool = True) -> Iterator[Dict[str, Any]]:
+        """Stream channels of every user in one query instead of one query per user"""
+        try:
+            collection = self.db_connection.get_collection(CHANNELS_COLLECTION)
+            if collection is None:
+                return
+            
+            query = {"is_active": True} if active_only else {}
+            projection = {**_CHANNEL_LIST_PROJECTION, "user_id": 1}
+            yield from collection.find(query, projection, batch_size=MONGO_CURSOR_BATCH_SIZE)
+        except Exception as e:
+            logger.error(f"❌ Error getting all channels: {e}")
+    
     def add_channel(self, channel_id: int, user_id: int, channel_name: str, username: str = None) -> bool:
         """Add channel for user"""
         try:
@@ -196,6 +332,7 @@ class DatabaseOperations:
                 {"$set": channel_data},
                 upsert=True
             )
+            self._invalidate_user_channels(user_id)
             
             logger.info(f"Channel {channel_id} added for user {user_id}")
             return True
@@ -204,21 +341,259 @@ class DatabaseOperations:
             logger.error(f"Error adding channel {channel_id} for user {user_id}: {e}")
             return False
     
+    def _invalidate_user_channels(self, user_id: int):
+        """Drop cached channel lists for a user after a change"""
+        self._channels_cache.pop((user_id, True), None)
+        self._channels_cache.pop((user_id, False), None)
+    
+    # =============================================================================
+    # SCHEDULED BROADCAST OPERATIONS
+    # =============================================================================
+    
+    def get_due_scheduled_broadcasts(self, now: datetime = None) -> List[Dict[str, Any]]:
+        """Get ids of scheduled broadcasts that are due to run"""
+        try:
+            collection = self.db_connection.get_collection(SCHEDULED_BROADCASTS_COLLECTION)
+            if collection is None:
+                return []
+            
+            query = {
+                "status": "scheduled",
+                "scheduled_time": {"$lte": now or datetime.utcnow()}
+            }
+            # Only the ids are needed to decide dueness; bodies are fetched on dispatch
+            projection = {"_id": 1}
+            return list(collection.find(query, projection).sort("scheduled_time", ASCENDING))
+        except Exception as e:
+            logger.error(f"❌ Error getting due scheduled broadcasts: {e}")
+            return []
+    
+    def claim_scheduled_broadcast(self, schedule_id: str) -> Optional[ScheduledBroadcastModel]:
+        """Mark a due scheduled broadcast as sending and return its full document"""
+        try:
+            collection = self.db_connection.get_collection(SCHEDULED_BROADCASTS_COLLECTION)
+            if collection is None:
+                return None
+            
+            # Fetching and claiming in one round trip means a broadcast that was
+            # cancelled or already dispatched since the scan is never sent twice
+            schedule_data = collection.find_one_and_update(
+                {"_id": schedule_id, "status": "scheduled"},
+                {"$set": {"status": "sending"}},
+                return_document=ReturnDocument.AFTER
+            )
+            if schedule_data:
+                return ScheduledBroadcastModel.from_dict(schedule_data)
+            return None
+        except Exception as e:
+            logger.error(f"❌ Error claiming scheduled broadcast: {e}")
+            return None
+    
+    def bulk_update_scheduled_broadcast_status(self, updates: List[Dict[str, Any]]) -> int:
+        """Record a cycle's scheduled broadcast outcomes in one unordered bulk write"""
+        try:
+            collection = self.db_connection.get_collection(SCHEDULED_BROADCASTS_COLLECTION)
+            if collection is None or not updates:
+                return 0
+            
+            # Dispatches in one cycle mostly share an outcome, so match them by $in
+            ids_by_outcome = {}
+            for update in updates:
+                outcome = (update["status"], update.get("error_message"))
+                ids_by_outcome.setdefault(outcome, []).append(update["schedule_id"])
+            
+            executed_date = datetime.utcnow()
+            operations = [
+                UpdateMany(
+                    {"_id": {"$in": ids[start:start + MONGO_IN_CHUNK_SIZE]}},
+                    {"$set": {"status": status, "executed_date": executed_date, "error_message": error_message}}
+                )
+                for (status, error_message), ids in ids_by_outcome.items()
+                for start in range(0, len(ids), MONGO_IN_CHUNK_SIZE)
+            ]
+            result = collection.bulk_write(operations, ordered=False)
+            return result.modified_count
+        except BulkWriteError as bwe:
+            logger.warning(f"⚠️ Some scheduled broadcast updates failed: {bwe.details.get('writeErrors', [])[:3]}")
+            return bwe.details.get("nModified", 0)
+        except Exception as e:
+            logger.error(f"❌ Error updating scheduled broadcast statuses: {e}")
+            return 0
+    
+    # =============================================================================
+    # BROADCAST MESSAGE OPERATIONS
+    # =============================================================================
+    
+    def add_broadcast_messages(self, messages: List[BroadcastMessageModel]) -> int:
+        """Insert tracked broadcast messages in a single unordered batch"""
+        try:
+            collection = self.db_connection.get_collection(BROADCAST_MESSAGES_COLLECTION)
+            if collection is None or not messages:
+                return 0
+            
+            # Tracking records are best-effort, so skip waiting for acknowledgement
+            fast_collection = collection.with_options(write_concern=WriteConcern(w=0))
+            fast_collection.insert_many([message.to_dict() for message in messages], ordered=False)
+            return len(messages)
+        except Exception as e:
+            logger.error(f"❌ Error adding broadcast messages: {e}")
+            return 0
+    
+    def iter_messages_for_auto_operations(self, now: datetime = None) -> Iterator[Dict[str, Any]]:
+        """Stream sent broadcast messages whose auto-delete time has passed"""
+        try:
+            collection = self.db_connection.get_collection(BROADCAST_MESSAGES_COLLECTION)
+            if collection is None:
+                return
+            
+            query = {"status": "sent", "delete_date": {"$lte": now or datetime.utcnow()}}
+            projection = {"_id": 1, "channel_id": 1, "telegram_message_id": 1}
+            
+            # Yield straight off the cursor so deletes start with the first batch
+            # instead of after the whole backlog is loaded into memory
+            for message in collection.find(query, projection, batch_size=MONGO_CURSOR_BATCH_SIZE):
+                message["message_id"] = message.pop("_id")
+                message["operation"] = "delete"
+                yield message
+        except Exception as e:
+            logger.error(f"❌ Error getting messages for auto operations: {e}")
+    
+    def bulk_update_message_status(self, updates: List[Dict[str, Any]]) -> int:
+        """Apply a cycle's worth of message status updates in one unordered bulk write"""
+        try:
+            collection = self.db_connection.get_collection(BROADCAST_MESSAGES_COLLECTION)
+            if collection is None or not updates:
+                return 0
+            
+            # Most updates in a cycle share an outcome, so match them by $in instead of one op per message
+            ids_by_outcome = {}
+            for update in updates:
+                outcome = (update["status"], update.get("error_message"))
+                ids_by_outcome.setdefault(outcome, []).append(update["message_id"])
+            
+            operations = [
+                UpdateMany(
+                    {"_id": {"$in": ids[start:start + MONGO_IN_CHUNK_SIZE]}},
+                    {
+                        "$set": {"status": status, "error_message": error_message},
+                        "$inc": {"retry_count": 1}
+                    }
+                )
+                for (status, error_message), ids in ids_by_outcome.items()
+                for start in range(0, len(ids), MONGO_IN_CHUNK_SIZE)
+            ]
+            result = collection.bulk_write(operations, ordered=False)
+            return result.modified_count
+        except BulkWriteError as bwe:
+            logger.warning(f"⚠️ Some message status updates failed: {bwe.details.get('writeErrors', [])[:3]}")
+            return bwe.details.get("nModified", 0)
+        except Exception as e:
+            logger.error(f"❌ Error updating message statuses: {e}")
+            return 0
+    
+    def get_next_due_time(self) -> Optional[datetime]:
+        """Get the earliest pending scheduled broadcast or auto-delete time"""
+        try:
+            candidates = []
+            
+            scheduled_collection = self.db_connection.get_collection(SCHEDULED_BROADCASTS_COLLECTION)
+            if scheduled_collection is not None:
+                for doc in scheduled_collection.find(
+                    {"status": "scheduled"}, {"scheduled_time": 1}
+                ).sort("scheduled_time", ASCENDING).limit(1):
+                    candidates.append(doc["scheduled_time"])
+            
+            messages_collection = self.db_connection.get_collection(BROADCAST_MESSAGES_COLLECTION)
+            if messages_collection is not None:
+                for doc in messages_collection.find(
+                    {"status": "sent", "delete_date": {"$ne": None}}, {"delete_date": 1}
+                ).sort("delete_date", ASCENDING).limit(1):
+                    candidates.append(doc["delete_date"])
+            
+            return min(candidates) if candidates else None
+        except Exception as e:
+            logger.error(f"❌ Error getting next due time: {e}")
+            return None
+    
+    # =============================================================================
+    # ANALYTICS OPERATIONS
+    # =============================================================================
+    
+    def update_analytics(self, user_id: int, metric: str, value: int = 1) -> bool:
+        """Increment a daily analytics counter for a user"""
+        return self.update_analytics_many(user_id, {metric: value})
+    
+    def update_analytics_many(self, user_id: int, metrics: Dict[str, int]) -> bool:
+        """Increment several daily analytics counters for a user in one write"""
+        try:
+            collection = self.db_connection.get_collection(ANALYTICS_COLLECTION)
+            if collection is None:
+                return False
+            
+            today = datetime.utcnow().strftime("%Y-%m-%d")
+            # pymongo.timeout sends maxTimeMS so a slow server aborts the write itself
+            with pymongo.timeout(MONGO_OPERATION_TIMEOUT):
+                collection.update_one(
+                    {"user_id": user_id, "date": today, "type": "daily"},
+                    {"$inc": metrics},
+                    upsert=True
+                )
+            return True
+        except PyMongoError as e:
+            logger.warning(f"⚠️ Skipped analytics update {', '.join(metrics)} for user {user_id}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"❌ Error updating analytics: {e}")
+            return False
+    
     def get_user_analytics(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Get user analytics summary"""
         try:
-            # Return basic analytics structure for now
+            collection = self.db_connection.get_collection(ANALYTICS_COLLECTION)
+            if collection is None:
+                raise PyMongoError("analytics collection unavailable")
+            
+            start_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+            
+            # Period totals, daily rows and the active channel count in one round trip
+            pipeline = [
+                {"$match": {"user_id": user_id, "type": "daily", "date": {"$gte": start_date}}},
+                {"$facet": {
+                    "totals": [{"$group": {
+                        "_id": None,
+                        "broadcasts": {"$sum": "$broadcasts_completed"},
+                        "sent": {"$sum": "$messages_sent"},
+                        "failed": {"$sum": "$messages_failed"}
+                    }}],
+                    "daily": [
+                        {"$sort": {"date": ASCENDING}},
+                        {"$project": {"_id": 0, "date": 1, "broadcasts_completed": 1, "messages_sent": 1, "messages_failed": 1}}
+                    ]
+                }},
+                {"$lookup": {
+                    "from": CHANNELS_COLLECTION,
+                    "pipeline": [{"$match": {"user_id": user_id, "is_active": True}}, {"$count": "count"}],
+                    "as": "channels"
+                }}
+            ]
+            result = next(collection.aggregate(pipeline), {})
+            
+            totals = result.get("totals") or [{}]
+            sent = totals[0].get("sent", 0)
+            failed = totals[0].get("failed", 0)
+            channels = result.get("channels") or [{}]
+            
             return {
                 "user_id": user_id,
                 "period_days": days,
-                "total_channels": len(self.get_user_channels(user_id)),
-                "total_broadcasts": 0,
-                "total_messages": 0,
-                "successful_messages": 0,
-                "failed_messages": 0,
-                "success_rate": 100.0,
+                "total_channels": channels[0].get("count", 0),
+                "total_broadcasts": totals[0].get("broadcasts", 0),
+                "total_messages": sent + failed,
+                "successful_messages": sent,
+                "failed_messages": failed,
+                "success_rate": round(sent / (sent + failed) * 100, 2) if sent + failed else 100.0,
                 "recent_broadcasts": [],
-                "daily_stats": []
+                "daily_stats": result.get("daily", [])
             }
         except Exception as e:
             logger.error(f"❌ Error getting user analytics: {e}")
@@ -250,7 +625,8 @@ class DatabaseOperations:
             for collection_name in collections:
                 collection = self.db_connection.get_collection(collection_name)
                 if collection is not None:
-                    stats[collection_name] = collection.count_documents({})
+                    # Whole-collection totals come from metadata instead of a full scan
+                    stats[collection_name] = collection.estimated_document_count()
                 else:
                     stats[collection_name] = 0
             
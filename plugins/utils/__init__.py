@@ -4,17 +4,28 @@ Utility functions and helper modules
 """
 
 from .link_handler import LinkHandler
-from .message_formatter import MessageFormatter
+from .message_formatter import MessageFormatter, html_escape
 from .validators import Validators
 from .helpers import Helpers
-from .logger import setup_logger
+from .logger import setup_logger, stop_log_listeners
 from .channel_detector import ChannelDetector
+from .task_manager import TaskManager, bounded_as_completed
+from .rate_limiter import TokenBucket, RateLimiter, telegram_rate_limiter
+from .cache import TTLCache
 
 __all__ = [
     'LinkHandler',
     'MessageFormatter', 
+    'html_escape',
     'Validators',
     'Helpers',
     'setup_logger',
-    'ChannelDetector'
+    'stop_log_listeners',
+    'ChannelDetector',
+    'TaskManager',
+    'bounded_as_completed',
+    'TokenBucket',
+    'RateLimiter',
+    'telegram_rate_limiter',
+    'TTLCache'
 ]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+TTL Cache
+Small thread-safe in-process cache with per-entry expiry and LRU eviction
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Optional
+
+_MISSING = object()
+
+class TTLCache(MutableMapping):
+    """Dict-like cache whose entries expire after ttl seconds (never if ttl is None)"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.RLock()
+
+    def _is_expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= time.monotonic()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value, expires_at = self._data[key]
+            if self._is_expired(expires_at):
+                del self._data[key]
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+
+            # Evict least recently used entries beyond the size bound
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False
+            if self._is_expired(entry[1]):
+                del self._data[key]
+                return False
+            return True
+
+    def __iter__(self):
+        with self._lock:
+            return iter([key for key, (_, expires_at) in self._data.items() if not self._is_expired(expires_at)])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for _, expires_at in self._data.values() if not self._is_expired(expires_at))
+
+    def get(self, key, default: Any = None) -> Any:
+        """Return the cached value or default when missing or expired"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default: Any = None) -> Any:
+        """Return the live value for key, storing default first if there is none"""
+        with self._lock:
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                self[key] = value = default
+            return value
+
+    def pop(self, key, default: Any = _MISSING) -> Any:
+        """Remove and return a value in a single locked step"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None or self._is_expired(entry[1]):
+                if default is _MISSING:
+                    raise KeyError(key)
+                return default
+            return entry[0]
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
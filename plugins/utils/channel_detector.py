@@ -5,8 +5,11 @@ Automatically detect user's admin channels and add bot
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from ..database.operations import DatabaseOperations
+from .cache import TTLCache
+from config import CHAT_CACHE_TTL, LINK_RESOLVE_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,14 @@ class ChannelDetector:
     
     def __init__(self, bot):
         self.bot = bot
+        self._bot_id = None
+        
+        # Channel titles rarely change; keep get_chat results keyed by channel id
+        self._chat_cache = TTLCache(maxsize=1024, ttl=CHAT_CACHE_TTL)
+        
+        # Runs get_chat alongside the admin check when a channel is added by ID
+        self._lookup_executor = ThreadPoolExecutor(max_workers=LINK_RESOLVE_WORKERS, thread_name_prefix="chat-lookup")
+        
         logger.info("✅ Channel Detector initialized")
     
     def detect_user_admin_channels(self, user_id: int) -> List[Dict[str, Any]]:
@@ -35,8 +46,11 @@ class ChannelDetector:
     def check_bot_admin_status(self, channel_id: int) -> Dict[str, Any]:
         """Check if bot is admin in channel"""
         try:
-            bot_info = self.bot.get_me()
-            member = self.bot.get_chat_member(channel_id, bot_info.id)
+            # The bot's own id never changes, so fetch it once
+            if self._bot_id is None:
+                self._bot_id = self.bot.get_me().id
+            
+            member = self.bot.get_chat_member(channel_id, self._bot_id)
             
             return {
                 "is_admin": member.status in ['administrator', 'creator'],
@@ -54,7 +68,16 @@ class ChannelDetector:
             }
     
     def get_channel_info_by_id(self, channel_id: int) -> Optional[Dict[str, Any]]:
-        """Get channel information by ID"""
+        """Get channel information by ID, served from cache when fresh"""
+        channel_info = self._chat_cache.get(channel_id)
+        if channel_info is None:
+            channel_info = self._fetch_channel_info(channel_id)
+            if channel_info is not None:
+                self._chat_cache[channel_id] = channel_info
+        return channel_info
+    
+    def _fetch_channel_info(self, channel_id: int) -> Optional[Dict[str, Any]]:
+        """Look up channel information from Telegram"""
         try:
             chat = self.bot.get_chat(channel_id)
             
@@ -74,6 +97,9 @@ class ChannelDetector:
                                  db_ops: DatabaseOperations) -> Dict[str, Any]:
         """Automatically add channel if bot is admin"""
         try:
+            # The admin check and the chat lookup are independent round trips, so overlap them
+            info_future = self._lookup_executor.submit(self.get_channel_info_by_id, channel_id)
+            
             # Check if bot is admin
             bot_status = self.check_bot_admin_status(channel_id)
             
@@ -85,7 +111,7 @@ class ChannelDetector:
                 }
             
             # Get channel info
-            channel_info = self.get_channel_info_by_id(channel_id)
+            channel_info = info_future.result()
             
             if not channel_info:
                 return {
@@ -168,6 +194,10 @@ class ChannelDetector:
                 "errors": [str(e)]
             }
     
+    def shutdown(self):
+        """Stop the chat lookup pool"""
+        self._lookup_executor.shutdown(wait=False, cancel_futures=True)
+    
     def validate_channel_id(self, channel_id_str: str) -> Optional[int]:
         """Validate and convert channel ID string to integer"""
         try:
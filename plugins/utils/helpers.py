@@ -14,6 +14,12 @@ import concurrent.futures
 
 logger = logging.getLogger(__name__)
 
+# Longest unit names first so "15min" is read once as minutes, not also as "15m"
+_DURATION_RE = re.compile(r'(\d+)\s*(minutes|minute|min|m|hours|hour|hr|h|days|day|d)')
+_DURATION_MULTIPLIERS = {'m': 1, 'h': 60, 'd': 1440}
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_REPEATED_UNDERSCORE_RE = re.compile(r'_+')
+
 class Helpers:
     """Helper functions for the bot"""
     
@@ -40,30 +46,11 @@ class Helpers:
             
             time_str = time_str.strip().lower()
             
-            # Patterns for different time formats
-            patterns = {
-                'minutes': ['m', 'min', 'minute', 'minutes'],
-                'hours': ['h', 'hr', 'hour', 'hours'],
-                'days': ['d', 'day', 'days']
-            }
-            
-            total_minutes = 0
-            
-            # Extract numbers and units
-            for pattern in patterns['minutes']:
-                matches = re.findall(rf'(\d+)\s*{pattern}', time_str)
-                for match in matches:
-                    total_minutes += int(match)
-            
-            for pattern in patterns['hours']:
-                matches = re.findall(rf'(\d+)\s*{pattern}', time_str)
-                for match in matches:
-                    total_minutes += int(match) * 60
-            
-            for pattern in patterns['days']:
-                matches = re.findall(rf'(\d+)\s*{pattern}', time_str)
-                for match in matches:
-                    total_minutes += int(match) * 1440
+            # Extract numbers and units in a single scan
+            total_minutes = sum(
+                int(amount) * _DURATION_MULTIPLIERS[unit[0]]
+                for amount, unit in _DURATION_RE.findall(time_str)
+            )
             
             return total_minutes if total_minutes > 0 else None
             
@@ -121,9 +108,9 @@ class Helpers:
         """Get safe filename by removing invalid characters"""
         try:
             # Remove invalid characters
-            safe_chars = re.sub(r'[<>:"/\\|?*]', '_', filename)
+            safe_chars = _UNSAFE_FILENAME_RE.sub('_', filename)
             # Remove multiple underscores
-            safe_chars = re.sub(r'_+', '_', safe_chars)
+            safe_chars = _REPEATED_UNDERSCORE_RE.sub('_', safe_chars)
             # Remove leading/trailing underscores
             safe_chars = safe_chars.strip('_')
             
@@ -285,7 +272,7 @@ class Helpers:
                 filename = filename.replace(char, '_')
             
             # Remove multiple underscores
-            filename = re.sub(r'_+', '_', filename)
+            filename = _REPEATED_UNDERSCORE_RE.sub('_', filename)
             
             # Remove leading/trailing underscores and dots
             filename = filename.strip('_.')
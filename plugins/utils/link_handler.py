@@ -5,48 +5,53 @@ Handles Telegram link extraction and channel detection
 
 import re
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from telebot import TeleBot
 
+from .cache import TTLCache
+from config import CHAT_CACHE_TTL, LINK_RESOLVE_WORKERS
+
 logger = logging.getLogger(__name__)
 
+# Private invite links (t.me/+hash), public links (t.me/name) and @mentions in one pass
+_TG_LINK_RE = re.compile(
+    r't\.me/\+([a-zA-Z0-9_-]+)|t\.me/([a-zA-Z0-9_]+)|@([a-zA-Z0-9_]+)',
+    re.IGNORECASE
+)
+
 class LinkHandler:
     """Handle Telegram link extraction and channel detection"""
     
     def __init__(self, bot: TeleBot):
         self.bot = bot
-        self.link_patterns = [
-            # Public channel patterns
-            re.compile(r'https://t\.me/([a-zA-Z0-9_]+)', re.IGNORECASE),
-            re.compile(r'http://t\.me/([a-zA-Z0-9_]+)', re.IGNORECASE),
-            re.compile(r't\.me/([a-zA-Z0-9_]+)', re.IGNORECASE),
-            re.compile(r'@([a-zA-Z0-9_]+)', re.IGNORECASE),
-            # Private channel patterns (t.me/+ format)
-            re.compile(r'https://t\.me/\+([a-zA-Z0-9_-]+)', re.IGNORECASE),
-            re.compile(r'http://t\.me/\+([a-zA-Z0-9_-]+)', re.IGNORECASE),
-            re.compile(r't\.me/\+([a-zA-Z0-9_-]+)', re.IGNORECASE)
-        ]
+        self._bot_id = None
+        
+        # Resolved chat info keyed by username or invite hash
+        self._chat_cache = TTLCache(maxsize=1024, ttl=CHAT_CACHE_TTL)
         
         logger.info("✅ Link Handler initialized with private channel support")
     
     def extract_telegram_links(self, text: str) -> List[str]:
         """Extract Telegram channel/group links from text"""
         try:
-            if not text:
+            # Substring checks run in C; most texts have no link and skip the regex scan
+            if not text or ('@' not in text and 't.me/' not in text.lower()):
                 return []
         
-            links = set()
+            # Ordered de-duplication of everything found in a single regex scan
+            links = {}
             
-            for pattern in self.link_patterns:
-                matches = pattern.findall(text)
-                for match in matches:
-                    # Clean up the username
-                    username = match.strip().lower()
-                    if username and not username.startswith('_'):  # Skip invalid usernames
-                        # For private channels, add + prefix
-                        if '+' in pattern.pattern:
-                            username = f"+{username}"
-                        links.add(username)
+            for match in _TG_LINK_RE.finditer(text):
+                private, public, mention = match.groups()
+                
+                # Clean up the username
+                username = (private or public or mention).strip().lower()
+                if username and not username.startswith('_'):  # Skip invalid usernames
+                    # For private channels, add + prefix
+                    if private:
+                        username = f"+{username}"
+                    links[username] = None
             
             return list(links)
         
@@ -55,7 +60,16 @@ class LinkHandler:
             return []
     
     def resolve_channel_info(self, username: str) -> Optional[Dict[str, Any]]:
-        """Resolve channel information from username"""
+        """Resolve channel information from username, served from cache when fresh"""
+        channel_info = self._chat_cache.get(username)
+        if channel_info is None:
+            channel_info = self._fetch_channel_info(username)
+            if channel_info is not None:
+                self._chat_cache[username] = channel_info
+        return channel_info
+    
+    def _fetch_channel_info(self, username: str) -> Optional[Dict[str, Any]]:
+        """Look up channel information from Telegram"""
         try:
             # Handle private channels (t.me/+ format)
             if username.startswith('+'):
@@ -104,13 +118,43 @@ class LinkHandler:
     def check_bot_access(self, channel_id: int) -> bool:
         """Check if bot has admin access to channel"""
         try:
+            # The bot's own id never changes, so fetch it once
+            if self._bot_id is None:
+                self._bot_id = self.bot.get_me().id
+            
             # Get bot member status
-            member = self.bot.get_chat_member(channel_id, self.bot.get_me().id)
+            member = self.bot.get_chat_member(channel_id, self._bot_id)
             return member.status in ['administrator', 'creator']
         except Exception as e:
             logger.error(f"❌ Error checking bot access for channel {channel_id}: {e}")
             return False
     
+    def _resolve_with_access(self, username: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Resolve a link and check bot admin access for it"""
+        channel_info = self.resolve_channel_info(username)
+        if not channel_info:
+            return None, False
+        return channel_info, self.check_bot_access(channel_info["channel_id"])
+    
+    def resolve_links(self, usernames: List[str]) -> List[Tuple[str, Optional[Dict[str, Any]], bool]]:
+        """Resolve several links concurrently, returning (link, channel_info, has_access) in input order"""
+        if not usernames:
+            return []
+        
+        # Fetch the bot id up front so workers don't all request it
+        if self._bot_id is None:
+            try:
+                self._bot_id = self.bot.get_me().id
+            except Exception as e:
+                logger.error(f"❌ Error getting bot info: {e}")
+        
+        # Each lookup is a network round trip, so overlap them
+        workers = min(LINK_RESOLVE_WORKERS, len(usernames))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._resolve_with_access, usernames))
+        
+        return [(username, info, has_access) for username, (info, has_access) in zip(usernames, results)]
+    
     def auto_add_telegram_links(self, text: str, user_id: int, db_ops) -> List[Dict[str, Any]]:
         """Automatically add Telegram channels from text"""
         try:
@@ -121,14 +165,11 @@ class LinkHandler:
             
             added_channels = []
             
-            for username in usernames:
+            for username, channel_info, has_access in self.resolve_links(usernames):
                 try:
-                    # Resolve channel info
-                    channel_info = self.resolve_channel_info(username)
-                    
                     if channel_info:
                         # Check if bot has access
-                        if self.check_bot_access(channel_info["channel_id"]):
+                        if has_access:
                             # Add to database
                             success = db_ops.add_channel(
                                 channel_id=channel_info["channel_id"],
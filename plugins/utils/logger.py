@@ -7,8 +7,12 @@ Enhanced logging configuration for the application
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+# Listeners draining queued records to the real handlers
+_log_listeners: List[logging.handlers.QueueListener] = []
 
 def setup_logger(name: str, level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """Setup enhanced logger with file and console handlers"""
@@ -30,11 +34,14 @@ def setup_logger(name: str, level: str = "INFO", log_file: Optional[str] = None)
         '%(asctime)s - %(levelname)s - %(message)s'
     )
     
+    handlers = []
+    file_logging_error = None
+    
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler
     if log_file:
@@ -53,13 +60,29 @@ def setup_logger(name: str, level: str = "INFO", log_file: Optional[str] = None)
             )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(detailed_formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
     
         except Exception as e:
-            logger.warning(f"Could not setup file logging: {e}")
+            file_logging_error = e
+    
+    # Callers only enqueue records; a listener thread does the actual I/O
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _log_listeners.append(listener)
+    
+    if file_logging_error:
+        logger.warning(f"Could not setup file logging: {file_logging_error}")
     
     return logger
 
+def stop_log_listeners():
+    """Flush queued log records and stop all listener threads"""
+    while _log_listeners:
+        _log_listeners.pop().stop()
+
 def get_logger(name: str) -> logging.Logger:
     """Get existing logger or create new one"""
     return logging.getLogger(name)
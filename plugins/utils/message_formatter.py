@@ -3,14 +3,81 @@ Message Formatter Module
 Handles message formatting for display
 """
 
-import html
 import re
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Single-pass replacement table, same output as html.escape(text, quote=True)
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;"
+})
+
+def html_escape(text: Any) -> str:
+    """Escape text for Telegram HTML parse mode"""
+    return "" if text is None else str(text).translate(_HTML_ESCAPE_TABLE)
+
+# All markdown constructs in one alternation, longest delimiters first
+_MARKDOWN_RE = re.compile(
+    r'```(.*?)```|`(.*?)`|\*\*(.*?)\*\*|\*(.*?)\*|\[([^\]]+)\]\(([^)]+)\)|^>[ \t]?([^\n]*)',
+    re.DOTALL | re.MULTILINE
+)
+
+def _render_markdown_tokens(text: str) -> str:
+    """Tokenize markdown in one pass, escaping plain text and emitting HTML tags"""
+    parts = []
+    last = 0
+    for match in _MARKDOWN_RE.finditer(text):
+        parts.append(html_escape(text[last:match.start()]))
+        pre, code, bold, italic, link_text, link_url, quote = match.groups()
+        if pre is not None:
+            parts.append(f"<pre>{html_escape(pre)}</pre>")
+        elif code is not None:
+            parts.append(f"<code>{html_escape(code)}</code>")
+        elif bold is not None:
+            parts.append(f"<b>{_render_markdown_tokens(bold)}</b>")
+        elif italic is not None:
+            parts.append(f"<i>{_render_markdown_tokens(italic)}</i>")
+        elif link_url is not None:
+            parts.append(f'<a href="{html_escape(link_url)}">{_render_markdown_tokens(link_text)}</a>')
+        else:
+            parts.append(f"<blockquote>{_render_markdown_tokens(quote)}</blockquote>")
+        last = match.end()
+    parts.append(html_escape(text[last:]))
+    return "".join(parts)
+
+@lru_cache(maxsize=1024)
+def _render_markdown(text: str) -> str:
+    """Render markdown to HTML, memoized since one body is sent to many channels"""
+    return _render_markdown_tokens(text)
+
+# Conversion tables compiled once at import, applied in order
+_HTML_CONVERSIONS = [
+    (re.compile(r'<b>(.*?)</b>', re.DOTALL), r'**\1**'),
+    (re.compile(r'<strong>(.*?)</strong>', re.DOTALL), r'**\1**'),
+    (re.compile(r'<i>(.*?)</i>', re.DOTALL), r'*\1*'),
+    (re.compile(r'<em>(.*?)</em>', re.DOTALL), r'*\1*'),
+    (re.compile(r'<code>(.*?)</code>', re.DOTALL), r'`\1`'),
+    (re.compile(r'<pre>(.*?)</pre>', re.DOTALL), r'```\1```'),
+    (re.compile(r'<a href="([^"]+)">([^<]+)</a>', re.DOTALL), r'[\2](\1)')
+]
+
+_DANGEROUS_TAG_PATTERNS = [
+    pattern
+    for tag in ['script', 'iframe', 'object', 'embed', 'link', 'meta']
+    for pattern in (
+        re.compile(f'<{tag}[^>]*>.*?</{tag}>', re.DOTALL | re.IGNORECASE),
+        re.compile(f'<{tag}[^>]*/?>', re.IGNORECASE)
+    )
+]
+
 class MessageFormatter:
     """Format messages for display"""
     
@@ -29,13 +96,13 @@ class MessageFormatter:
             header = f"📢 <b>Broadcast Message</b>\n<i>━━━━━━━━━━━━━━━━━━━━━━━━━━━</i>\n\n"
             channel_info = f"📋 <b>Target Channels:</b> {channel_count}\n"
             channel_list = f"┣ {', '.join(channel_names)}\n\n" if channel_names else ""
-            message_content = f"<blockquote>{html.escape(message)}</blockquote>"
+            message_content = f"<blockquote>{html_escape(message)}</blockquote>"
             
             return header + channel_info + channel_list + message_content
             
         except Exception as e:
             logger.error(f"❌ Error formatting broadcast message: {e}")
-            return f"📢 <b>Broadcast Message</b>\n\n<blockquote>{html.escape(message)}</blockquote>"
+            return f"📢 <b>Broadcast Message</b>\n\n<blockquote>{html_escape(message)}</blockquote>"
     
     def format_channel_list(self, channels: List[Dict[str, Any]]) -> str:
         """Format channel list"""
@@ -46,7 +113,7 @@ class MessageFormatter:
             message = f"📋 <b>Your Channels ({len(channels)})</b>\n\n"
             
             for i, channel in enumerate(channels[:10], 1):  # Limit to 10 for display
-                name = html.escape(channel.get("channel_name", "Unknown"))
+                name = html_escape(channel.get("channel_name", "Unknown"))
                 username = channel.get("username", "")
                 status = "✅" if channel.get("is_active", True) else "❌"
                 
@@ -122,19 +189,8 @@ class MessageFormatter:
             if not text:
                 return text
             
-            # Convert markdown to HTML
-            conversions = {
-                r'\*\*(.*?)\*\*': r'<b>\1</b>',
-                r'\*(.*?)\*': r'<i>\1</i>',
-                r'`(.*?)`': r'<code>\1</code>',
-                r'```(.*?)```': r'<pre>\1</pre>',
-                r'\[([^\]]+)\]\(([^)]+)\)': r'<a href="\2">\1</a>'
-            }
-            
-            for pattern, replacement in conversions.items():
-                text = re.sub(pattern, replacement, text, flags=re.DOTALL)
-            
-            return text
+            # Convert markdown to HTML in a single scan, cached per distinct text
+            return _render_markdown(text)
             
         except Exception as e:
             logger.error(f"❌ Error converting markdown to HTML: {e}")
@@ -147,18 +203,8 @@ class MessageFormatter:
                 return text
             
             # Convert HTML tags to markdown
-            conversions = {
-                r'<b>(.*?)</b>': r'**\1**',
-                r'<strong>(.*?)</strong>': r'**\1**',
-                r'<i>(.*?)</i>': r'*\1*',
-                r'<em>(.*?)</em>': r'*\1*',
-                r'<code>(.*?)</code>': r'`\1`',
-                r'<pre>(.*?)</pre>': r'```\1```',
-                r'<a href="([^"]+)">([^<]+)</a>': r'[\2](\1)'
-            }
-            
-            for pattern, replacement in conversions.items():
-                text = re.sub(pattern, replacement, text, flags=re.DOTALL)
+            for pattern, replacement in _HTML_CONVERSIONS:
+                text = pattern.sub(replacement, text)
             
             return text
             
@@ -173,13 +219,11 @@ class MessageFormatter:
                 return text
             
             # Remove potentially dangerous tags
-            dangerous_tags = ['script', 'iframe', 'object', 'embed', 'link', 'meta']
-            for tag in dangerous_tags:
-                text = re.sub(f'<{tag}[^>]*>.*?</{tag}>', '', text, flags=re.DOTALL | re.IGNORECASE)
-                text = re.sub(f'<{tag}[^>]*/?>', '', text, flags=re.IGNORECASE)
+            for pattern in _DANGEROUS_TAG_PATTERNS:
+                text = pattern.sub('', text)
             
             # Escape remaining HTML
-            text = html.escape(text)
+            text = html_escape(text)
             
             return text
             
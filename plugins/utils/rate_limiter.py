@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter
+Token buckets that keep Telegram API calls under the bot-wide and per-chat limits
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from config import MAX_RETRIES, TELEGRAM_GLOBAL_RATE, TELEGRAM_PER_CHAT_RATE
+
+logger = logging.getLogger(__name__)
+
+# Per-chat bucket count that triggers the first sweep for idle buckets
+_MIN_BUCKET_PRUNE_SIZE = 1024
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at refill_rate tokens per second"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens earned since the last update; caller holds the lock"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        self.updated = now
+
+    def is_full(self) -> bool:
+        """True once the bucket has refilled completely, i.e. it is as good as a new one"""
+        with self._lock:
+            self._refill()
+            return self.tokens >= self.capacity
+
+    def acquire(self, tokens: float = 1):
+        """Block until the requested tokens are available and take them"""
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait = (tokens - self.tokens) / self.refill_rate
+
+            time.sleep(wait)
+
+class RateLimiter:
+    """Bot-wide bucket combined with one bucket per chat"""
+
+    def __init__(self, global_rate: float, per_chat_limit: float, per_chat_period: float = 60):
+        self.global_bucket = TokenBucket(global_rate, global_rate)
+        self.per_chat_limit = per_chat_limit
+        self.per_chat_period = per_chat_period
+        self._chat_buckets: Dict[int, TokenBucket] = {}
+        self._prune_at = _MIN_BUCKET_PRUNE_SIZE
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        """Get or create the bucket for a chat"""
+        with self._lock:
+            bucket = self._chat_buckets.get(chat_id)
+            if bucket is None:
+                if len(self._chat_buckets) >= self._prune_at:
+                    self._prune_chat_buckets()
+                bucket = TokenBucket(self.per_chat_limit, self.per_chat_limit / self.per_chat_period)
+                self._chat_buckets[chat_id] = bucket
+            return bucket
+
+    def _prune_chat_buckets(self):
+        """Drop buckets that have fully refilled; caller holds the lock"""
+        # A full bucket behaves exactly like a fresh one, so dropping it loses nothing
+        self._chat_buckets = {chat_id: bucket for chat_id, bucket in self._chat_buckets.items() if not bucket.is_full()}
+        # Sweep again only after the map doubles, keeping creation amortised O(1)
+        self._prune_at = max(_MIN_BUCKET_PRUNE_SIZE, 2 * len(self._chat_buckets))
+
+    def pause(self, seconds: float):
+        """Hold every sender for seconds, e.g. after Telegram returns retry_after"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _wait_for_resume(self):
+        """Sleep while a flood-control pause is in effect"""
+        while True:
+            remaining = self._paused_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def acquire(self, chat_id: Optional[int] = None):
+        """Wait for a send slot, for a specific chat when chat_id is given"""
+        self._wait_for_resume()
+        # Take the per-chat token first so a throttled chat does not hold global capacity
+        if chat_id is not None:
+            self._chat_bucket(chat_id).acquire()
+        self.global_bucket.acquire()
+
+    @staticmethod
+    def retry_after(error) -> Optional[float]:
+        """Seconds Telegram asked us to wait, or None if error is not a 429"""
+        if getattr(error, "error_code", None) != 429:
+            return None
+        return (getattr(error, "result_json", None) or {}).get("parameters", {}).get("retry_after", 1)
+
+    def call(self, method: Callable, *args, per_chat: Optional[int] = None,
+             attempts: int = MAX_RETRIES, **kwargs) -> Any:
+        """Run a Bot API call under the limiter, retrying after Telegram's retry_after on 429"""
+        for attempt in range(attempts):
+            self.acquire(per_chat)
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                retry_after = self.retry_after(e)
+                # A best-effort call that is giving up should not stall every other sender
+                if retry_after is None or attempt == attempts - 1:
+                    raise
+                # The pause holds every sender, and the next acquire sleeps it out
+                logger.warning(f"⏳ Flood control on {getattr(method, '__name__', method)}, retrying in {retry_after}s")
+                self.pause(retry_after)
+
+# Shared limiter for every Telegram send made by the bot
+telegram_rate_limiter = RateLimiter(TELEGRAM_GLOBAL_RATE, TELEGRAM_PER_CHAT_RATE)
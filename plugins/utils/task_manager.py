@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Task Manager
+Tracks background threads so they can be stopped together on shutdown
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Executor, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+from config import TIMER_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# Rebuild the timer heap once cancelled calls make up more than half of it
+_MIN_TIMER_COMPACT_SIZE = 100
+
+def bounded_as_completed(executor: Executor, fn: Callable, items: Iterable,
+                         max_in_flight: int) -> Iterator[Tuple[Any, Any]]:
+    """Yield (item, future) as fn(item) calls finish, never queuing more than max_in_flight"""
+    items = iter(items)
+    pending = {}
+
+    try:
+        while True:
+            # Top the window up; the producer only runs ahead by max_in_flight
+            for item in itertools.islice(items, max_in_flight - len(pending)):
+                pending[executor.submit(fn, item)] = item
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+    finally:
+        # Closing the generator early drops work that has not started yet
+        for future in pending:
+            future.cancel()
+
+class TimerHandle:
+    """A delayed call queued by TaskManager.call_later"""
+
+    __slots__ = ("target", "args", "kwargs", "name", "cancelled", "_manager")
+
+    def __init__(self, target: Callable, args: tuple, kwargs: dict, name: str = None, manager=None):
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+        self.name = name
+        self.cancelled = False
+        self._manager = manager
+
+    def cancel(self):
+        """Skip the call if it has not started; drops its arguments right away"""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self.args = ()
+        self.kwargs = {}
+        if self._manager is not None:
+            self._manager._timer_cancelled()
+
+class TaskManager:
+    """Lifecycle manager for background worker threads"""
+
+    def __init__(self):
+        self.threads: List[threading.Thread] = []
+        self.stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+        # Delayed calls share one timer thread instead of a thread each
+        self._timers = []  # heap of (due, seq, TimerHandle)
+        self._timer_seq = itertools.count()
+        self._timer_cond = threading.Condition()
+        self._timer_thread = None
+        self._timer_pool = None  # runs due calls so each one does not pay for a new thread
+        self._cancelled_timers = 0  # cancelled handles still sitting in the heap
+
+    def spawn(self, target: Callable, *args, name: str = None, **kwargs) -> threading.Thread:
+        """Start a daemon thread and keep track of it"""
+        thread = threading.Thread(target=target, args=args, kwargs=kwargs, name=name, daemon=True)
+        thread.start()
+
+        with self._lock:
+            # Forget finished threads so the list does not grow forever
+            self.threads = [t for t in self.threads if t.is_alive()]
+            self.threads.append(thread)
+
+        return thread
+
+    def call_later(self, delay: float, target: Callable, *args, name: str = None, **kwargs) -> TimerHandle:
+        """Run target on the shared timer pool once delay seconds have passed"""
+        handle = TimerHandle(target, args, kwargs, name, manager=self)
+
+        with self._timer_cond:
+            due = time.monotonic() + delay
+            heapq.heappush(self._timers, (due, next(self._timer_seq), handle))
+
+            if self._timer_thread is None:
+                self._timer_pool = ThreadPoolExecutor(max_workers=TIMER_WORKERS, thread_name_prefix="task-timer")
+                self._timer_thread = threading.Thread(target=self._run_timers, name="task-timers", daemon=True)
+                self._timer_thread.start()
+
+            # Wake the timer thread in case this call is now the earliest
+            self._timer_cond.notify()
+
+        return handle
+
+    def _run_timers(self):
+        """Sleep until the earliest delayed call is due and hand it to the timer pool"""
+        while True:
+            with self._timer_cond:
+                while not self.stop_event.is_set():
+                    now = time.monotonic()
+                    if self._timers and self._timers[0][0] <= now:
+                        break
+                    self._timer_cond.wait(self._timers[0][0] - now if self._timers else None)
+
+                if self.stop_event.is_set():
+                    return
+
+                _, _, handle = heapq.heappop(self._timers)
+                handle._manager = None  # out of the heap, so later cancels are not counted
+
+                # Cancelled calls stay in the heap until due or compacted, and are dropped here
+                if handle.cancelled:
+                    self._cancelled_timers -= 1
+                    continue
+
+            try:
+                self._timer_pool.submit(self._run_handle, handle)
+            except Exception as e:
+                logger.error(f"❌ Error starting delayed task {handle.name or handle.target}: {e}")
+
+    def _timer_cancelled(self):
+        """Count a cancellation and drop dead entries once they dominate the heap"""
+        with self._timer_cond:
+            self._cancelled_timers += 1
+            if (len(self._timers) >= _MIN_TIMER_COMPACT_SIZE
+                    and self._cancelled_timers * 2 > len(self._timers)):
+                # Week-long auto deletes that were stopped would otherwise linger until due
+                self._timers = [entry for entry in self._timers if not entry[2].cancelled]
+                heapq.heapify(self._timers)
+                self._cancelled_timers = 0
+
+    def _run_handle(self, handle: TimerHandle):
+        """Invoke a due call on a pool thread, logging instead of losing its error"""
+        if handle.cancelled or self.stop_event.is_set():
+            return
+        try:
+            handle.target(*handle.args, **handle.kwargs)
+        except Exception as e:
+            logger.error(f"❌ Error in delayed task {handle.name or handle.target}: {e}")
+
+    def stop(self, timeout: float = 5.0):
+        """Signal all tasks to stop and wait for them up to timeout seconds"""
+        self.stop_event.set()
+
+        # Release the timer thread; pending delayed calls are dropped
+        with self._timer_cond:
+            self._timers.clear()
+            self._cancelled_timers = 0
+            self._timer_cond.notify_all()
+            timer_pool = self._timer_pool
+
+        if timer_pool is not None:
+            timer_pool.shutdown(wait=False, cancel_futures=True)
+
+        with self._lock:
+            threads = list(self.threads)
+
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            if thread is threading.current_thread():
+                continue
+            thread.join(max(deadline - time.monotonic(), 0))
+
+        still_running = [t.name for t in threads if t.is_alive()]
+        if still_running:
+            logger.warning(f"⚠️ Background tasks still running at shutdown: {', '.join(still_running)}")
+        else:
+            logger.info("✅ All background tasks stopped")
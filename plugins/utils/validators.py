@@ -11,6 +11,15 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import instead of looked up on every call
+_USERNAME_RE = re.compile(r'^@[a-zA-Z0-9_]{5,32}$')
+_TELEGRAM_LINK_RE = re.compile(r'^(?:https?://t\.me/|@|t\.me/|https?://telegram\.me/)[a-zA-Z0-9_]+$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_BROADCAST_ID_RE = re.compile(r'^broadcast_\d+_\d+$')
+_METRIC_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
 class Validators:
     """Enhanced validation functions for all inputs"""
     
@@ -40,8 +49,7 @@ class Validators:
             return False
         
         # Username should start with @ and contain only alphanumeric characters and underscores
-        pattern = r'^@[a-zA-Z0-9_]{5,32}$'
-        return bool(re.match(pattern, username))
+        return bool(_USERNAME_RE.match(username))
     
     @staticmethod
     def is_valid_telegram_link(link: str) -> bool:
@@ -49,14 +57,8 @@ class Validators:
         if not link or not isinstance(link, str):
             return False
         
-        patterns = [
-            r'^https?://t\.me/[a-zA-Z0-9_]+$',
-            r'^@[a-zA-Z0-9_]+$',
-            r'^t\.me/[a-zA-Z0-9_]+$',
-            r'^https?://telegram\.me/[a-zA-Z0-9_]+$'
-        ]
-        
-        return any(re.match(pattern, link.strip()) for pattern in patterns)
+        # t.me / telegram.me URLs, bare t.me links and @usernames in one pattern
+        return bool(_TELEGRAM_LINK_RE.match(link.strip()))
     
     @staticmethod
     def is_valid_time_input(time_input: Union[int, str]) -> bool:
@@ -92,8 +94,7 @@ class Validators:
         if not email or not isinstance(email, str):
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.match(email))
     
     @staticmethod
     def is_valid_phone_number(phone: str) -> bool:
@@ -102,7 +103,7 @@ class Validators:
             return False
         
         # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = _NON_DIGIT_RE.sub('', phone)
         
         # Check if it's a valid length (7-15 digits)
         return 7 <= len(digits_only) <= 15
@@ -142,8 +143,7 @@ class Validators:
             return False
         
         # Broadcast ID should follow pattern: broadcast_userid_timestamp
-        pattern = r'^broadcast_\d+_\d+$'
-        return bool(re.match(pattern, broadcast_id))
+        return bool(_BROADCAST_ID_RE.match(broadcast_id))
     
     @staticmethod
     def is_valid_analytics_metric(metric: str) -> bool:
@@ -152,8 +152,7 @@ class Validators:
             return False
         
         # Metric should contain only alphanumeric characters and underscores
-        pattern = r'^[a-zA-Z0-9_]+$'
-        return bool(re.match(pattern, metric))
+        return bool(_METRIC_RE.match(metric))
     
     @staticmethod
     def is_valid_message_text(text: str, max_length: int = 4096) -> bool:
@@ -256,7 +255,7 @@ class Validators:
             return ""
         
         # Remove control characters except newlines and tabs
-        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        sanitized = _CONTROL_CHARS_RE.sub('', text)
         
         # Trim whitespace
         sanitized = sanitized.strip()